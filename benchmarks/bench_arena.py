@@ -0,0 +1,85 @@
+"""Benchmark Argon2id first-run and repeated-run latency: malloc vs Argon2Arena.
+
+Every method runs in fresh interpreters so the first derivation really is
+the first. The first run of each process is reported separately from the
+repeated runs that follow it.
+
+Usage:
+    python benchmarks/bench_arena.py [--scheme V1] [--test] [--processes P] [--runs R]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+ROOT_PHRASE = "correct horse battery staple lunar orbit quiet meadow copper kettle violet harbor"
+
+METHODS = ("malloc", "arena")
+
+
+def worker(method, scheme, test_mode, runs):
+    """Derive ``runs`` times in this process; return seconds per run."""
+    from vaultphrases.arena import Argon2Arena
+    from vaultphrases.derive import derive_master_key
+    from vaultphrases.security import SecureBuffer
+
+    arena = Argon2Arena() if method == "arena" else None
+    timings = []
+    with SecureBuffer(32) as key:
+        for _ in range(runs):
+            start = time.perf_counter()
+            derive_master_key(ROOT_PHRASE, test_mode=test_mode, scheme=scheme, out=key, arena=arena)
+            timings.append(time.perf_counter() - start)
+    if arena is not None:
+        arena.close()
+    return timings
+
+
+def run_process(method, args):
+    """Run one fresh worker process and return its timings."""
+    command = [sys.executable, __file__, "--worker", method, "--scheme", args.scheme, "--runs", str(args.runs)]
+    if args.test:
+        command.append("--test")
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scheme", default="V1", help="derivation scheme (default: V1)")
+    parser.add_argument("--test", action="store_true", help="use the fast test parameters")
+    parser.add_argument("--processes", type=int, default=3, help="fresh processes per method (default: 3)")
+    parser.add_argument("--runs", type=int, default=5, help="derivations per process (default: 5)")
+    parser.add_argument("--worker", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.scheme, args.test, args.runs)))
+        return 0
+
+    results = {}
+    for method in METHODS:
+        processes = [run_process(method, args) for _ in range(args.processes)]
+        first = [timings[0] for timings in processes]
+        repeated = [t for timings in processes for t in timings[1:]]
+        results[method] = (statistics.median(first), statistics.median(repeated) if repeated else float("nan"))
+
+    print(f"scheme {args.scheme}{' (test params)' if args.test else ''}, "
+          f"{args.processes} processes x {args.runs} runs")
+    print(f"{'':8} {'first run':>12} {'repeated':>12}")
+    for method, (first, repeated) in results.items():
+        print(f"{method:8} {first * 1000:9.1f} ms {repeated * 1000:9.1f} ms")
+    (m_first, m_rep), (a_first, a_rep) = results["malloc"], results["arena"]
+    print(f"{'speedup':8} {m_first / a_first:10.2f}x  {m_rep / a_rep:10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
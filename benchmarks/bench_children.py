@@ -0,0 +1,45 @@
+"""Benchmark per-label child derivation: hkdf_child vs derive_children.
+
+Usage:
+    python benchmarks/bench_children.py [--labels N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from vaultphrases.derive import derive_children, hkdf_child  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--labels", type=int, default=10000, help="labels per run (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per method, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    master_key = os.urandom(32)
+    labels = [f"label-{i:06d}" for i in range(args.labels)]
+
+    def per_label():
+        return [hkdf_child(master_key, label) for label in labels]
+
+    def batch():
+        return derive_children(master_key, labels)
+
+    assert per_label() == batch(), "derive_children output differs from hkdf_child"
+
+    t_single = min(timeit.repeat(per_label, number=1, repeat=args.repeat))
+    t_batch = min(timeit.repeat(batch, number=1, repeat=args.repeat))
+
+    print(f"labels:          {args.labels}")
+    print(f"hkdf_child:      {t_single / args.labels * 1e6:8.3f} µs/label")
+    print(f"derive_children: {t_batch / args.labels * 1e6:8.3f} µs/label")
+    print(f"speedup:         {t_single / t_batch:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
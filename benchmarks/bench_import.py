@@ -0,0 +1,114 @@
+"""Import-time budget for the trivial CLI paths (--version, --help, errors).
+
+Runs each path in a fresh interpreter under ``python -X importtime`` and
+sums the cumulative import time of everything loaded from the first
+``vaultphrases`` import on. A path fails the gate if its best run exceeds
+the budget or if it loads a module that only derivation needs.
+
+Usage:
+    # Print results and gate against the default budget
+    python benchmarks/bench_import.py
+
+    # Tighter budget, more runs
+    python benchmarks/bench_import.py --budget-ms 25 --repeat 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# name -> CLI arguments
+PATHS = {
+    "import": None,
+    "version": ["--version"],
+    "help": ["--help"],
+    "bad_argument": ["--no-such-flag"],
+}
+
+# Modules the trivial paths must never load
+HEAVY_MODULES = ("argon2", "_cffi_backend", "ctypes", "hashlib", "_hashlib", "vaultphrases.derive")
+
+DEFAULT_BUDGET_MS = 40.0
+
+SNIPPET = """
+import sys
+argv = {argv!r}
+from vaultphrases.cli import main
+if argv is not None:
+    sys.argv = ["vaultphrases"] + argv
+    try:
+        main()
+    except SystemExit:
+        pass
+print({marker!r} + ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+MARKER = "heavy-modules:"
+
+
+def parse_importtime(stderr):
+    """Sum top-level cumulative microseconds from the first vaultphrases import on."""
+    total = 0
+    started = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not started and not name.strip().startswith("vaultphrases"):
+            continue
+        started = True
+        # Nested imports are indented by two spaces per level under their parent
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def run_path(argv):
+    """Run one CLI path in a fresh interpreter; return (import µs, heavy modules)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])))
+    code = SNIPPET.format(argv=argv, marker=MARKER, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    heavy = result.stdout.rsplit(MARKER, 1)[1].strip()
+    return parse_importtime(result.stderr), [m for m in heavy.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per path, best is reported (default: 5)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"import-time budget per path in ms (default: {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument("--output", metavar="FILE", help="write JSON results to FILE")
+    args = parser.parse_args()
+
+    results = {}
+    failures = []
+    for name, argv in PATHS.items():
+        runs = [run_path(argv) for _ in range(args.repeat)]
+        best_ms = min(us for us, _ in runs) / 1000
+        heavy = runs[0][1]
+        results[name] = {"import_ms": round(best_ms, 2), "heavy_modules": heavy}
+        print(f"{name:<14} {best_ms:8.2f} ms  {'heavy: ' + ', '.join(heavy) if heavy else ''}")
+        if best_ms > args.budget_ms:
+            failures.append(f"{name}: {best_ms:.2f} ms over the {args.budget_ms:.0f} ms budget")
+        if heavy:
+            failures.append(f"{name}: loads {', '.join(heavy)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"budget_ms": args.budget_ms, "results": results}, f, indent=2)
+            f.write("\n")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
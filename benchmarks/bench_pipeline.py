@@ -0,0 +1,284 @@
+"""Microbenchmarks for every derivation pipeline stage, with regression gates.
+
+Measures normalise_phrase (str and in-buffer), derive_master_key (test and production params),
+hkdf_child, bytes_to_phrase, load_wordlist (text and compiled) and
+fingerprint_wordlist on the EFF short and large wordlist sizes plus a
+synthetic 1M-word list, and emits the results as JSON.
+
+Usage:
+    # Print results
+    python benchmarks/bench_pipeline.py
+
+    # Gate against the stored baseline (exit 1 on regression)
+    python benchmarks/bench_pipeline.py --baseline benchmarks/baseline.json
+
+    # Refresh the baseline on the reference machine
+    python benchmarks/bench_pipeline.py --save-baseline benchmarks/baseline.json
+
+Real EFF files are used when --eff-dir contains them; otherwise files of
+the same size and format are generated.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from vaultphrases.constants import LABEL_HOT  # noqa: E402
+from vaultphrases.derive import derive_master_key, hkdf_child  # noqa: E402
+from vaultphrases.utils import max_normalised_length, normalise_phrase, normalise_phrase_into  # noqa: E402
+from vaultphrases.wordlist import bytes_to_phrase, compile_wordlist, fingerprint_wordlist, load_wordlist  # noqa: E402
+
+ROOT_PHRASE = "  Correct Horse  Battery Staple Lunar Orbit Quiet Meadow Copper Kettle Violet Harbor  "
+
+# name -> (EFF file name, dice digits, word count)
+WORDLISTS = {
+    "eff_short": ("eff_short_wordlist_1.txt", 4, 1296),
+    "eff_large": ("eff_large_wordlist.txt", 5, 7776),
+    "synthetic_1m": (None, 0, 1000000),
+}
+
+DEFAULT_TOLERANCE = 0.50
+
+# Wordlist loading reads files, so page cache and disk noise make it
+# swing more than the CPU-bound stages; it gets a wider tolerance
+IO_STAGES = ("load_wordlist[", "load_compiled[")
+DEFAULT_IO_TOLERANCE = 1.00
+
+# Stages over tolerance are re-timed this many times; the best run counts
+DEFAULT_RETRIES = 2
+
+
+def write_synthetic_wordlist(path, digits, count):
+    """Write a wordlist in EFF format (dice number, tab, word)."""
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        if digits:
+            dice = ("".join(c) for c in itertools.product("123456", repeat=digits))
+            for n, roll in zip(range(count), dice):
+                f.write(f"{roll}\tword{n:07d}\n")
+        else:
+            for n in range(count):
+                f.write(f"{n + 1}\tword{n:07d}\n")
+
+
+def prepare_wordlists(eff_dir, tmp_dir):
+    """Return {name: path}, using real EFF files where available."""
+    paths = {}
+    for name, (filename, digits, count) in WORDLISTS.items():
+        if eff_dir and filename and os.path.isfile(os.path.join(eff_dir, filename)):
+            paths[name] = os.path.join(eff_dir, filename)
+            continue
+        path = os.path.join(tmp_dir, f"{name}.txt")
+        write_synthetic_wordlist(path, digits, count)
+        paths[name] = path
+    return paths
+
+
+# Fast stages are timed in batches lasting at least this long, so that
+# timer resolution and scheduler hiccups stay well inside the tolerance
+MIN_SAMPLE_S = 0.05
+
+
+def reference_workload():
+    """Fixed pure-Python work timed next to every stage to track machine speed."""
+    total = 0
+    for i in range(2000):
+        total += i * i
+    return total
+
+
+def calibrate(func):
+    """Return how many calls of ``func`` one timing sample needs."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= MIN_SAMPLE_S:
+            return number
+        number *= 2
+
+
+def time_calls(func, number):
+    """Seconds per call of ``func`` over ``number`` calls."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+_reference_number = None
+
+
+def measure(func, repeat, number=None):
+    """
+    Time ``func`` and return per-call statistics in seconds.
+
+    With ``number=None`` the call count per sample is calibrated so each
+    sample lasts at least MIN_SAMPLE_S; pass 1 for stages that already do.
+    Each sample is preceded by one of reference_workload(), whose best
+    time is reported as ``reference_s``: shared machines drift by 1.5x or
+    more over tens of seconds, and compare() divides that drift out.
+    """
+    global _reference_number
+    if _reference_number is None:
+        _reference_number = calibrate(reference_workload)
+    if number is None:
+        number = calibrate(func)
+    samples = []
+    references = []
+    for _ in range(repeat):
+        references.append(time_calls(reference_workload, _reference_number))
+        samples.append(time_calls(func, number))
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "reference_s": min(references),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def collect_stages(args, wordlists):
+    """Return {stage: (func, repeat, number)} for every stage to time."""
+    stages = {}
+    quick = args.quick
+
+    stages["normalise_phrase"] = (lambda: normalise_phrase(ROOT_PHRASE), 9, None)
+    phrase_buffer = bytearray(max_normalised_length(ROOT_PHRASE))
+    stages["normalise_phrase_into"] = (lambda: normalise_phrase_into(ROOT_PHRASE, phrase_buffer), 9, None)
+    stages["derive_master_key[test]"] = (
+        lambda: derive_master_key(ROOT_PHRASE, test_mode=True), 3 if quick else 7, 1
+    )
+    if not args.skip_prod:
+        stages["derive_master_key[prod]"] = (
+            lambda: derive_master_key(ROOT_PHRASE, test_mode=False), 1 if quick else 3, 1
+        )
+
+    master_key = derive_master_key(ROOT_PHRASE, test_mode=True)
+    child = hkdf_child(master_key, LABEL_HOT)
+    stages["hkdf_child"] = (lambda: hkdf_child(master_key, LABEL_HOT), 9, None)
+
+    for name, path in wordlists.items():
+        heavy = WORDLISTS[name][2] >= 100000
+        # Best of 3 even in quick mode: a single sample made the gate flaky
+        repeat = 3 if heavy else 7
+        number = 1 if heavy else None
+        words = load_wordlist(path)
+        compiled_path = compile_wordlist(path, path + ".vpwl")
+        # Default arguments bind this iteration's path and words
+        stages[f"load_wordlist[{name}]"] = (lambda path=path: load_wordlist(path), repeat, number)
+        stages[f"fingerprint_wordlist[{name}]"] = (lambda words=words: fingerprint_wordlist(words), repeat, number)
+        stages[f"bytes_to_phrase[{name}]"] = (lambda words=words: bytes_to_phrase(child, words, 6), 9, None)
+        stages[f"load_compiled[{name}]"] = (lambda path=compiled_path: load_wordlist(path).close(), 9, None)
+
+    return stages
+
+
+def run_benchmarks(stages, names=None):
+    """Time the named stages (default: all) and return {stage: stats}."""
+    return {
+        name: measure(func, repeat, number)
+        for name, (func, repeat, number) in stages.items()
+        if names is None or name in names
+    }
+
+
+def compare(results, baseline, tolerance, io_tolerance=DEFAULT_IO_TOLERANCE):
+    """Return {stage: regression message} (empty if none), including stages missing from the baseline."""
+    regressions = {}
+    for stage, stats in sorted(results.items()):
+        base = baseline.get("results", {}).get(stage)
+        if base is None:
+            # A new stage must come with a refreshed baseline, or it is never gated
+            regressions[stage] = f"{stage}: not in the baseline (refresh it with --save-baseline)"
+            continue
+        allowed = io_tolerance if stage.startswith(IO_STAGES) else tolerance
+        # How much slower the machine is now than when the baseline was taken
+        drift = stats["reference_s"] / base["reference_s"] if "reference_s" in base else 1.0
+        # Best-of-N is far less sensitive to scheduler noise than the median
+        ratio = stats["min_s"] / base["min_s"] / drift
+        if ratio > 1 + allowed:
+            regressions[stage] = (
+                f"{stage}: {stats['min_s'] * 1e6:.1f} µs vs baseline "
+                f"{base['min_s'] * 1e6:.1f} µs ({ratio:.2f}x after machine drift of {drift:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--eff-dir", metavar="DIR", help="directory containing the real EFF wordlist files")
+    parser.add_argument("--skip-prod", action="store_true", help="skip the production-parameter Argon2 stage")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats for the slow stages")
+    parser.add_argument("--output", metavar="FILE", help="write JSON results to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against a stored baseline")
+    parser.add_argument("--save-baseline", metavar="FILE", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed best-of-N slowdown before failing (default: {DEFAULT_TOLERANCE:.2f})")
+    parser.add_argument("--io-tolerance", type=float, default=DEFAULT_IO_TOLERANCE,
+                        help=f"allowed slowdown for the wordlist loading stages (default: {DEFAULT_IO_TOLERANCE:.2f})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help=f"times to re-time a stage over tolerance before failing (default: {DEFAULT_RETRIES})")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        wordlists = prepare_wordlists(args.eff_dir, tmp_dir)
+        stages = collect_stages(args, wordlists)
+        results = run_benchmarks(stages)
+
+        regressions = {}
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+            regressions = compare(results, baseline, args.tolerance, args.io_tolerance)
+            for _ in range(args.retries):
+                # A slow patch on a shared machine can cover every sample of
+                # one stage; a real regression survives being timed again
+                suspects = set(regressions) & set(baseline.get("results", {}))
+                if not suspects:
+                    break
+                for name, stats in run_benchmarks(stages, suspects).items():
+                    if stats["min_s"] < results[name]["min_s"]:
+                        results[name] = stats
+                regressions = compare(results, baseline, args.tolerance, args.io_tolerance)
+
+    report = {
+        "machine": {
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(text + "\n")
+    if not args.output and not args.save_baseline:
+        print(text)
+
+    if args.baseline:
+        if regressions:
+            print("\nPerformance regressions:", file=sys.stderr)
+            for line in regressions.values():
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.baseline} "
+              f"(tolerance +{args.tolerance:.0%}, wordlist loading +{args.io_tolerance:.0%})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+"""Derivation agent: holds the master key behind a Unix domain socket.
+
+Like ssh-agent, the agent pays the Argon2id cost once and then answers
+child-phrase requests from the same user until it is idle for longer than
+its TTL, at which point the master key is zeroized and the agent exits.
+
+Protocol: one JSON object per line in each direction, one request per
+connection. Requests carry an ``op`` field:
+
+- ``ping``: report agent mode (``test``, ``scheme``), wordlist fingerprint and TTL
+- ``phrase``: derive ``label`` and render it with ``words`` / ``delimiter``
+- ``lock``: zeroize the master key and shut the agent down
+"""
+
+import json
+import os
+import socket
+import stat
+import struct
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from .constants import DEFAULT_AGENT_TTL, DEFAULT_DELIMITER, MAX_WORD_COUNT, SCHEME_VERSION
+from .derive import ChildKeyStream
+from .security import SecureBuffer
+from .wordlist import blocks_to_phrase
+
+# Environment variable overriding the agent socket location
+AGENT_SOCKET_ENV = "VAULTPHRASES_AGENT_SOCK"
+
+# Upper bound on a single request line
+MAX_REQUEST_SIZE = 4096
+
+
+class AgentError(Exception):
+    """Raised when the agent cannot be reached or rejects a request."""
+    pass
+
+
+def default_socket_path() -> str:
+    """
+    Get the agent socket path.
+
+    Uses ``$VAULTPHRASES_AGENT_SOCK`` if set, otherwise a per-user path in
+    ``$XDG_RUNTIME_DIR`` or the system temp directory. The directory is
+    checked when the agent binds (see ``ensure_private_dir``), since the
+    temp-directory fallback is predictable.
+
+    Returns:
+        Absolute path of the agent socket
+    """
+    override = os.environ.get(AGENT_SOCKET_ENV)
+    if override:
+        return override
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "vaultphrases", "agent.sock")
+    return os.path.join("/tmp", f"vaultphrases-{os.getuid()}", "agent.sock")
+
+
+def _peer_uid(conn: socket.socket) -> Optional[int]:
+    """Return the uid of the connected peer, if the platform exposes it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid
+
+
+def _socket_uid(sock: socket.socket, path: str) -> int:
+    """Return the uid of the peer, or of the socket file where peer credentials are unavailable."""
+    uid = _peer_uid(sock)
+    return os.lstat(path).st_uid if uid is None else uid
+
+
+def ensure_private_dir(directory: str) -> None:
+    """
+    Create ``directory`` mode 0700, or check that an existing one is private.
+
+    Args:
+        directory: Directory that will hold the agent socket
+
+    Raises:
+        AgentError: If the path is not a real directory owned by the current
+            user with no group or other permissions
+    """
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        st = os.lstat(directory)
+    except OSError as e:
+        raise AgentError(f"Cannot create agent directory {directory}: {e}")
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+        raise AgentError(f"Agent directory {directory} is not a directory owned by you")
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        raise AgentError(f"Agent directory {directory} is accessible to other users (mode {stat.S_IMODE(st.st_mode):04o})")
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    """Read one newline-terminated message, bounded by MAX_REQUEST_SIZE."""
+    data = b""
+    while b"\n" not in data:
+        chunk = conn.recv(MAX_REQUEST_SIZE)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_REQUEST_SIZE:
+            raise AgentError("Request too large")
+    return data.split(b"\n", 1)[0]
+
+
+class AgentServer:
+    """
+    Serve child phrases from a master key held in memory.
+
+    The master key is copied into a private, locked ``SecureBuffer`` that
+    is zeroized when the agent stops, whether by idle expiry, a ``lock`` request or
+    ``close()``.
+    """
+
+    def __init__(
+        self,
+        master_key: Union[bytes, SecureBuffer],
+        words: List[str],
+        wordlist_fp: str,
+        test_mode: bool = False,
+        socket_path: Optional[str] = None,
+        idle_ttl: float = DEFAULT_AGENT_TTL,
+        scheme: str = SCHEME_VERSION,
+    ):
+        self._master_key = SecureBuffer.from_bytes(
+            master_key.view if isinstance(master_key, SecureBuffer) else master_key
+        )
+        self.words = words
+        self.wordlist_fp = wordlist_fp
+        self.test_mode = test_mode
+        self.scheme = scheme
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_ttl = idle_ttl
+        self._sock: Optional[socket.socket] = None
+        self._deadline = 0.0
+        self._running = False
+
+    def bind(self) -> None:
+        """Create the listening socket, readable only by the current user."""
+        ensure_private_dir(os.path.dirname(os.path.abspath(self.socket_path)))
+
+        # Refuse to hijack a live agent; clear a stale socket file
+        if os.path.exists(self.socket_path):
+            try:
+                request({"op": "ping"}, self.socket_path)
+            except AgentError:
+                os.unlink(self.socket_path)
+            else:
+                raise AgentError(f"An agent is already running at {self.socket_path}")
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            sock.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        sock.listen(8)
+        self._sock = sock
+
+    def serve_forever(self) -> None:
+        """Answer requests until idle expiry or a ``lock`` request."""
+        if self._sock is None:
+            self.bind()
+
+        sock = self._sock
+        self._running = True
+        self._deadline = time.monotonic() + self.idle_ttl
+        try:
+            while self._running:
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    sock.settimeout(remaining)
+                    conn, _ = sock.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    # Socket shut down by close() on another thread
+                    if not self._running:
+                        break
+                    raise
+                with conn:
+                    self._handle(conn)
+        finally:
+            self.close()
+
+    def _handle(self, conn: socket.socket) -> None:
+        """Process a single request on an accepted connection."""
+        conn.settimeout(2.0)
+        try:
+            uid = _peer_uid(conn)
+            if uid is not None and uid != os.getuid():
+                response = {"ok": False, "error": "permission denied"}
+            else:
+                response = self.dispatch(json.loads(_read_line(conn).decode("utf-8")))
+                self._deadline = time.monotonic() + self.idle_ttl
+        except (ValueError, AgentError, OSError) as e:
+            response = {"ok": False, "error": str(e)}
+        try:
+            conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+    def dispatch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a decoded request.
+
+        Args:
+            req: Request object (see module docstring)
+
+        Returns:
+            Response object with an ``ok`` field
+        """
+        if not isinstance(req, dict):
+            return {"ok": False, "error": "invalid request"}
+        op = req.get("op")
+        if op == "ping":
+            return {
+                "ok": True,
+                "test": self.test_mode,
+                "scheme": self.scheme,
+                "wordlist": self.wordlist_fp,
+                "ttl": max(0, int(self._deadline - time.monotonic())),
+            }
+        if op == "lock":
+            self._running = False
+            return {"ok": True}
+        if op == "phrase":
+            if bool(req.get("test")) != self.test_mode:
+                return {"ok": False, "error": "test mode mismatch"}
+            if req.get("scheme", SCHEME_VERSION) != self.scheme:
+                return {"ok": False, "error": "scheme mismatch"}
+            if req.get("wordlist") != self.wordlist_fp:
+                return {"ok": False, "error": "wordlist mismatch"}
+            label = req.get("label")
+            word_count = req.get("words")
+            delimiter = req.get("delimiter", DEFAULT_DELIMITER)
+            if not isinstance(label, str) or not isinstance(delimiter, str):
+                return {"ok": False, "error": "invalid request"}
+            # type() rather than isinstance() so that JSON true is not a count
+            if type(word_count) is not int or not 1 <= word_count <= MAX_WORD_COUNT:
+                return {"ok": False, "error": f"words must be 1-{MAX_WORD_COUNT}"}
+
+            child = ChildKeyStream(self._master_key, label)
+            try:
+                phrase = blocks_to_phrase(child, self.words, word_count, delimiter)
+            finally:
+                child.clear()
+            return {"ok": True, "phrase": phrase}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    def close(self) -> None:
+        """Zeroize the master key and remove the socket."""
+        self._running = False
+        self._master_key.close()
+        if self._sock is not None:
+            try:
+                # Wake a serve_forever() blocked in accept() on another thread
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+
+def request(req: Dict[str, Any], socket_path: Optional[str] = None, timeout: float = 2.0) -> Dict[str, Any]:
+    """
+    Send one request to a running agent.
+
+    Args:
+        req: Request object (see module docstring)
+        socket_path: Agent socket (default: default_socket_path())
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Decoded response object
+
+    Raises:
+        AgentError: If no agent is reachable, the agent runs as another
+            user, or the response is malformed
+    """
+    path = socket_path or default_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            # Never trust an agent another user started in a shared directory
+            if _socket_uid(sock, path) != os.getuid():
+                raise AgentError(f"Agent at {path} belongs to another user")
+            sock.sendall(json.dumps(req).encode("utf-8") + b"\n")
+            return json.loads(_read_line(sock).decode("utf-8"))
+    except (OSError, ValueError) as e:
+        raise AgentError(f"Agent unavailable: {e}")
+
+
+def agent_phrase(
+    label: str,
+    word_count: int,
+    wordlist_fp: str,
+    test_mode: bool = False,
+    delimiter: str = DEFAULT_DELIMITER,
+    socket_path: Optional[str] = None,
+    scheme: str = SCHEME_VERSION,
+) -> Optional[str]:
+    """
+    Ask a running agent for a labelled passphrase.
+
+    Args:
+        label: Domain label to derive
+        word_count: Number of words in the phrase
+        wordlist_fp: Fingerprint of the caller's wordlist (must match the agent's)
+        test_mode: Whether the caller expects test-mode parameters
+        delimiter: String to join words with
+        socket_path: Agent socket (default: default_socket_path())
+        scheme: Derivation scheme the caller expects (default: V1)
+
+    Returns:
+        The passphrase, or None if no compatible agent is running
+    """
+    try:
+        response = request({
+            "op": "phrase",
+            "label": label,
+            "words": word_count,
+            "delimiter": delimiter,
+            "test": test_mode,
+            "scheme": scheme,
+            "wordlist": wordlist_fp,
+        }, socket_path)
+    except AgentError:
+        return None
+    if not response.get("ok"):
+        return None
+    return response.get("phrase")
@@ -0,0 +1,210 @@
+"""Asyncio counterparts of the derivation pipeline.
+
+Argon2 is a blocking C call that cannot be interrupted once started. These
+coroutines run it on daemon threads, bounded by one memory budget shared
+by every parameter set, so the event loop stays responsive and a
+cancelled or timed-out call returns immediately. An abandoned derivation
+finishes in the background and its result is wiped instead of delivered.
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .constants import DEFAULT_DELIMITER, DEFAULT_WORD_COUNT, SCHEME_VERSION
+from .batch import WORKER_OVERHEAD_KIB, available_memory_kib
+from .derive import ChildKeyStream, KeyedPRF, derive_master_key, scheme_params
+from .security import secure_clear_bytes
+from .wordlist import blocks_to_phrase
+
+
+class _MemoryBudget:
+    """
+    Memory-weighted limit on concurrent KDF calls.
+
+    Each call reserves its Argon2 memory cost plus the per-worker overhead
+    from one shared budget, so V1 and V2, test and production runs
+    together never oversubscribe it. At most ``max_running`` calls run at
+    once, and one call is always admitted even if it alone exceeds the
+    budget.
+    """
+
+    def __init__(self, budget_kib: int, max_running: int):
+        self._budget_kib = budget_kib
+        self._max_running = max_running
+        self._used_kib = 0
+        self._running = 0
+        self._changed = threading.Condition()
+
+    def _fits(self, weight: int) -> bool:
+        if self._running == 0:
+            return True
+        return self._running < self._max_running and self._used_kib + weight <= self._budget_kib
+
+    @contextmanager
+    def reserve(self, memory_cost: int) -> Iterator[None]:
+        """Block until ``memory_cost`` KiB fits in the budget, and hold it."""
+        weight = memory_cost + WORKER_OVERHEAD_KIB
+        with self._changed:
+            self._changed.wait_for(lambda: self._fits(weight))
+            self._used_kib += weight
+            self._running += 1
+        try:
+            yield
+        finally:
+            with self._changed:
+                self._used_kib -= weight
+                self._running -= 1
+                self._changed.notify_all()
+
+
+_kdf_budget: Optional[_MemoryBudget] = None
+_kdf_budget_lock = threading.Lock()
+
+
+def _get_kdf_budget() -> _MemoryBudget:
+    """Return the process-wide KDF memory budget, sized from available RAM."""
+    global _kdf_budget
+    with _kdf_budget_lock:
+        if _kdf_budget is None:
+            # Unknown RAM: the always-admitted call runs alone
+            _kdf_budget = _MemoryBudget(available_memory_kib() or 0, os.cpu_count() or 1)
+        return _kdf_budget
+
+
+def _deliver(future: "asyncio.Future[Any]", box: List[Any], error: Optional[BaseException]) -> None:
+    """
+    Hand a worker result to the awaiting coroutine, or wipe it if abandoned.
+
+    The result arrives as the only item of ``box`` so that, once popped,
+    this frame holds its sole reference and secure_clear_bytes() can wipe it.
+    """
+    result = box.pop()
+    if future.done():
+        if isinstance(result, (bytes, bytearray)):
+            secure_clear_bytes(result)
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+async def _run_off_loop(
+    func: Callable[..., Any],
+    *args: Any,
+    memory_cost: int,
+    timeout: Optional[float] = None,
+) -> Any:
+    """
+    Run a blocking call on a daemon thread and await its result.
+
+    The thread first reserves ``memory_cost`` KiB of the shared KDF budget.
+
+    Daemon threads are used (rather than an executor) so that an abandoned
+    Argon2 run never delays interpreter shutdown after Ctrl-C.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    abandoned = threading.Event()
+
+    def worker():
+        with _get_kdf_budget().reserve(memory_cost):
+            # Skip work whose caller already gave up while queued
+            if abandoned.is_set():
+                return
+            result, error = None, None
+            try:
+                result = func(*args)
+            except BaseException as e:
+                error = e
+        box = [result]
+        del result
+        try:
+            loop.call_soon_threadsafe(_deliver, future, box, error)
+        except RuntimeError:
+            # Event loop already closed
+            result = box.pop()
+            if isinstance(result, (bytes, bytearray)):
+                secure_clear_bytes(result)
+
+    threading.Thread(target=worker, name="vaultphrases-kdf", daemon=True).start()
+
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except BaseException:
+        abandoned.set()
+        raise
+
+
+async def derive_master_key_async(
+    root_phrase: str,
+    test_mode: bool = False,
+    timeout: Optional[float] = None,
+    scheme: str = SCHEME_VERSION,
+) -> bytes:
+    """
+    Derive the master key without blocking the event loop.
+
+    Args:
+        root_phrase: The user's root phrase (will be normalised)
+        test_mode: If True, use faster parameters for testing
+        timeout: Deadline in seconds (default: no deadline)
+        scheme: Derivation scheme (default: V1)
+
+    Returns:
+        32-byte master key
+
+    Raises:
+        asyncio.TimeoutError: If the deadline passes first
+        asyncio.CancelledError: If the awaiting task is cancelled
+    """
+    memory_cost = scheme_params(scheme, test_mode).memory_cost
+    return await _run_off_loop(
+        derive_master_key, root_phrase, test_mode, scheme, memory_cost=memory_cost, timeout=timeout
+    )
+
+
+async def derive_phrases_async(
+    root_phrase: str,
+    labels: Iterable[str],
+    words: List[str],
+    word_count: int = DEFAULT_WORD_COUNT,
+    delimiter: str = DEFAULT_DELIMITER,
+    test_mode: bool = False,
+    timeout: Optional[float] = None,
+    scheme: str = SCHEME_VERSION,
+) -> Dict[str, str]:
+    """
+    Derive passphrases for several labels from a root phrase.
+
+    Runs the master key derivation off-loop, then derives the children and
+    renders the phrases inline (they take microseconds).
+
+    Args:
+        root_phrase: The user's root phrase (will be normalised)
+        labels: Domain labels to derive
+        words: Wordlist to select from
+        word_count: Number of words per phrase
+        delimiter: String to join words with
+        test_mode: If True, use faster parameters for testing
+        timeout: Deadline in seconds for the master key (default: no deadline)
+        scheme: Derivation scheme (default: V1)
+
+    Returns:
+        Mapping of label to passphrase
+    """
+    labels = list(labels)
+    master_key = await derive_master_key_async(root_phrase, test_mode=test_mode, timeout=timeout, scheme=scheme)
+    try:
+        prf = KeyedPRF(master_key)
+        phrases = {}
+        for label in labels:
+            child = ChildKeyStream(prf, label)
+            phrases[label] = blocks_to_phrase(child, words, word_count, delimiter)
+            child.clear()
+        return phrases
+    finally:
+        secure_clear_bytes(master_key)
@@ -0,0 +1,151 @@
+"""Reusable, pre-faulted memory for Argon2's block matrix.
+
+By default argon2 mallocs the whole block matrix (256 MiB for V1) on every
+call, and the kernel faults it in one 4 KiB page at a time as the first
+pass writes it. An ``Argon2Arena`` hands argon2 one ``SecureBuffer``
+instead: locked, left out of core dumps, backed by transparent huge pages
+where the kernel allows it, and faulted in when it is mapped. The region
+is kept between derivations, so only the first one pays for the mapping.
+
+argon2 wipes the block matrix before handing it back (its
+``clear_internal_memory`` step), so the arena holds only zeros between
+uses; ``close()`` zeroes and unmaps it.
+
+Example:
+    >>> with Argon2Arena() as arena:
+    ...     for phrase in phrases:
+    ...         keys.append(derive_master_key(phrase, arena=arena))
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+from argon2 import low_level
+
+from .security import SecureBuffer
+
+# argon2 block size and synchronisation points per pass (argon2.h)
+ARGON2_BLOCK_SIZE = 1024
+ARGON2_SYNC_POINTS = 4
+
+
+def block_matrix_bytes(memory_cost: int, parallelism: int) -> int:
+    """
+    Size of the block matrix argon2 allocates for these parameters.
+
+    Args:
+        memory_cost: Memory cost in KiB
+        parallelism: Number of lanes
+
+    Returns:
+        Bytes requested from the allocator
+    """
+    blocks = max(memory_cost, 2 * ARGON2_SYNC_POINTS * parallelism)
+    segment_length = blocks // (parallelism * ARGON2_SYNC_POINTS)
+    return segment_length * parallelism * ARGON2_SYNC_POINTS * ARGON2_BLOCK_SIZE
+
+
+class Argon2Arena:
+    """
+    Memory region reused by argon2 across derivations.
+
+    The region grows to the largest block matrix requested and is never
+    shrunk until ``close()``. One derivation uses it at a time; a
+    concurrent derivation falls back to argon2's own allocator rather
+    than waiting.
+    """
+
+    def __init__(self, size: int = 0, huge_pages: bool = True):
+        """
+        Args:
+            size: Bytes to map up front (0: map on first use)
+            huge_pages: Advise transparent huge pages for the region
+        """
+        self._huge_pages = huge_pages
+        self._buffer: Optional[SecureBuffer] = None
+        self._lock = threading.Lock()
+        ffi = low_level.ffi
+
+        # Both callbacks run on the thread that called argon2
+        @ffi.callback("allocate_fptr")
+        def allocate(memory, size):
+            buffer = self._buffer
+            if buffer is None or buffer.closed or size > len(buffer):
+                memory[0] = ffi.NULL
+            else:
+                memory[0] = ffi.cast("uint8_t *", buffer.address)
+            return 0
+
+        @ffi.callback("deallocate_fptr")
+        def deallocate(memory, size):
+            # argon2 has already wiped the block matrix
+            pass
+
+        self._callbacks = (allocate, deallocate)
+        if size:
+            self.reserve(size)
+
+    @property
+    def capacity(self) -> int:
+        """Bytes currently mapped (0 before first use or after close)."""
+        buffer = self._buffer
+        return 0 if buffer is None or buffer.closed else len(buffer)
+
+    @property
+    def locked(self) -> bool:
+        """True if the region is mlocked."""
+        return self._buffer is not None and self._buffer.locked
+
+    @property
+    def huge_pages(self) -> bool:
+        """True if the kernel accepted the transparent huge page advice."""
+        return self._buffer is not None and self._buffer.huge_pages
+
+    def reserve(self, size: int) -> None:
+        """
+        Make sure at least ``size`` bytes are mapped and faulted in.
+
+        A larger request replaces the region; the old one is zeroed and
+        unmapped.
+        """
+        if size <= self.capacity:
+            return
+        buffer = SecureBuffer(size, huge_pages=self._huge_pages, populate=True)
+        if self._buffer is not None:
+            self._buffer.close()
+        self._buffer = buffer
+
+    @contextmanager
+    def lease(self, size: int) -> Iterator[Optional[Tuple[object, object]]]:
+        """
+        Reserve the region for one argon2 call.
+
+        Yields:
+            ``(allocate_cbk, free_cbk)`` for an ``argon2_context``, or None
+            if another derivation is using the arena
+        """
+        if not self._lock.acquire(blocking=False):
+            yield None
+            return
+        try:
+            self.reserve(size)
+            yield self._callbacks
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        """Zero and unmap the region. Safe to call more than once."""
+        with self._lock:
+            if self._buffer is not None:
+                self._buffer.close()
+                self._buffer = None
+
+    def __enter__(self) -> "Argon2Arena":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<Argon2Arena {self.capacity} bytes, locked={self.locked}, huge_pages={self.huge_pages}>"
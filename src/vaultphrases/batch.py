@@ -0,0 +1,125 @@
+"""Parallel master key derivation for many root phrases."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Optional, Sequence, Tuple
+
+from .arena import Argon2Arena
+from .constants import SCHEME_VERSION
+from .derive import derive_master_key, scheme_params
+
+# Argon2 working memory of a pool worker, reused for every phrase it derives
+_worker_arena: Optional[Argon2Arena] = None
+
+# Headroom per worker for the interpreter itself, on top of Argon2 memory
+WORKER_OVERHEAD_KIB = 32 * 1024
+
+
+def available_memory_kib() -> Optional[int]:
+    """
+    Return the memory currently available for new allocations, in KiB.
+
+    Reads ``MemAvailable`` from ``/proc/meminfo`` on Linux and falls back to
+    ``sysconf`` free pages elsewhere.
+
+    Returns:
+        Available memory in KiB, or None if it cannot be determined
+    """
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return pages * page_size // 1024
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def max_workers_for_memory(memory_cost: int, available_kib: Optional[int] = None) -> int:
+    """
+    Size a worker pool so concurrent Argon2 runs fit in available RAM.
+
+    Args:
+        memory_cost: Argon2 memory cost per derivation, in KiB
+        available_kib: Memory budget in KiB (default: currently available RAM)
+
+    Returns:
+        Number of workers (at least 1, at most the CPU count)
+    """
+    if available_kib is None:
+        available_kib = available_memory_kib()
+
+    cpus = os.cpu_count() or 1
+    if available_kib is None:
+        return 1
+
+    by_memory = available_kib // (memory_cost + WORKER_OVERHEAD_KIB)
+    return max(1, min(cpus, by_memory))
+
+
+def _derive_in_worker(phrase: str, test_mode: bool, scheme: str) -> bytes:
+    """derive_master_key() on the worker process's long-lived arena."""
+    global _worker_arena
+    if _worker_arena is None:
+        _worker_arena = Argon2Arena()
+    return derive_master_key(phrase, test_mode=test_mode, scheme=scheme, arena=_worker_arena)
+
+
+def derive_master_keys(
+    root_phrases: Sequence[str],
+    test_mode: bool = False,
+    max_workers: Optional[int] = None,
+    scheme: str = SCHEME_VERSION,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Derive master keys for many root phrases on a process pool.
+
+    Each phrase is derived with ``derive_master_key`` exactly as in serial
+    use, so results are identical; only scheduling differs. Results are
+    streamed back as each derivation completes, which is not necessarily
+    input order. Each worker keeps one ``Argon2Arena``, so only its first
+    derivation pays for allocating and faulting in the Argon2 memory.
+
+    Args:
+        root_phrases: Root phrases to derive
+        test_mode: If True, use faster parameters for testing
+        max_workers: Pool size (default: sized from available RAM divided
+            by the Argon2 memory cost)
+        scheme: Derivation scheme (default: V1)
+
+    Yields:
+        ``(index, master_key)`` tuples, where ``index`` is the position of
+        the phrase in ``root_phrases``
+    """
+    if not root_phrases:
+        return
+
+    if max_workers is None:
+        max_workers = max_workers_for_memory(scheme_params(scheme, test_mode).memory_cost)
+    max_workers = max(1, min(max_workers, len(root_phrases)))
+
+    # A single worker gains nothing from a pool; derive in-process
+    if max_workers == 1:
+        with Argon2Arena() as arena:
+            for index, phrase in enumerate(root_phrases):
+                yield index, derive_master_key(phrase, test_mode=test_mode, scheme=scheme, arena=arena)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_derive_in_worker, phrase, test_mode, scheme): index
+            for index, phrase in enumerate(root_phrases)
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Consumer stopped early or a derivation failed
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,183 @@
+"""Machine calibration for Argon2id parameters (``vaultphrases bench``)."""
+
+import argparse
+import json
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from argon2 import low_level
+
+from .constants import ARGON2_HASH_LENGTH
+from .instrument import peak_rss_kib
+
+# Fixed, non-secret inputs: Argon2 cost does not depend on their content
+CALIBRATION_SECRET = b"vaultphrases calibration secret"
+CALIBRATION_SALT = b"vaultphrases-calibration"
+
+DEFAULT_MEMORY_MIB = [64, 128, 256, 512]
+DEFAULT_TIME_COSTS = [1, 2, 3]
+DEFAULT_TARGET_MS = 1000.0
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a non-empty sample.
+
+    Args:
+        samples: Measured values
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The smallest sample with at least ``pct`` percent of values at or below it
+    """
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _measure_point(memory_cost: int, time_cost: int, parallelism: int, repeats: int) -> Dict[str, Any]:
+    """Time one parameter set. Runs in a fresh worker so peak RSS is per point."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        low_level.hash_secret_raw(
+            secret=CALIBRATION_SECRET,
+            salt=CALIBRATION_SALT,
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            hash_len=ARGON2_HASH_LENGTH,
+            type=low_level.Type.ID,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "memory_cost_kib": memory_cost,
+        "time_cost": time_cost,
+        "parallelism": parallelism,
+        "repeats": repeats,
+        "median_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "peak_rss_kib": peak_rss_kib(),
+    }
+
+
+def recommend(points: List[Dict[str, Any]], target_ms: float) -> Optional[Dict[str, Any]]:
+    """
+    Pick the hardest parameter set whose median latency meets the target.
+
+    Hardness is ranked by memory × time cost (total memory traffic an
+    attacker must pay per guess); ties go to the lower median latency.
+
+    Args:
+        points: Results from calibrate()
+        target_ms: Maximum acceptable median latency
+
+    Returns:
+        The recommended point, or None if no point meets the target
+    """
+    eligible = [p for p in points if p["median_ms"] <= target_ms]
+    if not eligible:
+        return None
+    return max(eligible, key=lambda p: (p["memory_cost_kib"] * p["time_cost"], -p["median_ms"]))
+
+
+def calibrate(
+    memory_costs: Sequence[int],
+    time_costs: Sequence[int],
+    parallelisms: Sequence[int],
+    repeats: int = 3,
+    target_ms: float = DEFAULT_TARGET_MS,
+) -> Dict[str, Any]:
+    """
+    Sweep Argon2id parameters and measure latency and peak memory.
+
+    Every grid point runs in its own short-lived worker process, so the
+    reported peak RSS belongs to that point alone.
+
+    Args:
+        memory_costs: Memory costs to try, in KiB
+        time_costs: Iteration counts to try
+        parallelisms: Lane counts to try
+        repeats: Timed runs per point
+        target_ms: Target median latency for the recommendation
+
+    Returns:
+        JSON-serialisable report with machine info, points and recommendation
+    """
+    points = []
+    for memory_cost in memory_costs:
+        for time_cost in time_costs:
+            for parallelism in parallelisms:
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(_measure_point, memory_cost, time_cost, parallelism, repeats)
+                    points.append(future.result())
+
+    return {
+        "machine": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "target_ms": target_ms,
+        "points": points,
+        "recommended": recommend(points, target_ms),
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    """Parse a comma-separated list of positive integers."""
+    try:
+        items = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers: {value!r}")
+    if not items or any(v < 1 for v in items):
+        raise argparse.ArgumentTypeError(f"expected positive integers: {value!r}")
+    return items
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for ``vaultphrases bench ...``."""
+    cpus = os.cpu_count() or 1
+    default_lanes = sorted({1, cpus})
+
+    parser = argparse.ArgumentParser(
+        prog="vaultphrases bench",
+        description="Benchmark Argon2id on this machine",
+    )
+    sub = parser.add_subparsers(dest="command")
+    cal = sub.add_parser("calibrate", help="sweep Argon2id parameters and recommend a set")
+    cal.add_argument("--memory", type=_int_list, default=DEFAULT_MEMORY_MIB, metavar="MIB,...",
+                     help=f"memory costs in MiB (default: {','.join(map(str, DEFAULT_MEMORY_MIB))})")
+    cal.add_argument("--time", type=_int_list, default=DEFAULT_TIME_COSTS, metavar="N,...",
+                     help=f"time costs (default: {','.join(map(str, DEFAULT_TIME_COSTS))})")
+    cal.add_argument("--parallelism", type=_int_list, default=default_lanes, metavar="N,...",
+                     help=f"lane counts (default: {','.join(map(str, default_lanes))})")
+    cal.add_argument("--repeats", type=int, default=3, metavar="N", help="timed runs per point (default: 3)")
+    cal.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS, metavar="MS",
+                     help=f"target median latency (default: {DEFAULT_TARGET_MS:g})")
+    cal.add_argument("--output", type=str, metavar="FILE", help="write JSON report to FILE instead of stdout")
+
+    args = parser.parse_args(argv)
+    if args.command != "calibrate":
+        parser.print_help()
+        return 1
+
+    report = calibrate(
+        [m * 1024 for m in args.memory],
+        args.time,
+        args.parallelism,
+        repeats=max(1, args.repeats),
+        target_ms=args.target_ms,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
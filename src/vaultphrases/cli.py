@@ -5,23 +5,31 @@ import getpass
 import os
 import sys
 import time
+from typing import TYPE_CHECKING, Optional
 
+# Heavy modules (derive pulls in argon2/cffi, security ctypes, wordlist
+# hashlib) are imported where they are used, so --version, --help and
+# argument errors start without them.
 from .constants import (
     SCHEME_VERSION,
+    SUPPORTED_SCHEMES,
     LABEL_HOT,
     LABEL_COLD,
     DEFAULT_WORD_COUNT,
     DEFAULT_DELIMITER,
+    DEFAULT_WORDLIST,
     DEFAULT_WORDLIST_PATH,
-    ARGON2_MEMORY_COST,
-    ARGON2_TIME_COST,
-    ARGON2_PARALLELISM,
     ARGON2_HASH_LENGTH,
-    ROOT_SALT_V1,
+    DEFAULT_AGENT_TTL,
+    DEFAULT_SESSION_TIMEOUT,
+    BUNDLED_WORDLIST_NAMES,
+    MAX_WORD_COUNT,
 )
-from .derive import derive_master_key, hkdf_child
-from .security import secure_clear_bytes
-from .wordlist import load_wordlist, bytes_to_phrase, fingerprint_wordlist
+from .utils import tokenize_phrase
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .security import SecureBuffer
 
 
 # ANSI codes for minimal styling
@@ -33,6 +41,14 @@ GREEN = "\033[32m"
 RED = "\033[31m"
 
 
+def word_count_arg(value: str) -> int:
+    """argparse type for --words: an integer from 1 to MAX_WORD_COUNT."""
+    count = int(value)
+    if not 1 <= count <= MAX_WORD_COUNT:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_WORD_COUNT}")
+    return count
+
+
 def print_header(title: str):
     """Print a minimal header."""
     print(f"\n{BOLD}{title}{RESET}")
@@ -45,34 +61,223 @@ def print_status(message: str, status: str = "ok"):
     print(f"  {symbol} {message}")
 
 
-def get_root_phrase() -> str:
-    """Securely prompt for the root phrase."""
-    print(f"\n{DIM}Enter your root phrase (input hidden):{RESET}")
-    root_phrase = getpass.getpass(prompt="  → ")
-    
-    if not root_phrase or not root_phrase.strip():
-        print(f"\n{RED}✗ Error: Root phrase cannot be empty{RESET}")
-        sys.exit(1)
-    
-    # Validate root phrase strength
-    stripped = root_phrase.strip()
-    char_count = len(stripped)
-    word_counts = [
-        len(stripped.split()),
-        len(stripped.split('-')),
-        len(stripped.split('_')),
-        len(stripped.split(',')),
-    ]
-    word_count = max(word_counts)
-    
-    if word_count < 6 or char_count < 40:
-        print(f"\n{YELLOW}⚠ Weak root phrase detected{RESET}")
-        if word_count < 6:
-            print(f"  {DIM}→ {word_count} words (recommend 12+){RESET}")
-        if char_count < 40:
-            print(f"  {DIM}→ {char_count} chars (recommend 60+){RESET}")
-    
-    return root_phrase
+def open_wordlist(args):
+    """
+    Load the wordlist selected by --wordlist: a file or a bundled name.
+
+    Without --wordlist the bundled EFF short list is used. Files go through
+    the compiled cache unless --no-wordlist-cache.
+
+    Returns:
+        (words, file_sha256, display_name) where file_sha256 is the hex
+        SHA-256 of the wordlist file as published (the source file for
+        compiled lists)
+    """
+    from .wordlist import (
+        BUNDLED_WORDLISTS,
+        CompiledWordlist,
+        ingest_wordlist,
+        load_bundled_wordlist,
+        load_wordlist_cached,
+    )
+
+    wordlist_path = args.wordlist or DEFAULT_WORDLIST_PATH
+    if not wordlist_path or (wordlist_path in BUNDLED_WORDLISTS and not os.path.exists(wordlist_path)):
+        name = wordlist_path or DEFAULT_WORDLIST
+        info = BUNDLED_WORDLISTS[name]
+        return load_bundled_wordlist(name), info.file_sha256, f"{info.source_name} (bundled)"
+
+    wordlist_name = os.path.basename(wordlist_path)
+    if not args.no_wordlist_cache:
+        words = load_wordlist_cached(wordlist_path)
+        if isinstance(words, CompiledWordlist):
+            return words, words.file_sha256, wordlist_name
+    ingest = ingest_wordlist(wordlist_path)
+    return ingest.words, ingest.file_sha256, wordlist_name
+
+
+def prepare_wordlist(args) -> "Future":
+    """
+    Start open_wordlist() on a worker thread.
+
+    argon2-cffi releases the GIL, so file reads, parsing and hashing
+    overlap the KDF. The thread is a daemon, so Ctrl-C at the prompt exits
+    without waiting for a large list to finish loading. With --memory the
+    wordlist is loaded up front instead, so per-stage peaks are not mixed
+    up.
+
+    Returns:
+        A future resolving to open_wordlist()'s result
+    """
+    import threading
+    from concurrent.futures import Future
+
+    future = Future()
+
+    def load():
+        try:
+            future.set_result(open_wordlist(args))
+        except Exception as e:
+            future.set_exception(e)
+
+    if args.memory:
+        load()
+    else:
+        # Not a ThreadPoolExecutor: its workers are joined at interpreter exit
+        threading.Thread(target=load, name="vaultphrases-wordlist", daemon=True).start()
+    return future
+
+
+def prepare_arena(args, scheme: str, test_mode: bool) -> Optional["Future"]:
+    """
+    With --prefault, map and fault in Argon2's working memory on a worker thread.
+
+    The root phrase prompt leaves seconds of idle time; spending them on
+    the allocation and page faults means the KDF starts on warm, locked
+    pages. Pair every call with release_arena().
+
+    Returns:
+        A future resolving to an Argon2Arena (None if the memory could not
+        be mapped; argon2 then allocates as usual), or None without
+        --prefault
+    """
+    if not args.prefault:
+        return None
+    from concurrent.futures import ThreadPoolExecutor
+    from .arena import Argon2Arena, block_matrix_bytes
+    from .derive import scheme_params
+
+    def fault_in(size):
+        try:
+            return Argon2Arena(size)
+        except OSError:
+            return None
+
+    params = scheme_params(scheme, test_mode)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vaultphrases-prefault")
+    future = executor.submit(fault_in, block_matrix_bytes(params.memory_cost, params.parallelism))
+    executor.shutdown(wait=False)
+    return future
+
+
+def release_arena(arena_future: Optional["Future"]) -> None:
+    """Zero and unmap a prepare_arena() region, waiting for it if still faulting in."""
+    if arena_future is None:
+        return
+    arena = arena_future.result()
+    if arena is not None:
+        arena.close()
+
+
+def get_root_phrase() -> "SecureBuffer":
+    """
+    Securely prompt for the root phrase.
+
+    On a terminal, keystrokes are read straight into a SecureBuffer
+    (``terminal.read_secret_into``). The strength checks and normalisation
+    then run on those bytes, so no ``str`` copy of the phrase is made.
+    Without a terminal ``getpass`` is used and its ``str`` is wiped
+    best-effort.
+
+    Returns:
+        SecureBuffer holding exactly the normalised phrase (UTF-8)
+    """
+    from .security import SecureBuffer, secure_clear_string
+    from .terminal import MAX_PHRASE_BYTES, TerminalInputError, read_secret_into
+    from .utils import max_normalised_length, normalise_phrase_into, phrase_counts
+
+    print(f"\n{DIM}Enter your root phrase (input hidden):{RESET}", flush=True)
+    typed = SecureBuffer(MAX_PHRASE_BYTES)
+    try:
+        try:
+            length = read_secret_into(typed, "  → ")
+        except TerminalInputError as e:
+            print(f"\n{RED}✗ Error: {e}; nothing was derived{RESET}")
+            sys.exit(1)
+        if length is not None:
+            word_count, char_count = phrase_counts(typed.view[:length])
+            length = normalise_phrase_into(typed.view[:length], typed.view)
+        else:
+            root_phrase = getpass.getpass(prompt="  → ")
+            stripped = root_phrase.strip()
+            word_count = len(tokenize_phrase(root_phrase)) if stripped else 0
+            char_count = len(stripped)
+            typed.close()
+            typed = SecureBuffer(max(1, max_normalised_length(root_phrase)))
+            length = normalise_phrase_into(root_phrase, typed.view)
+            # strip() returns the same object when there is nothing to strip
+            if stripped is not root_phrase:
+                secure_clear_string(stripped)
+            del stripped
+            secure_clear_string(root_phrase)
+        
+        # A phrase of only non-ASCII whitespace (e.g. U+3000) normalises to nothing
+        if char_count == 0 or length == 0:
+            print(f"\n{RED}✗ Error: Root phrase cannot be empty{RESET}")
+            sys.exit(1)
+        
+        # Validate root phrase strength
+        if word_count < 6 or char_count < 40:
+            print(f"\n{YELLOW}⚠ Weak root phrase detected{RESET}")
+            if word_count < 6:
+                print(f"  {DIM}→ {word_count} words (recommend 12+){RESET}")
+            if char_count < 40:
+                print(f"  {DIM}→ {char_count} chars (recommend 60+){RESET}")
+        
+        return SecureBuffer.from_bytes(typed.view[:length])
+    finally:
+        typed.close()
+
+
+def precheck_root_phrase(args, root_phrase: "SecureBuffer", wordlist_future: Optional["Future"] = None) -> bool:
+    """
+    Check the root phrase against a wordlist before paying for Argon2.
+
+    The wordlist lookup needs the words as ``str``, so this opt-in check
+    decodes the phrase once and wipes that copy best-effort.
+
+    Args:
+        args: Parsed CLI arguments
+        root_phrase: Normalised root phrase
+        wordlist_future: prepare_wordlist() future for --wordlist, reused
+            when --check-words names the same list
+
+    Returns:
+        True to continue with the derivation
+    """
+    if args.check_words is None:
+        return True
+    from .instrument import stage
+    from .security import secure_clear_string
+    from .wordlist import Wordlist, check_phrase_words
+
+    check_args = argparse.Namespace(**vars(args))
+    if args.check_words:
+        check_args.wordlist = args.check_words
+    with stage("typo_check"):
+        if wordlist_future is not None and check_args.wordlist == args.wordlist:
+            words, _, wordlist_name = wordlist_future.result()
+        else:
+            words, _, wordlist_name = open_wordlist(check_args)
+        text = str(root_phrase.view, "utf-8")
+        try:
+            unknown = check_phrase_words(text, Wordlist(words))
+        finally:
+            secure_clear_string(text)
+    if not unknown:
+        print(f"  {GREEN}✓{RESET} {DIM}All words found in {wordlist_name}{RESET}")
+        return True
+
+    print(f"\n{YELLOW}! {len(unknown)} word(s) not in {wordlist_name}{RESET}")
+    for entry in unknown:
+        hint = ", ".join(entry.suggestions) if entry.suggestions else "no close match"
+        print(f"  {DIM}word {entry.position}:{RESET} {entry.token} {DIM}→ {hint}{RESET}")
+    try:
+        answer = input("  Derive anyway? [y/N]: ")
+    except EOFError:
+        answer = ""
+    clear_screen()
+    return answer.strip().lower() in ("y", "yes")
 
 
 def clear_screen():
@@ -85,15 +290,184 @@ def clear_screen():
         os.system("clear")
 
 
+def display_reveal(args, hot_phrase, cold_phrase, wordlist_name, wordlist_fp, word_count):
+    """Show HOT and COLD passphrases, then wait to clear the screen."""
+    print_header("Derived Passphrases")
+    print(f"\n  {BOLD}HOT{RESET} {DIM}(daily vault){RESET}")
+    print(f"  {hot_phrase}")
+    print(f"\n  {BOLD}COLD{RESET} {DIM}(offline vault){RESET}")
+    print(f"  {cold_phrase}")
+    
+    print(f"\n{DIM}{'─' * 40}{RESET}")
+    print(f"{DIM}• Verify by running again with same root phrase{RESET}")
+    print(f"{DIM}• Close terminal after copying{RESET}")
+
+    # Display recovery kit, doesn't do anything if not requested
+    display_recovery_kit(args, wordlist_name, wordlist_fp, word_count)
+    
+    try:
+        input(f"\n{DIM}Press ENTER to clear screen...{RESET}")
+        clear_screen()
+    except EOFError:
+        pass
+
+
+def display_label(args, custom_phrase, wordlist_name, wordlist_fp, word_count):
+    """Show a custom labelled passphrase, then wait to clear the screen."""
+    print_header(f"Derived: {args.label}")
+    print(f"\n  {custom_phrase}")
+    
+    print(f"\n{DIM}• Verify by running again with same root phrase{RESET}")
+    
+    # Display recovery kit, doesn't do anything if not requested
+    display_recovery_kit(args, wordlist_name, wordlist_fp, word_count)
+    
+    try:
+        input(f"\n{DIM}Press ENTER to clear screen...{RESET}")
+        clear_screen()
+    except EOFError:
+        pass
+
+
+def run_via_agent(args):
+    """
+    Serve --reveal / --label from a running agent, skipping Argon2.
+
+    Returns:
+        0 if the agent answered, or None to fall back to local derivation
+    """
+    from . import agent
+    from .wordlist import fingerprint_wordlist, format_digest
+
+    try:
+        status = agent.request({"op": "ping"})
+    except agent.AgentError:
+        return None
+    if not status.get("ok") or bool(status.get("test")) != args.test:
+        return None
+    if status.get("scheme") != args.scheme:
+        return None
+
+    words, file_sha256, wordlist_name = open_wordlist(args)
+    full_fp = fingerprint_wordlist(words)
+    if status.get("wordlist") != full_fp:
+        print(f"\n{YELLOW}! Agent running with a different wordlist, deriving locally{RESET}")
+        return None
+
+    labels = [LABEL_HOT, LABEL_COLD] if args.reveal else [args.label]
+    phrases = [agent.agent_phrase(label, args.words, full_fp, args.test, DEFAULT_DELIMITER, scheme=args.scheme) for label in labels]
+    if any(phrase is None for phrase in phrases):
+        return None
+
+    wordlist_fp = file_sha256
+    print(f"\n{DIM}Wordlist: {wordlist_name} ({len(words)} words) SHA256 {format_digest(wordlist_fp)}{RESET}")
+    print(f"{DIM}Using running agent (no root phrase needed){RESET}")
+
+    if args.reveal:
+        display_reveal(args, phrases[0], phrases[1], wordlist_name, wordlist_fp, len(words))
+    else:
+        display_label(args, phrases[0], wordlist_name, wordlist_fp, len(words))
+    return 0
+
+
+def run_session(args, master_key, words):
+    """Serve labels interactively until :quit, Ctrl-D or idle timeout."""
+    from .session import Session
+
+    session = Session(
+        master_key,
+        words,
+        word_count=args.words,
+        delimiter=DEFAULT_DELIMITER,
+        idle_timeout=args.session_ttl,
+    )
+    print(f"\n{GREEN}✓ Session ready{RESET} {DIM}— type a label (Tab completes), :words N, :labels, :clear, :quit{RESET}")
+    print(f"{DIM}• Idle timeout {args.session_ttl}s — key is wiped on expiry{RESET}\n")
+    try:
+        reason = session.run()
+    except KeyboardInterrupt:
+        reason = "interrupt"
+    finally:
+        session.close()
+    if reason == "timeout":
+        print(f"\n{YELLOW}! Idle timeout{RESET}")
+    clear_screen()
+    print(f"{DIM}Session ended, master key wiped{RESET}")
+    return 0
+
+
+def serve_agent(args, master_key, words, wordlist_fp):
+    """Run the derivation agent in the foreground until idle expiry or Ctrl-C."""
+    from . import agent
+
+    server = agent.AgentServer(
+        master_key,
+        words,
+        wordlist_fp,
+        test_mode=args.test,
+        idle_ttl=args.agent_ttl,
+        scheme=args.scheme,
+    )
+    try:
+        server.bind()
+        print(f"\n{GREEN}✓ Agent listening on {server.socket_path}{RESET}")
+        print(f"{DIM}• Idle timeout {args.agent_ttl}s — key is wiped on expiry{RESET}")
+        print(f"{DIM}• Ctrl-C or 'vaultphrases --agent-stop' to stop{RESET}")
+        server.serve_forever()
+        print(f"\n{DIM}Agent stopped, master key wiped{RESET}")
+    finally:
+        server.close()
+    return 0
+
+
+def print_timings(timings):
+    """Print a per-stage timing breakdown (durations only, no secrets)."""
+    totals = {}
+    for name, seconds in timings:
+        totals[name] = totals.get(name, 0.0) + seconds
+    if not totals:
+        return
+    width = max(len(name) for name in totals)
+    print_header("Timings")
+    for name, seconds in totals.items():
+        print(f"  {name:<{width}}  {seconds * 1000:10.2f} ms")
+    print(f"  {DIM}{'total':<{width}}  {sum(totals.values()) * 1000:10.2f} ms{RESET}\n")
+
+
+def print_memory(report):
+    """Print per-stage memory figures and the whole-run peak RSS."""
+    def kib(value):
+        return f"{value / 1024:8.1f} MiB" if value is not None else f"{'n/a':>12}"
+
+    print_header("Memory")
+    if report.stages:
+        width = max(len(record.name) for record in report.stages)
+        print(f"  {DIM}{'stage':<{width}}  {'rss before':>12}  {'rss peak':>12}  {'py delta':>10}  {'py peak':>10}{RESET}")
+        for record in report.stages:
+            print(
+                f"  {record.name:<{width}}  {kib(record.rss_before_kib)}  {kib(record.peak_rss_kib)}"
+                f"  {record.py_delta_bytes / 1024:7.1f} KiB  {record.py_peak_bytes / 1024:7.1f} KiB"
+            )
+    print(f"  {BOLD}Peak RSS (whole run):{RESET} {kib(report.peak_rss_kib).strip()}")
+    if not report.peak_is_scoped:
+        print(f"  {DIM}Stage peaks are process-wide (peak counter could not be reset){RESET}")
+    print()
+
+
 def run_derivation(args):
     """Run the main derivation workflow."""
+    from .derive import derive_master_key, ChildKeyStream, KeyedPRF
+    from .instrument import stage
+    from .security import SecureBuffer
+    from .wordlist import blocks_to_phrase, fingerprint_wordlist, format_digest
+
     try:
         print(f"\n{BOLD}vaultphrases{RESET} {DIM}v0.1.0{RESET}")
         
         # Test mode warning
         if args.test:
             print(f"\n{YELLOW}{BOLD}⚠ TEST MODE{RESET} {DIM}— weak Argon2 params, not for real secrets{RESET}")
-            if args.reveal or args.label:
+            if args.reveal or args.label or args.agent or args.session:
                 try:
                     confirmation = input(f"  Type 'test' to confirm: ")
                     if confirmation.lower() != "test":
@@ -103,88 +477,91 @@ def run_derivation(args):
                     print(f"\n{RED}✗ Cancelled.{RESET}")
                     return 1
         
-        # Get root phrase
-        root_phrase = get_root_phrase()
+        # A running agent already holds the master key
+        if (args.reveal or args.label) and not args.agent and not args.session and not args.no_agent:
+            if run_via_agent(args) == 0:
+                return 0
         
-        # Load wordlist if needed
-        words = None
-        if args.reveal or args.label:
-            wordlist_path = args.wordlist or DEFAULT_WORDLIST_PATH
-            if not wordlist_path:
-                print(f"\n{RED}✗ No wordlist specified{RESET}")
-                print(f"  {DIM}Use --wordlist PATH or download EFF wordlist:{RESET}")
-                print(f"  {DIM}https://www.eff.org/files/2016/09/08/eff_short_wordlist_1.txt{RESET}")
-                sys.exit(1)
-            words = load_wordlist(wordlist_path)
-            wordlist_name = os.path.basename(wordlist_path)
-            wordlist_fp = fingerprint_wordlist(words)[:16]
-            print(f"\n{DIM}Wordlist: {wordlist_name} ({len(words)} words) [{wordlist_fp}…]{RESET}")
+        # Prepare the wordlist (if needed) while the user types and Argon2 runs
+        wordlist_future = None
+        if args.reveal or args.label or args.agent or args.session:
+            wordlist_future = prepare_wordlist(args)
         
-        # Derive master key
-        print(f"\n{DIM}Deriving master key...{RESET}", end="", flush=True)
-        master_key = derive_master_key(root_phrase, test_mode=args.test)
-        print(f" {GREEN}✓{RESET}")
+        # Fault in the Argon2 memory (with --prefault) while the user types
+        arena_future = prepare_arena(args, args.scheme, args.test)
+        try:
+            # Get root phrase
+            with stage("prompt"):
+                root_phrase = get_root_phrase()
+            if not precheck_root_phrase(args, root_phrase, wordlist_future):
+                print(f"\n{RED}✗ Cancelled.{RESET}")
+                return 1
+            
+            # Fail before the KDF if the wordlist is already known to be bad
+            if wordlist_future is not None and wordlist_future.done():
+                wordlist_future.result()
+            
+            # Derive master key
+            print(f"\n{DIM}Deriving master key...{RESET}", end="", flush=True)
+            arena = arena_future.result() if arena_future is not None else None
+            master_key = SecureBuffer(ARGON2_HASH_LENGTH)
+            derive_master_key(root_phrase.view, test_mode=args.test, scheme=args.scheme, out=master_key, arena=arena)
+            print(f" {GREEN}✓{RESET}")
+        finally:
+            release_arena(arena_future)
+        
+        words = None
+        if wordlist_future is not None:
+            words, wordlist_fp, wordlist_name = wordlist_future.result()
+            print(f"{DIM}Wordlist: {wordlist_name} ({len(words)} words) SHA256 {format_digest(wordlist_fp)}{RESET}")
         
         # Clear root phrase
-        from .security import secure_clear_string
-        secure_clear_string(root_phrase)
-        del root_phrase
+        root_phrase.close()
+        
+        if args.record:
+            record_check_codes(args, master_key)
+        
+        if args.session:
+            return run_session(args, master_key, words)
+        
+        if args.agent:
+            try:
+                return serve_agent(args, master_key, words, fingerprint_wordlist(words))
+            finally:
+                master_key.close()
         
         if args.reveal:
             # Derive HOT and COLD
-            hot_raw = hkdf_child(master_key, LABEL_HOT, 32)
-            hot_phrase = bytes_to_phrase(hot_raw, words, args.words, DEFAULT_DELIMITER)
-            cold_raw = hkdf_child(master_key, LABEL_COLD, 32)
-            cold_phrase = bytes_to_phrase(cold_raw, words, args.words, DEFAULT_DELIMITER)
+            with stage("hkdf"):
+                prf = KeyedPRF(master_key)
+                hot_raw = ChildKeyStream(prf, LABEL_HOT)
+                cold_raw = ChildKeyStream(prf, LABEL_COLD)
+                hot_raw.block(0)
+                cold_raw.block(0)
+            hot_phrase = blocks_to_phrase(hot_raw, words, args.words, DEFAULT_DELIMITER)
+            cold_phrase = blocks_to_phrase(cold_raw, words, args.words, DEFAULT_DELIMITER)
             
-            print_header("Derived Passphrases")
-            print(f"\n  {BOLD}HOT{RESET} {DIM}(daily vault){RESET}")
-            print(f"  {hot_phrase}")
-            print(f"\n  {BOLD}COLD{RESET} {DIM}(offline vault){RESET}")
-            print(f"  {cold_phrase}")
+            display_reveal(args, hot_phrase, cold_phrase, wordlist_name, wordlist_fp, len(words))
             
-            print(f"\n{DIM}{'─' * 40}{RESET}")
-            print(f"{DIM}• Verify by running again with same root phrase{RESET}")
-            print(f"{DIM}• Close terminal after copying{RESET}")
-
-            # Display recovery kit, doesn't do anything if not requested
-            display_recovery_kit(args, wordlist_name, wordlist_fp, len(words))
-            
-            try:
-                input(f"\n{DIM}Press ENTER to clear screen...{RESET}")
-                clear_screen()
-            except EOFError:
-                pass
-            
-            secure_clear_bytes(hot_raw)
-            secure_clear_bytes(cold_raw)
+            hot_raw.clear()
+            cold_raw.clear()
             
         elif args.label:
             # Derive custom label
-            custom_raw = hkdf_child(master_key, args.label, 32)
-            custom_phrase = bytes_to_phrase(custom_raw, words, args.words, DEFAULT_DELIMITER)
-            
-            print_header(f"Derived: {args.label}")
-            print(f"\n  {custom_phrase}")
+            with stage("hkdf"):
+                custom_raw = ChildKeyStream(master_key, args.label)
+                custom_raw.block(0)
+            custom_phrase = blocks_to_phrase(custom_raw, words, args.words, DEFAULT_DELIMITER)
             
-            print(f"\n{DIM}• Verify by running again with same root phrase{RESET}")
+            display_label(args, custom_phrase, wordlist_name, wordlist_fp, len(words))
             
-            # Display recovery kit, doesn't do anything if not requested
-            display_recovery_kit(args, wordlist_name, wordlist_fp, len(words))
-            
-            try:
-                input(f"\n{DIM}Press ENTER to clear screen...{RESET}")
-                clear_screen()
-            except EOFError:
-                pass
-            
-            secure_clear_bytes(custom_raw)
+            custom_raw.clear()
             
         else:
             print(f"\n{GREEN}✓ Master key derived{RESET}")
             print(f"\n{DIM}Use --reveal for HOT/COLD phrases, or --label NAME for custom{RESET}")
         
-        secure_clear_bytes(master_key)
+        master_key.close()
         
         return 0
         
@@ -196,6 +573,97 @@ def run_derivation(args):
         return 1
 
 
+def record_check_codes(args, master_key):
+    """Add check codes for HOT, COLD and --label to the --record manifest."""
+    from .verify import (
+        Manifest,
+        ManifestError,
+        compute_check_codes,
+        load_manifest,
+        save_manifest,
+        verify_check_codes,
+    )
+
+    labels = [LABEL_HOT, LABEL_COLD] + ([args.label] if args.label else [])
+    codes = {}
+    if os.path.exists(os.path.expanduser(args.record)):
+        existing = load_manifest(args.record)
+        if (existing.scheme, existing.test_mode) != (args.scheme, args.test):
+            raise ManifestError("Existing manifest uses a different scheme or mode")
+        # Never mix codes from different root phrases in one manifest
+        if not all(verify_check_codes(master_key, existing.codes).values()):
+            raise ManifestError("Root phrase does not match the existing manifest")
+        codes.update(existing.codes)
+    codes.update(compute_check_codes(master_key, labels))
+    save_manifest(args.record, Manifest(args.scheme, args.test, codes))
+    print(f"\n{GREEN}✓{RESET} {DIM}Recorded check codes for {len(labels)} labels in {args.record}{RESET}")
+
+
+def run_verify(args):
+    """Verify every label in a check code manifest with a single Argon2 run."""
+    from .derive import derive_master_key
+    from .instrument import stage
+    from .security import SecureBuffer
+    from .verify import ManifestError, load_manifest, verify_check_codes
+    from .wordlist import WordlistError
+
+    print(f"\n{BOLD}vaultphrases{RESET} {DIM}verify{RESET}")
+    try:
+        manifest = load_manifest(args.verify)
+    except ManifestError as e:
+        print(f"\n{RED}✗ {e}{RESET}\n")
+        return 1
+    
+    if manifest.test_mode:
+        print(f"\n{YELLOW}{BOLD}⚠ TEST MODE{RESET} {DIM}— manifest recorded with weak Argon2 params{RESET}")
+    print(f"{DIM}{len(manifest.codes)} labels | scheme {manifest.scheme}{RESET}")
+    
+    arena_future = prepare_arena(args, manifest.scheme, manifest.test_mode)
+    try:
+        with stage("prompt"):
+            root_phrase = get_root_phrase()
+        try:
+            proceed = precheck_root_phrase(args, root_phrase)
+        except WordlistError as e:
+            root_phrase.close()
+            print(f"\n{RED}✗ {e}{RESET}\n")
+            return 1
+        if not proceed:
+            root_phrase.close()
+            print(f"\n{RED}✗ Cancelled.{RESET}")
+            return 1
+        
+        print(f"\n{DIM}Deriving master key...{RESET}", end="", flush=True)
+        arena = arena_future.result() if arena_future is not None else None
+        master_key = SecureBuffer(ARGON2_HASH_LENGTH)
+        derive_master_key(root_phrase.view, test_mode=manifest.test_mode, scheme=manifest.scheme, out=master_key, arena=arena)
+        print(f" {GREEN}✓{RESET}")
+        
+        root_phrase.close()
+        
+        try:
+            with stage("verify"):
+                results = verify_check_codes(master_key, manifest.codes)
+        finally:
+            master_key.close()
+    except KeyboardInterrupt:
+        print(f"\n\n{RED}✗ Cancelled{RESET}")
+        return 1
+    finally:
+        release_arena(arena_future)
+    
+    print_header("Verification")
+    for label, ok in results.items():
+        print_status(label, "ok" if ok else "err")
+    
+    failed = len(results) - sum(results.values())
+    if failed:
+        print(f"\n{RED}✗ {failed} of {len(results)} labels failed{RESET} {DIM}— wrong root phrase?{RESET}\n")
+        return 1
+    print(f"\n{GREEN}✓ All {len(results)} labels verified{RESET}\n")
+    return 0
+
+
 def display_recovery_kit(args, wordlist_name=None, wordlist_fp=None, word_count=None):
     """
     Display recovery kit information.
@@ -203,12 +671,13 @@ def display_recovery_kit(args, wordlist_name=None, wordlist_fp=None, word_count=
     Args:
         args: Parsed command-line arguments
         wordlist_name: Name of the wordlist file (if already loaded)
-        wordlist_fp: Fingerprint of the wordlist (if already loaded)
+        wordlist_fp: File SHA-256 of the wordlist (if already loaded)
         word_count: Number of words in the wordlist (if already loaded)
     """
-    from . import __version__
     if not args.recoverykit:
         return
+    from . import __version__
+    from .derive import scheme_params
 
     print()
     print("╔═══════════════════════════════════════════════════════════╗")
@@ -220,16 +689,17 @@ def display_recovery_kit(args, wordlist_name=None, wordlist_fp=None, word_count=
 
     # Version information
     print(f"  • VaultPhrases Version:  {__version__}")
-    print(f"  • Derivation Scheme:     {SCHEME_VERSION}")
+    print(f"  • Derivation Scheme:     {args.scheme}")
     print()
 
     # Argon2 parameters and salt
+    params = scheme_params(args.scheme)
     print("  Argon2id Parameters:")
-    print(f"    - Memory Cost:         {ARGON2_MEMORY_COST // 1024} MiB")
-    print(f"    - Time Cost:           {ARGON2_TIME_COST} iterations")
-    print(f"    - Parallelism:         {ARGON2_PARALLELISM}")
+    print(f"    - Memory Cost:         {params.memory_cost // 1024} MiB")
+    print(f"    - Time Cost:           {params.time_cost} iterations")
+    print(f"    - Parallelism:         {params.parallelism}")
     print(f"    - Hash Length:         {ARGON2_HASH_LENGTH} bytes")
-    print(f"    - Root Salt:           {ROOT_SALT_V1.decode('utf-8')}")
+    print(f"    - Root Salt:           {params.salt.decode('utf-8')}")
     print()
 
     # Child derivation labels
@@ -251,27 +721,19 @@ def display_recovery_kit(args, wordlist_name=None, wordlist_fp=None, word_count=
         print(f"    - Word Count:          {word_count}")
         print(f"    - SHA256 Hash:         {wordlist_fp}")
         print()
-    elif args.wordlist:
+    else:
         try:
-            wordlist_path = args.wordlist or DEFAULT_WORDLIST_PATH
-            if wordlist_path:
-                words = load_wordlist(wordlist_path)
-                wl_name = os.path.basename(wordlist_path)
-                wl_fp = fingerprint_wordlist(words)
-
-                print("  Wordlist Information:")
-                print(f"    - Wordlist File:       {wl_name}")
-                print(f"    - Word Count:          {len(words)}")
-                print(f"    - SHA256 Hash:         {wl_fp}")
-                print()
+            words, wl_fp, wl_name = open_wordlist(args)
+
+            print("  Wordlist Information:")
+            print(f"    - Wordlist File:       {wl_name}")
+            print(f"    - Word Count:          {len(words)}")
+            print(f"    - SHA256 Hash:         {wl_fp}")
+            print()
         except Exception as e:
             print("  Wordlist Information:")
             print(f"    - Error loading wordlist: {e}")
             print()
-    else:
-        print("  Wordlist Information:")
-        print("    - No wordlist specified (use --wordlist to include)")
-        print()
 
     print("═" * 63)
     print()
@@ -293,38 +755,104 @@ examples:
   vaultphrases --reveal              Show HOT and COLD passphrases
   vaultphrases --label ssh           Derive custom passphrase
   vaultphrases --words 8 --reveal    Use 8 words instead of 6
+  vaultphrases --agent               Derive once, serve later runs from an agent
+  vaultphrases bench calibrate       Time Argon2id parameters on this machine
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
     parser.add_argument("--reveal", action="store_true", help="show HOT and COLD passphrases")
-    parser.add_argument("--words", type=int, default=DEFAULT_WORD_COUNT, metavar="N", help=f"words in passphrase (default: {DEFAULT_WORD_COUNT})")
+    parser.add_argument("--words", type=word_count_arg, default=DEFAULT_WORD_COUNT, metavar="N", help=f"words in passphrase, 1-{MAX_WORD_COUNT} (default: {DEFAULT_WORD_COUNT})")
     parser.add_argument("--label", type=str, metavar="NAME", help="derive custom passphrase (e.g., 'ssh', 'gpg')")
-    parser.add_argument("--wordlist", type=str, metavar="FILE", help="path to wordlist file")
+    parser.add_argument("--wordlist", type=str, metavar="FILE", help=f"wordlist file, or a bundled list ({', '.join(BUNDLED_WORDLIST_NAMES)}; default: {DEFAULT_WORDLIST})")
+    parser.add_argument("--scheme", choices=SUPPORTED_SCHEMES, default=SCHEME_VERSION, help=f"derivation scheme (default: {SCHEME_VERSION}; V2 uses multi-lane Argon2id)")
     parser.add_argument("--test", action="store_true", help="fast Argon2 params (INSECURE, testing only)")
     parser.add_argument("--version", action="store_true", help="show version info")
-    parser.add_argument("--verify", action="store_true", help="verify derivation (not yet implemented)")
+    parser.add_argument("--verify", type=str, metavar="MANIFEST", help="check the root phrase against a check code manifest (no phrases shown)")
+    parser.add_argument("--record", type=str, metavar="FILE", help="record check codes for HOT, COLD and --label in a manifest")
     parser.add_argument("--recoverykit", action="store_true", help="show recovery kit")
+    parser.add_argument("--agent", action="store_true", help="derive once and serve phrases from a background agent")
+    parser.add_argument("--agent-ttl", type=int, default=DEFAULT_AGENT_TTL, metavar="SECS", help=f"agent idle timeout before the key is wiped (default: {DEFAULT_AGENT_TTL})")
+    parser.add_argument("--agent-stop", action="store_true", help="wipe the key and stop a running agent")
+    parser.add_argument("--no-agent", action="store_true", help="ignore a running agent and derive locally")
+    parser.add_argument("--session", action="store_true", help="derive once, then enter labels interactively")
+    parser.add_argument("--session-ttl", type=int, default=DEFAULT_SESSION_TIMEOUT, metavar="SECS", help=f"session idle timeout before the key is wiped (default: {DEFAULT_SESSION_TIMEOUT})")
+    parser.add_argument("--check-words", nargs="?", const="", metavar="WORDLIST", help="before deriving, flag root phrase words missing from WORDLIST (default: --wordlist) and suggest matches")
+    parser.add_argument("--no-wordlist-cache", action="store_true", help="parse the wordlist file instead of using the compiled cache")
+    parser.add_argument("--prefault", action="store_true", help="fault in Argon2's memory while the root phrase is typed (faster KDF start)")
+    parser.add_argument("--timings", action="store_true", help="print a per-stage timing breakdown")
+    parser.add_argument("--memory", action="store_true", help="print per-stage memory use and the peak RSS")
     
     return parser.parse_args()
 
 
+def wordlist_main(argv=None) -> int:
+    """Entry point for ``vaultphrases wordlist``."""
+    parser = argparse.ArgumentParser(prog="vaultphrases wordlist", description="Manage wordlists")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_cmd = commands.add_parser("compile", help="compile a wordlist into the memory-mapped format")
+    compile_cmd.add_argument("source", help="wordlist file in any supported format")
+    compile_cmd.add_argument("-o", "--output", metavar="FILE", help="output path (default: SOURCE with a .vpwl suffix)")
+    args = parser.parse_args(argv)
+
+    from .wordlist import WordlistError, compile_wordlist, fingerprint_wordlist, format_digest, load_wordlist
+
+    try:
+        output = compile_wordlist(args.source, args.output)
+        words = load_wordlist(output)
+    except WordlistError as e:
+        print(f"\n{RED}✗ {e}{RESET}\n")
+        return 1
+    print(f"\n{GREEN}✓{RESET} {output}")
+    print(f"  {DIM}{len(words)} words | file SHA256 {format_digest(words.file_sha256)} | fingerprint {fingerprint_wordlist(words)}{RESET}\n")
+    words.close()
+    return 0
+
+
 def main():
     """Main CLI entrypoint."""
+    if sys.argv[1:2] == ["bench"]:
+        from .bench import main as bench_main
+        return bench_main(sys.argv[2:])
+    if sys.argv[1:2] == ["wordlist"]:
+        return wordlist_main(sys.argv[2:])
+
     args = parse_args()
 
     if args.version:
         print(f"\n{BOLD}vaultphrases{RESET} v0.1.0")
         print(f"{DIM}Scheme: {SCHEME_VERSION} | KDF: Argon2id (256 MiB, 3 iter) | HMAC-SHA256{RESET}")
+        print(f"{DIM}Supported schemes: {', '.join(SUPPORTED_SCHEMES)}{RESET}")
         print(f"{DIM}https://github.com/n-deshpande/vaultphrases | MIT{RESET}\n")
         return 0
 
-    if args.verify:
-        print(f"\n{BOLD}vaultphrases{RESET} {DIM}verify{RESET}")
-        print(f"{DIM}Not yet implemented — will verify derivation without full reveal{RESET}\n")
-        return 0
+    if args.agent_stop:
+        from . import agent
+        try:
+            agent.request({"op": "lock"})
+            print(f"\n{GREEN}✓ Agent stopped{RESET}\n")
+            return 0
+        except agent.AgentError:
+            print(f"\n{DIM}No agent running{RESET}\n")
+            return 1
+
+    run = run_verify if args.verify else run_derivation
+    
+    if args.timings or args.memory:
+        from contextlib import ExitStack
+        from .instrument import collect_memory, collect_timings
+
+        with ExitStack() as stack:
+            timings = stack.enter_context(collect_timings()) if args.timings else None
+            report = stack.enter_context(collect_memory()) if args.memory else None
+            status = run(args)
+        if timings is not None:
+            print_timings(timings)
+        if report is not None:
+            print_memory(report)
+        return status
     
-    return run_derivation(args)
+    return run(args)
 
 
 if __name__ == "__main__":
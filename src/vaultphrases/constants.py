@@ -1,7 +1,12 @@
-"""Constants for vaultphrases derivation scheme V1."""
+"""Constants for vaultphrases derivation schemes."""
 
-# Derivation scheme version
-SCHEME_VERSION = "V1"
+# Derivation scheme identifiers
+SCHEME_V1 = "V1"
+SCHEME_V2 = "V2"
+SUPPORTED_SCHEMES = (SCHEME_V1, SCHEME_V2)
+
+# Default derivation scheme version
+SCHEME_VERSION = SCHEME_V1
 
 # Argon2id parameters for production
 ARGON2_MEMORY_COST = 256 * 1024  # 256 MiB in KiB
@@ -17,14 +22,40 @@ ARGON2_TEST_PARALLELISM = 1
 # Root salt for master key derivation
 ROOT_SALT_V1 = b"family-password-root-v1"
 
+# Scheme V2: multi-lane Argon2id (V1 above stays frozen)
+# Four lanes are filled concurrently, so on a machine with 4+ cores V2
+# costs about half of V1's wall-clock time while using twice the memory.
+ARGON2_V2_MEMORY_COST = 512 * 1024  # 512 MiB in KiB
+ARGON2_V2_TIME_COST = 3
+ARGON2_V2_PARALLELISM = 4
+
+# Scheme V2 parameters for testing (fast)
+ARGON2_V2_TEST_MEMORY_COST = 8 * 1024  # 8 MiB
+ARGON2_V2_TEST_TIME_COST = 1
+ARGON2_V2_TEST_PARALLELISM = 4
+
+ROOT_SALT_V2 = b"family-password-root-v2"
+
 # Standard labels for child key derivation
 LABEL_HOT = "HOT_PHRASE_V1"
 LABEL_COLD = "COLD_PHRASE_V1"
 
+# Separator for hierarchical label paths (e.g., "work/ssh/host42")
+LABEL_PATH_SEPARATOR = "/"
+
 # Default passphrase settings
 DEFAULT_WORD_COUNT = 6
 DEFAULT_DELIMITER = "-"
+MAX_WORD_COUNT = 128
+
+# Idle time before the agent / an interactive session wipes the master key
+DEFAULT_AGENT_TTL = 15 * 60
+DEFAULT_SESSION_TIMEOUT = 5 * 60
+
+# Names of the wordlists shipped in vaultphrases/data (see wordlist.BUNDLED_WORDLISTS)
+BUNDLED_WORDLIST_NAMES = ("eff_short", "eff_large")
 
-# Default wordlist path (user must provide their own)
-# Users should download a wordlist (e.g., EFF Short Wordlist) and specify with --wordlist
+# Default wordlist: the bundled EFF Short Wordlist (see wordlist.BUNDLED_WORDLISTS)
+# A file given with --wordlist, or DEFAULT_WORDLIST_PATH if set, takes precedence
+DEFAULT_WORDLIST = "eff_short"
 DEFAULT_WORDLIST_PATH = None
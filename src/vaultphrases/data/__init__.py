@@ -0,0 +1 @@
+"""Bundled EFF wordlists in compiled form (see wordlist.BUNDLED_WORDLISTS)."""
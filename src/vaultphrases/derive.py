@@ -2,10 +2,13 @@
 
 import hmac
 import hashlib
-from typing import Optional
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union
 from argon2 import low_level
 
 from .constants import (
+    SCHEME_V1,
+    SCHEME_V2,
+    SCHEME_VERSION,
     ARGON2_MEMORY_COST,
     ARGON2_TIME_COST,
     ARGON2_PARALLELISM,
@@ -13,12 +16,113 @@ from .constants import (
     ARGON2_TEST_MEMORY_COST,
     ARGON2_TEST_TIME_COST,
     ARGON2_TEST_PARALLELISM,
+    ARGON2_V2_MEMORY_COST,
+    ARGON2_V2_TIME_COST,
+    ARGON2_V2_PARALLELISM,
+    ARGON2_V2_TEST_MEMORY_COST,
+    ARGON2_V2_TEST_TIME_COST,
+    ARGON2_V2_TEST_PARALLELISM,
     ROOT_SALT_V1,
+    ROOT_SALT_V2,
 )
-from .security import secure_clear_bytes, secure_clear_string
-from .utils import normalise_phrase
+from .arena import Argon2Arena, block_matrix_bytes
+from .instrument import stage
+from .security import SecureBuffer, secure_clear_bytes
+from .utils import PhraseBuffer, max_normalised_length, normalise_phrase_into
 
-def derive_master_key(root_phrase: str, test_mode: bool = False) -> bytes:
+
+class Argon2Params(NamedTuple):
+    """Argon2id parameters for one derivation scheme."""
+
+    memory_cost: int  # KiB
+    time_cost: int
+    parallelism: int
+    salt: bytes
+
+
+def scheme_params(scheme: str = SCHEME_VERSION, test_mode: bool = False) -> Argon2Params:
+    """
+    Get the Argon2id parameters for a derivation scheme.
+    
+    Args:
+        scheme: Scheme identifier (e.g., "V1", "V2")
+        test_mode: If True, return the fast testing parameters
+        
+    Returns:
+        Parameters for the scheme
+        
+    Raises:
+        ValueError: If the scheme is unknown
+    """
+    if scheme == SCHEME_V1:
+        if test_mode:
+            return Argon2Params(ARGON2_TEST_MEMORY_COST, ARGON2_TEST_TIME_COST, ARGON2_TEST_PARALLELISM, ROOT_SALT_V1)
+        return Argon2Params(ARGON2_MEMORY_COST, ARGON2_TIME_COST, ARGON2_PARALLELISM, ROOT_SALT_V1)
+    if scheme == SCHEME_V2:
+        if test_mode:
+            return Argon2Params(
+                ARGON2_V2_TEST_MEMORY_COST, ARGON2_V2_TEST_TIME_COST, ARGON2_V2_TEST_PARALLELISM, ROOT_SALT_V2
+            )
+        return Argon2Params(ARGON2_V2_MEMORY_COST, ARGON2_V2_TIME_COST, ARGON2_V2_PARALLELISM, ROOT_SALT_V2)
+    raise ValueError(f"Unknown derivation scheme: {scheme}")
+
+
+def _argon2id_into(secret, params: Argon2Params, out: memoryview, arena: Optional[Argon2Arena] = None) -> None:
+    """
+    Run Argon2id through the context API, writing the hash into ``out``.
+
+    Unlike ``hash_secret_raw``, which copies the secret into a fresh C
+    buffer and returns the hash as immutable ``bytes``, this passes both
+    buffers to argon2 by pointer. With an ``arena`` the block matrix is
+    placed in its pre-faulted region instead of a fresh malloc.
+    """
+    if arena is not None:
+        with arena.lease(block_matrix_bytes(params.memory_cost, params.parallelism)) as callbacks:
+            _argon2id_ctx(secret, params, out, callbacks)
+    else:
+        _argon2id_ctx(secret, params, out, None)
+
+
+def _argon2id_ctx(secret, params: Argon2Params, out: memoryview, callbacks) -> None:
+    """Build an argon2_context (with optional allocator callbacks) and run it."""
+    ffi, lib = low_level.ffi, low_level.lib
+    c_secret = ffi.from_buffer("uint8_t[]", secret)
+    c_salt = ffi.new("uint8_t[]", params.salt)
+    c_out = ffi.from_buffer("uint8_t[]", out, require_writable=True)
+    allocate_cbk, free_cbk = callbacks or (ffi.NULL, ffi.NULL)
+
+    ctx = ffi.new("argon2_context *", dict(
+        out=c_out,
+        outlen=len(out),
+        pwd=c_secret,
+        pwdlen=len(secret),
+        salt=c_salt,
+        saltlen=len(params.salt),
+        secret=ffi.NULL,
+        secretlen=0,
+        ad=ffi.NULL,
+        adlen=0,
+        t_cost=params.time_cost,
+        m_cost=params.memory_cost,
+        lanes=params.parallelism,
+        threads=params.parallelism,
+        version=low_level.ARGON2_VERSION,
+        allocate_cbk=allocate_cbk,
+        free_cbk=free_cbk,
+        flags=lib.ARGON2_DEFAULT_FLAGS,
+    ))
+    rv = low_level.core(ctx, low_level.Type.ID.value)
+    if rv != lib.ARGON2_OK:
+        raise low_level.HashingError(low_level.error_to_str(rv))
+
+
+def derive_master_key(
+    root_phrase: PhraseBuffer,
+    test_mode: bool = False,
+    scheme: str = SCHEME_VERSION,
+    out: Optional[SecureBuffer] = None,
+    arena: Optional[Argon2Arena] = None,
+) -> Union[bytes, SecureBuffer]:
     """
     Derive the master key from a root phrase using Argon2id.
     
@@ -26,69 +130,284 @@ def derive_master_key(root_phrase: str, test_mode: bool = False) -> bytes:
     The master key is used to derive all child keys via HMAC-SHA256.
     
     Args:
-        root_phrase: The user's root phrase (will be normalised)
+        root_phrase: The user's root phrase as ``str`` or UTF-8 bytes (will
+            be normalised); pass a bytearray or SecureBuffer view to keep
+            the phrase wipeable end to end
         test_mode: If True, use faster parameters for testing
+        scheme: Derivation scheme (default: V1)
+        out: Optional 32-byte SecureBuffer to receive the key; argon2
+            writes into it directly and no ``bytes`` copy is made
+        arena: Optional Argon2Arena to hold argon2's working memory; reuse
+            one across derivations to skip the allocation and page faults
         
     Returns:
-        32-byte master key
+        32-byte master key (``out`` itself if given)
         
     Security notes:
     - Root phrase is normalised (trimmed, lowercased, whitespace collapsed)
     - Argon2id provides memory-hard KDF protection
     - Best-effort memory clearing after derivation
     """
-    # Normalise the root phrase
-    normalised_phrase = normalise_phrase(root_phrase)
+    params = scheme_params(scheme, test_mode)
+    if out is not None and len(out) != ARGON2_HASH_LENGTH:
+        raise ValueError(f"Output buffer must be {ARGON2_HASH_LENGTH} bytes")
     
-    # Convert to bytes for Argon2
-    phrase_bytes = normalised_phrase.encode('utf-8')
-    
-    try:
-        # Select parameters based on mode
-        if test_mode:
-            memory_cost = ARGON2_TEST_MEMORY_COST
-            time_cost = ARGON2_TEST_TIME_COST
-            parallelism = ARGON2_TEST_PARALLELISM
-        else:
-            memory_cost = ARGON2_MEMORY_COST
-            time_cost = ARGON2_TIME_COST
-            parallelism = ARGON2_PARALLELISM
+    # Normalise straight into locked memory and hand argon2 that buffer by
+    # pointer: no str or bytes copy of the normalised phrase exists
+    with SecureBuffer(max(1, max_normalised_length(root_phrase))) as phrase_buffer:
+        with stage("normalise"):
+            length = normalise_phrase_into(root_phrase, phrase_buffer.view)
         
-        # Derive master key using Argon2id
-        master_key = low_level.hash_secret_raw(
-            secret=phrase_bytes,
-            salt=ROOT_SALT_V1,
-            time_cost=time_cost,
-            memory_cost=memory_cost,
-            parallelism=parallelism,
-            hash_len=ARGON2_HASH_LENGTH,
-            type=low_level.Type.ID,  # Argon2id
-        )
-        
-        return master_key
-        
-    finally:
-        # Best-effort memory clearing
-        secure_clear_string(normalised_phrase)
-        secure_clear_bytes(phrase_bytes)
+        key = out if out is not None else SecureBuffer(ARGON2_HASH_LENGTH)
+        try:
+            with stage("argon2"):
+                _argon2id_into(phrase_buffer.view[:length], params, key.view, arena)
+            return out if out is not None else bytes(key.view)
+        finally:
+            if out is None:
+                key.close()
 
 
-def hkdf_child(master_key: bytes, label: str, out_len: int = 32) -> bytes:
+def hkdf_child(
+    master_key: Union[bytes, SecureBuffer],
+    label: str,
+    out_len: int = 32,
+    out: Optional[SecureBuffer] = None,
+) -> Union[bytes, SecureBuffer]:
     """
     Derive a child key from the master key using HMAC-SHA256.
     
-    Simple HKDF-style derivation for domain separation.
+    Simple HKDF-style derivation for domain separation. Outputs longer than
+    32 bytes are expanded with ``ChildKeyStream``; the first 32 bytes are
+    always the plain HMAC, so shorter outputs are a prefix of longer ones.
     
     Args:
         master_key: Master key from derive_master_key()
         label: Domain label (e.g., "HOT_PHRASE_V1", "COLD_PHRASE_V1")
         out_len: Output length in bytes (default: 32)
+        out: Optional SecureBuffer to receive the key (its length
+            overrides ``out_len``); the intermediate digest is wiped
         
     Returns:
-        Child key of specified length
+        Child key of specified length (``out`` itself if given)
+    """
+    if out is not None:
+        child = hkdf_child(master_key, label, len(out))
+        out.view[:] = child
+        secure_clear_bytes(child)
+        return out
+    with stage("hkdf"):
+        if out_len > HKDF_BLOCK_SIZE or not isinstance(master_key, (bytes, bytearray)):
+            return KeyedPRF(master_key).derive(label, out_len)
+        label_bytes = label.encode('utf-8')
+        return hmac.new(master_key, label_bytes, hashlib.sha256).digest()[:out_len]
+
+
+# HMAC-SHA256 output size and the HKDF-Expand block limit
+HKDF_BLOCK_SIZE = 32
+HKDF_MAX_BLOCKS = 255
+
+
+class KeyedPRF:
+    """
+    Reusable HMAC-SHA256 PRF keyed on a master key.
+
+    HMAC pads and hashes the key into an inner and an outer SHA-256 state
+    before any message is processed. ``hmac.new`` repeats that key schedule
+    on every call; this object computes both states once and clones them
+    for each label, so deriving many children from one master key only
+    pays for the label compression and the outer finalisation.
+
+    Output is byte-identical to ``hkdf_child``.
+
+    The two hash states are key-equivalent (they compute any HMAC under
+    the key), and hashlib offers no way to overwrite them. ``clear()``
+    drops them so CPython frees them at once; the freed memory is not
+    zeroed.
+
+    Example:
+        >>> prf = KeyedPRF(master_key)
+        >>> hot = prf.derive(LABEL_HOT)
+        >>> cold = prf.derive(LABEL_COLD)
+    """
+
+    __slots__ = ("_inner", "_outer")
+
+    _BLOCK_SIZE = 64  # SHA-256 block size in bytes
+
+    def __init__(self, key: Union[bytes, bytearray, memoryview, SecureBuffer]):
+        if isinstance(key, SecureBuffer):
+            key = key.view
+        # RFC 2104: keys longer than the block size are hashed first,
+        # shorter keys are zero-padded to the block size.
+        if len(key) > self._BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        padded = bytearray(self._BLOCK_SIZE)
+        padded[:len(key)] = key
+        ipad = bytearray(b ^ 0x36 for b in padded)
+        opad = bytearray(b ^ 0x5C for b in padded)
+
+        self._inner = hashlib.sha256(ipad)
+        self._outer = hashlib.sha256(opad)
+
+        # Only the hash states keep key material from here on
+        for buf in (padded, ipad, opad):
+            buf[:] = bytes(self._BLOCK_SIZE)
+
+    def digest(self, message: bytes) -> bytes:
+        """
+        Compute HMAC-SHA256(key, message).
+
+        Args:
+            message: Message to authenticate
+
+        Returns:
+            32-byte MAC
+
+        Raises:
+            ValueError: If the PRF has been cleared
+        """
+        if self._inner is None:
+            raise ValueError("KeyedPRF has been cleared")
+        inner = self._inner.copy()
+        inner.update(message)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def derive(self, label: str, out_len: int = 32) -> bytes:
+        """
+        Derive a child key for a single label.
+
+        Args:
+            label: Domain label (e.g., "HOT_PHRASE_V1")
+            out_len: Output length in bytes (default: 32)
+
+        Returns:
+            Child key of specified length
+        """
+        if out_len > HKDF_BLOCK_SIZE:
+            return ChildKeyStream(self, label).read(out_len)
+        return self.digest(label.encode('utf-8'))[:out_len]
+
+    def clear(self) -> None:
+        """Drop the key schedule (freed, not wiped; see the class docstring)."""
+        self._inner = None
+        self._outer = None
+
+
+class ChildKeyStream:
+    """
+    Lazily expanded child key output for one label.
+
+    Produces an arbitrarily long (up to 255 blocks) byte stream per label
+    in 32-byte blocks, computed on demand and cached:
+
+        T(1) = HMAC(master_key, label)
+        T(n) = HMAC(master_key, T(n-1) || label || n)    for n >= 2
+
+    T(1) is exactly the ``hkdf_child`` output, so every existing 32-byte
+    child key is a prefix of its stream. Later blocks follow HKDF-Expand
+    (RFC 5869) chaining with the master key as PRK and the label as info.
+
+    Example:
+        >>> stream = ChildKeyStream(master_key, "ssh")
+        >>> stream.read(32) == hkdf_child(master_key, "ssh")
+        True
+        >>> more = stream.read(16)  # next 16 bytes, no recomputation
+    """
+
+    __slots__ = ("_prf", "_label", "_blocks", "_pos")
+
+    def __init__(self, master_key, label: str):
+        """
+        Args:
+            master_key: Master key bytes, or a KeyedPRF to reuse its key schedule
+            label: Domain label
+        """
+        self._prf = master_key if isinstance(master_key, KeyedPRF) else KeyedPRF(master_key)
+        self._label = label.encode('utf-8')
+        self._blocks: List[bytearray] = []
+        self._pos = 0
+
+    def _compute(self, index: int) -> None:
+        """Compute and cache blocks up to ``index``."""
+        if index >= HKDF_MAX_BLOCKS:
+            raise ValueError(f"Child key stream is limited to {HKDF_MAX_BLOCKS} blocks")
+        while len(self._blocks) <= index:
+            n = len(self._blocks) + 1
+            if n == 1:
+                digest = self._prf.digest(self._label)
+            else:
+                digest = self._prf.digest(self._blocks[-1] + self._label + bytes([n]))
+            self._blocks.append(bytearray(digest))
+            secure_clear_bytes(digest)
+
+    def block(self, index: int) -> bytes:
+        """
+        Get a 32-byte block of the stream (0-based), computing it if needed.
+
+        The cache is private: each call returns a new ``bytes`` object,
+        which ``clear()`` does not touch.
+
+        Raises:
+            ValueError: If the index exceeds the HKDF limit of 255 blocks
+        """
+        self._compute(index)
+        return bytes(self._blocks[index])
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over blocks from the start of the stream."""
+        for index in range(HKDF_MAX_BLOCKS):
+            yield self.block(index)
+
+    def read(self, size: int) -> bytes:
+        """
+        Read the next ``size`` bytes of the stream.
+
+        Args:
+            size: Number of bytes to read
+
+        Returns:
+            The next ``size`` bytes, as a new object
+        """
+        if size <= 0:
+            return b""
+        start, end = self._pos, self._pos + size
+        first, last = start // HKDF_BLOCK_SIZE, (end - 1) // HKDF_BLOCK_SIZE
+        self._compute(last)
+        offset = start - first * HKDF_BLOCK_SIZE
+        data = bytearray().join(self._blocks[first:last + 1])
+        try:
+            self._pos = end
+            return bytes(memoryview(data)[offset:offset + size])
+        finally:
+            secure_clear_bytes(data)
+
+    def clear(self) -> None:
+        """Wipe the cached blocks; keys already returned are not affected."""
+        for block in self._blocks:
+            secure_clear_bytes(block)
+        self._blocks = []
+
+
+def derive_children(master_key: Union[bytes, SecureBuffer], labels: Iterable[str], out_len: int = 32) -> List[bytes]:
+    """
+    Derive child keys for many labels from one master key.
+
+    Equivalent to ``[hkdf_child(master_key, label, out_len) for label in labels]``
+    but the HMAC key schedule is computed once (see ``KeyedPRF``).
+
+    Args:
+        master_key: Master key from derive_master_key()
+        labels: Domain labels to derive
+        out_len: Output length in bytes (default: 32)
+
+    Returns:
+        Child keys, in the same order as ``labels``
     """
-    label_bytes = label.encode('utf-8')
-    return hmac.new(master_key, label_bytes, hashlib.sha256).digest()[:out_len]
+    prf = KeyedPRF(master_key)
+    return [prf.derive(label, out_len) for label in labels]
 
 
 # Backwards compatibility alias
@@ -0,0 +1,279 @@
+"""Lightweight per-stage instrumentation for the derivation pipeline.
+
+Pipeline functions in ``derive`` and ``wordlist`` wrap their work in
+``stage(name)``. Listeners receive only the stage name and its duration
+or memory figures, never any secret content. With nothing registered,
+``stage()`` returns a shared no-op context manager, so the cost is one
+function call.
+
+Example:
+    >>> with collect_timings() as timings:
+    ...     derive_master_key(phrase)
+    >>> timings
+    [('normalise', 2.1e-06), ('argon2', 0.61)]
+
+    >>> with collect_memory() as report:
+    ...     derive_master_key(phrase)
+    >>> report.peak_rss_kib
+    270412
+"""
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+StageListener = Callable[[str, float], None]
+
+_listeners: List[StageListener] = []
+_memory_reports: List["MemoryReport"] = []
+
+
+def _read_status_kib(field: str) -> Optional[int]:
+    """Read a KiB field (e.g. ``VmHWM``) from ``/proc/self/status``."""
+    prefix = field + ":"
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith(prefix):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def peak_rss_kib() -> Optional[int]:
+    """
+    Return the peak resident set size of this process, in KiB.
+
+    Reads ``VmHWM`` from ``/proc/self/status`` on Linux and falls back to
+    ``resource.getrusage``.
+
+    Returns:
+        Peak RSS in KiB, or None if it cannot be determined
+    """
+    peak = _read_status_kib("VmHWM")
+    if peak is not None:
+        return peak
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux and the BSDs report KiB
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except (ImportError, OSError):
+        return None
+
+
+def current_rss_kib() -> Optional[int]:
+    """
+    Return the current resident set size of this process, in KiB.
+
+    Returns:
+        RSS in KiB, or None if it cannot be determined (non-Linux)
+    """
+    return _read_status_kib("VmRSS")
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the kernel's peak RSS counter to the current RSS.
+
+    Writes ``5`` to ``/proc/self/clear_refs`` (Linux 4.0+), so a
+    following ``peak_rss_kib()`` covers only what happened since.
+
+    Returns:
+        True if the counter was reset
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class StageMemory(NamedTuple):
+    """Memory figures for one pipeline stage."""
+
+    name: str
+    rss_before_kib: Optional[int]
+    rss_after_kib: Optional[int]
+    # Process RSS high-water mark during the stage (since process start
+    # where the counter cannot be reset)
+    peak_rss_kib: Optional[int]
+    # Python heap growth left behind by the stage, per tracemalloc
+    py_delta_bytes: int
+    # Largest Python heap growth seen during the stage
+    py_peak_bytes: int
+
+
+class MemoryReport:
+    """
+    Per-stage memory accounting filled in by ``collect_memory()``.
+
+    Attributes:
+        stages: ``StageMemory`` records in completion order
+        peak_rss_kib: Highest RSS seen over the whole collection
+        peak_is_scoped: True if stage peaks were measured from the stage
+            start (the peak counter could be reset)
+    """
+
+    def __init__(self):
+        self.stages: List[StageMemory] = []
+        self.peak_rss_kib: Optional[int] = None
+        self.peak_is_scoped = False
+
+    def _observe_peak(self, peak: Optional[int]) -> None:
+        if peak is not None and (self.peak_rss_kib is None or peak > self.peak_rss_kib):
+            self.peak_rss_kib = peak
+
+
+class _NullStage:
+    """No-op stage used when instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Measures one stage and reports it to every listener on exit."""
+
+    __slots__ = ("name", "_start", "_rss", "_py")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = 0.0
+        self._rss: Optional[int] = None
+        self._py = 0
+
+    def __enter__(self):
+        if _memory_reports:
+            for report in _memory_reports:
+                report._observe_peak(peak_rss_kib())
+            reset_peak_rss()
+            self._rss = current_rss_kib()
+            if tracemalloc.is_tracing():
+                self._py = tracemalloc.get_traced_memory()[0]
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        for listener in list(_listeners):
+            listener(self.name, elapsed)
+        if _memory_reports:
+            py_now, py_peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+            record = StageMemory(
+                name=self.name,
+                rss_before_kib=self._rss,
+                rss_after_kib=current_rss_kib(),
+                peak_rss_kib=peak_rss_kib(),
+                py_delta_bytes=py_now - self._py,
+                py_peak_bytes=max(0, py_peak - self._py),
+            )
+            for report in _memory_reports:
+                report.stages.append(record)
+                report._observe_peak(record.peak_rss_kib)
+        return False
+
+
+def stage(name: str):
+    """
+    Context manager marking a pipeline stage.
+
+    Stages are siblings, not nested: memory collection resets the peak
+    counters when a stage starts.
+
+    Args:
+        name: Stage name (e.g., "argon2", "wordlist_load")
+
+    Returns:
+        A context manager; a shared no-op when nothing is listening
+    """
+    if not _listeners and not _memory_reports:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def add_stage_listener(listener: StageListener) -> None:
+    """
+    Register a callback receiving ``(stage_name, seconds)`` per stage.
+
+    Durations come from ``time.perf_counter`` (monotonic).
+    """
+    _listeners.append(listener)
+
+
+def remove_stage_listener(listener: StageListener) -> None:
+    """Unregister a callback added with add_stage_listener()."""
+    try:
+        _listeners.remove(listener)
+    except ValueError:
+        pass
+
+
+@contextmanager
+def collect_timings() -> Iterator[List[Tuple[str, float]]]:
+    """
+    Collect stage timings for the duration of a ``with`` block.
+
+    Yields:
+        A list that fills with ``(stage_name, seconds)`` tuples in
+        completion order
+    """
+    records: List[Tuple[str, float]] = []
+
+    def listener(name: str, seconds: float) -> None:
+        records.append((name, seconds))
+
+    add_stage_listener(listener)
+    try:
+        yield records
+    finally:
+        remove_stage_listener(listener)
+
+
+@contextmanager
+def collect_memory(trace_python: bool = True) -> Iterator[MemoryReport]:
+    """
+    Collect per-stage memory figures for the duration of a ``with`` block.
+
+    Argon2 allocates its memory in C, so it shows up in the RSS figures;
+    tracemalloc covers the Python heap. Repeating a derivation inside one
+    collection and comparing ``py_delta_bytes`` / ``rss_after_kib`` across
+    runs exposes leaks. The C allocator may keep a freed Argon2 arena
+    resident, in which case only the first run shows RSS growth.
+
+    Args:
+        trace_python: Start tracemalloc (if not already running) for the
+            Python heap figures; it slows allocation-heavy code noticeably
+
+    Yields:
+        A ``MemoryReport`` that fills in as stages complete
+    """
+    report = MemoryReport()
+    report._observe_peak(peak_rss_kib())
+    report.peak_is_scoped = reset_peak_rss()
+    started = trace_python and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    _memory_reports.append(report)
+    try:
+        yield report
+    finally:
+        _memory_reports.remove(report)
+        report._observe_peak(peak_rss_kib())
+        if started:
+            tracemalloc.stop()
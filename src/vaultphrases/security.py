@@ -1,8 +1,27 @@
 """Security utilities for vaultphrases."""
 
 import ctypes
+import ctypes.util
+import hmac
+import mmap
 import sys
-from typing import Optional
+from typing import Optional, Union
+
+
+def _argument_refcount(s: object) -> int:
+    """Reference count of an argument, seen from inside the callee."""
+    return sys.getrefcount(s)
+
+
+def _owned_refcount() -> int:
+    """Reference count of an object held only by the caller's local variable."""
+    owned = "".join(("vault", "phrases"))
+    return _argument_refcount(owned)
+
+
+# Measured rather than hard-coded: call conventions differ between versions
+_OWNED_REFCOUNT = _owned_refcount()
+
 
 def secure_clear_string(s: str) -> None:
     """
@@ -10,49 +29,240 @@ def secure_clear_string(s: str) -> None:
     
     Note: Python strings are immutable, so this is not guaranteed to work
     in all cases. This is a defense-in-depth measure.
+    
+    Only the character payload of compact ASCII strings is overwritten;
+    the object header is left intact. The string is only touched when
+    the caller's variable is its sole reference: a string that is also
+    referenced elsewhere (an alias, a container, an interned or immortal
+    string) is skipped, since overwriting it would corrupt other users.
+    Strings of length 0 or 1 are interpreter-wide singletons and are
+    skipped. Call it on strings you created and hold in one variable,
+    never on literals.
     """
     try:
-        # Get the string's buffer address
-        if sys.version_info >= (3, 0):
-            # Python 3: strings are Unicode objects
-            str_address = id(s)
-            str_size = sys.getsizeof(s)
-            # Overwrite memory with zeros
-            ctypes.memset(str_address, 0, str_size)
+        if len(s) <= 1 or not s.isascii():
+            return
+        if sys.getrefcount(s) > _OWNED_REFCOUNT:
+            return
+        # Compact ASCII layout: header, then len(s) chars, then a NUL
+        data_address = id(s) + sys.getsizeof(s) - len(s) - 1
+        ctypes.memset(data_address, 0, len(s))
     except Exception:
         # If clearing fails, we can't do much about it
         # Don't raise - this is best-effort only
         pass
 
 
-def secure_clear_bytes(b: Optional[bytes]) -> None:
+def secure_clear_bytes(b: Optional[Union[bytes, bytearray, memoryview]]) -> None:
     """
     Best-effort attempt to clear bytes from memory.
     
     Note: This is not guaranteed to work in all cases due to Python's
     memory management, but it's a defense-in-depth measure.
     
-    WARNING: This may cause issues in some Python implementations.
-    Use with caution and only when absolutely necessary.
+    Mutable buffers (bytearray, writable memoryview) are zeroed in one
+    bulk write. Immutable bytes are overwritten in place, which is
+    implementation-dependent, and only when the caller's variable is the
+    sole reference: like secure_clear_string(), bytes that are also held
+    elsewhere (returned to another caller, cached, stored in a container)
+    are skipped rather than zeroed under their other users. Single-byte
+    and empty bytes objects are interpreter-wide singletons and are
+    skipped. Prefer SecureBuffer for keys so that this fallback is not
+    needed.
     """
     if b is None:
         return
     
     try:
-        # Attempt to overwrite the bytes object's buffer
-        # Note: This is implementation-dependent and may not work in all cases
-        if isinstance(b, (bytes, bytearray)):
-            # For bytearray, we can directly modify
-            if isinstance(b, bytearray):
-                for i in range(len(b)):
-                    b[i] = 0
-            else:
-                # For bytes, try to access the underlying buffer
-                # This is a best-effort approach
-                buf_address = id(b) + sys.getsizeof(b) - len(b)
-                ctypes.memset(buf_address, 0, len(b))
+        if isinstance(b, bytearray):
+            b[:] = bytes(len(b))
+        elif isinstance(b, memoryview):
+            if not b.readonly:
+                b[:] = bytes(b.nbytes)
+        elif isinstance(b, bytes) and len(b) > 1:
+            if sys.getrefcount(b) > _OWNED_REFCOUNT:
+                return
+            # Bytes layout: header, then len(b) bytes, then a NUL
+            buf_address = id(b) + sys.getsizeof(b) - len(b) - 1
+            ctypes.memset(buf_address, 0, len(b))
     except Exception:
         # If clearing fails, we can't do much about it
         # Don't raise - this is best-effort only
         pass
 
+
+def _load_libc():
+    """Load the C library for mlock/munlock, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.mlock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        libc.munlock.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        return libc
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+_libc = _load_libc()
+
+# Transparent huge page size on x86-64 and most arm64 kernels
+HUGE_PAGE_SIZE = 2 * 1024 * 1024
+
+
+class SecureBuffer:
+    """
+    Fixed-size buffer for secrets in locked, non-dumpable memory.
+    
+    The buffer lives in its own anonymous ``mmap`` (rounded up to whole
+    pages) rather than on the Python heap, so the allocator never copies
+    or reuses it behind our back. Where the platform allows it the pages
+    are:
+    
+    - ``mlock``ed, so they are never written to swap
+    - marked ``MADV_DONTDUMP``, so they are left out of core dumps
+    
+    With ``huge_pages=True`` the mapping is private, rounded up to whole
+    2 MiB pages and advised ``MADV_HUGEPAGE``, so a large buffer is backed
+    by transparent huge pages where the kernel allows it. With
+    ``populate=True`` every page is faulted in up front (``mlock`` already
+    does this; otherwise ``MAP_POPULATE`` or one write pass), so first use
+    pays no page faults.
+    
+    ``clear()`` zeroes the whole buffer with a single ``memset``. The
+    buffer is cleared and unmapped on ``close()``, on context-manager exit
+    and when garbage collected.
+    
+    Use ``view`` to read or write the contents; avoid ``bytes(buf.view)``,
+    which makes an immutable copy.
+    
+    Example:
+        >>> with SecureBuffer(32) as key:
+        ...     key.view[:] = os.urandom(32)
+    """
+
+    __slots__ = ("_mmap", "_array", "_size", "_capacity", "locked", "dontdump", "huge_pages")
+
+    def __init__(self, size: int, huge_pages: bool = False, populate: bool = False):
+        if size < 1:
+            raise ValueError("SecureBuffer size must be positive")
+        page = HUGE_PAGE_SIZE if huge_pages else mmap.PAGESIZE
+        self._size = size
+        self._capacity = -(-size // page) * page
+        if huge_pages and hasattr(mmap, "MAP_PRIVATE"):
+            # Shared anonymous memory is shmem, which only gets huge pages
+            # if the admin enabled them for shmem
+            self._mmap = mmap.mmap(-1, self._capacity, flags=mmap.MAP_PRIVATE)
+        elif populate and hasattr(mmap, "MAP_POPULATE"):
+            self._mmap = mmap.mmap(-1, self._capacity, flags=mmap.MAP_SHARED | mmap.MAP_POPULATE)
+        else:
+            self._mmap = mmap.mmap(-1, self._capacity)
+        self._array = (ctypes.c_char * self._capacity).from_buffer(self._mmap)
+
+        # Must precede the first fault (mlock or populate) to take effect
+        self.huge_pages = False
+        if huge_pages and hasattr(mmap, "MADV_HUGEPAGE") and hasattr(self._mmap, "madvise"):
+            try:
+                self._mmap.madvise(mmap.MADV_HUGEPAGE)
+                self.huge_pages = True
+            except OSError:
+                pass
+
+        self.locked = False
+        if _libc is not None:
+            self.locked = _libc.mlock(ctypes.addressof(self._array), self._capacity) == 0
+
+        self.dontdump = False
+        if hasattr(mmap, "MADV_DONTDUMP") and hasattr(self._mmap, "madvise"):
+            try:
+                self._mmap.madvise(mmap.MADV_DONTDUMP)
+                self.dontdump = True
+            except OSError:
+                pass
+
+        if populate and not self.locked and (huge_pages or not hasattr(mmap, "MAP_POPULATE")):
+            self.clear()
+
+    @classmethod
+    def from_bytes(cls, data) -> "SecureBuffer":
+        """
+        Copy a bytes-like object into a new SecureBuffer.
+        
+        The source is not cleared; wipe it yourself if it is mutable.
+        """
+        buf = cls(len(data))
+        buf.view[:] = data
+        return buf
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        """True once the buffer has been cleared and unmapped."""
+        return self._mmap is None
+
+    @property
+    def address(self) -> int:
+        """Address of the first byte, for handing the buffer to C code."""
+        if self._array is None:
+            raise ValueError("SecureBuffer is closed")
+        return ctypes.addressof(self._array)
+
+    @property
+    def view(self) -> memoryview:
+        """Writable memoryview of the buffer contents."""
+        if self._mmap is None:
+            raise ValueError("SecureBuffer is closed")
+        return memoryview(self._mmap)[:self._size]
+
+    def hex(self) -> str:
+        """Hex string of the contents (debugging and test vectors only)."""
+        return self.view.hex()
+
+    def __eq__(self, other) -> bool:
+        """Constant-time comparison against another buffer or bytes-like object."""
+        if isinstance(other, SecureBuffer):
+            other = other.view
+        try:
+            return hmac.compare_digest(self.view, other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def clear(self) -> None:
+        """Zero the whole buffer in one call."""
+        if self._array is not None:
+            ctypes.memset(ctypes.addressof(self._array), 0, self._capacity)
+
+    def close(self) -> None:
+        """Clear, unlock and unmap the buffer. Safe to call more than once."""
+        if self._mmap is None:
+            return
+        self.clear()
+        if self.locked and _libc is not None:
+            _libc.munlock(ctypes.addressof(self._array), self._capacity)
+            self.locked = False
+        self._array = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A memoryview is still alive; the contents are already zeroed
+            # and the mapping is released when the last view goes away.
+            pass
+        self._mmap = None
+
+    def __enter__(self) -> "SecureBuffer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __repr__(self) -> str:
+        state = "closed" if self._mmap is None else f"{self._size} bytes"
+        return f"<SecureBuffer {state}, locked={self.locked}>"
@@ -0,0 +1,200 @@
+"""Interactive session: derive the master key once, then serve many labels.
+
+Each line typed at the prompt is a label; its phrase is rendered from the
+master key held in a ``SecureBuffer``. Commands start with a colon:
+
+    :words N    set the number of words per phrase (1 to MAX_WORD_COUNT)
+    :labels     list labels used in this session
+    :clear      clear the screen
+    :quit       wipe the key and exit (also Ctrl-D)
+
+Labels complete with Tab (when ``readline`` is available). The label
+history lives in memory only. After ``idle_timeout`` seconds without
+input the session wipes the key and exits.
+"""
+
+import signal
+from typing import Callable, List, Optional, Sequence
+
+from .constants import DEFAULT_DELIMITER, DEFAULT_SESSION_TIMEOUT, DEFAULT_WORD_COUNT, LABEL_COLD, LABEL_HOT, MAX_WORD_COUNT
+from .derive import ChildKeyStream, KeyedPRF
+from .security import SecureBuffer
+from .wordlist import blocks_to_phrase
+
+PROMPT = "label> "
+
+
+class SessionTimeout(Exception):
+    """Raised inside the prompt when the idle timeout expires."""
+    pass
+
+
+class Session:
+    """
+    Serve phrases for many labels from one master key.
+
+    Example:
+        >>> with Session(master_key, words) as session:
+        ...     session.phrase("ssh")
+        'tutu-sniff-xerox-lyric-pasta-pull'
+    """
+
+    def __init__(
+        self,
+        master_key: SecureBuffer,
+        words: Sequence[str],
+        word_count: int = DEFAULT_WORD_COUNT,
+        delimiter: str = DEFAULT_DELIMITER,
+        idle_timeout: int = DEFAULT_SESSION_TIMEOUT,
+    ):
+        """
+        Args:
+            master_key: Master key; the session takes ownership and closes it
+            words: Wordlist to render phrases from
+            word_count: Initial words per phrase
+            delimiter: String to join words with
+            idle_timeout: Seconds without input before the key is wiped
+                (0 disables the timeout)
+        """
+        self._master_key = master_key
+        self._prf: Optional[KeyedPRF] = KeyedPRF(master_key)
+        self.words = words
+        self.word_count = word_count
+        self.delimiter = delimiter
+        self.idle_timeout = idle_timeout
+        self.labels: List[str] = [LABEL_HOT, LABEL_COLD]
+
+    @property
+    def closed(self) -> bool:
+        """True once the master key has been wiped."""
+        return self._prf is None
+
+    def phrase(self, label: str) -> str:
+        """
+        Render the phrase for a label and remember the label.
+
+        Raises:
+            ValueError: If the session is closed
+        """
+        if self._prf is None:
+            raise ValueError("Session is closed")
+        stream = ChildKeyStream(self._prf, label)
+        try:
+            phrase = blocks_to_phrase(stream, self.words, self.word_count, self.delimiter)
+        finally:
+            stream.clear()
+        if label not in self.labels:
+            self.labels.append(label)
+        return phrase
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer over the label history."""
+        matches = [label for label in self.labels if label.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    def handle(self, line: str) -> Optional[str]:
+        """
+        Process one input line.
+
+        Returns:
+            Text to show, or None to end the session
+        """
+        line = line.strip()
+        if not line:
+            return ""
+        if not line.startswith(":"):
+            return self.phrase(line)
+
+        command, _, argument = line.partition(" ")
+        if command in (":quit", ":q", ":exit"):
+            return None
+        if command == ":labels":
+            return "\n".join(self.labels)
+        if command == ":words":
+            usage = f"usage: :words N (1-{MAX_WORD_COUNT})"
+            try:
+                count = int(argument)
+            except ValueError:
+                return usage
+            if not 1 <= count <= MAX_WORD_COUNT:
+                return usage
+            self.word_count = count
+            return f"{count} words per phrase"
+        if command == ":clear":
+            return "\033[2J\033[3J\033[H"
+        return f"unknown command {command} (:words N, :labels, :clear, :quit)"
+
+    def run(self, read: Callable[[str], str] = input, write: Callable[[str], None] = print) -> str:
+        """
+        Read labels until :quit, end of input or idle timeout.
+
+        Args:
+            read: Prompt function (default: input)
+            write: Output function (default: print)
+
+        Returns:
+            Why the session ended: "quit", "eof" or "timeout"
+        """
+        readline = _setup_readline(self.complete) if read is input else None
+        alarm = self.idle_timeout > 0 and hasattr(signal, "SIGALRM")
+        previous = signal.signal(signal.SIGALRM, _raise_timeout) if alarm else None
+        try:
+            while True:
+                if alarm:
+                    signal.alarm(self.idle_timeout)
+                try:
+                    line = read(PROMPT)
+                except EOFError:
+                    return "eof"
+                except SessionTimeout:
+                    return "timeout"
+                finally:
+                    if alarm:
+                        signal.alarm(0)
+                output = self.handle(line)
+                if output is None:
+                    return "quit"
+                if output:
+                    write(output)
+        finally:
+            if alarm:
+                signal.signal(signal.SIGALRM, previous)
+            if readline is not None:
+                readline.set_completer(None)
+                readline.clear_history()
+            self.close()
+
+    def close(self) -> None:
+        """
+        Wipe the master key and drop the keyed PRF.
+
+        The PRF's SHA-256 states are key-equivalent and hashlib cannot
+        overwrite them; they are released here and freed at once, but the
+        freed memory is not zeroed (see ``KeyedPRF``).
+        """
+        if self._prf is not None:
+            self._prf.clear()
+            self._prf = None
+        self._master_key.close()
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _raise_timeout(signum, frame):
+    raise SessionTimeout()
+
+
+def _setup_readline(completer):
+    """Enable Tab completion if readline is available."""
+    try:
+        import readline
+    except ImportError:
+        return None
+    readline.set_completer(completer)
+    readline.set_completer_delims("")
+    readline.parse_and_bind("tab: complete")
+    return readline
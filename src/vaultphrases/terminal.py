@@ -0,0 +1,182 @@
+"""Read a secret from the terminal into a SecureBuffer, one byte at a time.
+
+``getpass`` returns the phrase as a ``str``, which can never be wiped
+reliably. ``read_secret_into`` puts the terminal in raw mode (no echo, no
+line editing, no signals) and reads every keystroke with ``os.readv``
+straight into a caller-owned buffer, so the phrase only ever exists in
+that buffer. Line editing is done in place:
+
+    Backspace            remove the last character (whole UTF-8 sequence)
+    Ctrl-U               clear the line
+    Ctrl-C               raise KeyboardInterrupt
+    Ctrl-D               raise EOFError on an empty line
+    Enter                finish
+    Arrows, Delete, ...  ignored (the whole escape sequence is read and dropped)
+
+A bare Escape, or a line longer than the buffer, raises
+``TerminalInputError`` rather than deriving from a phrase that differs
+from what was typed.
+
+POSIX only; ``read_secret_into`` returns None when there is no terminal
+or no ``termios``, and the caller falls back to ``getpass``.
+"""
+
+import os
+from typing import Callable, Optional
+
+from .security import SecureBuffer
+
+# Longest root phrase accepted from the terminal, in bytes
+MAX_PHRASE_BYTES = 1024
+
+_ENTER = (0x0A, 0x0D)
+_ERASE = (0x08, 0x7F)
+_KILL_LINE = 0x15
+_INTERRUPT = 0x03
+_EOF = 0x04
+_TAB = 0x09
+_ESCAPE = 0x1B
+_BELL = b"\a"
+
+
+class TerminalInputError(ValueError):
+    """Raised when typed input cannot be taken as the phrase exactly."""
+    pass
+
+
+def read_secret_into(buffer: SecureBuffer, prompt: str = "", tty_path: str = "/dev/tty") -> Optional[int]:
+    """
+    Prompt on the terminal and read one line into ``buffer`` without echo.
+
+    Args:
+        buffer: Receives the UTF-8 bytes as typed; one byte is kept free as
+            the read slot, so at most ``len(buffer) - 1`` bytes are accepted
+        prompt: Text written to the terminal first
+        tty_path: Terminal device to use
+
+    Returns:
+        Number of bytes read, or None if no terminal is available
+
+    Raises:
+        KeyboardInterrupt: On Ctrl-C (the buffer is zeroed)
+        EOFError: On Ctrl-D at an empty line or end of input
+        TerminalInputError: On overflow or a bare Escape (the buffer is zeroed)
+    """
+    try:
+        import termios
+    except ImportError:
+        return None
+    try:
+        fd = os.open(tty_path, os.O_RDWR | os.O_NOCTTY)
+    except OSError:
+        return None
+    try:
+        try:
+            saved = termios.tcgetattr(fd)
+        except termios.error:
+            return None
+        raw = termios.tcgetattr(fd)
+        raw[3] &= ~(termios.ECHO | termios.ICANON | termios.ISIG | termios.IEXTEN)
+        raw[6][termios.VMIN] = 1
+        raw[6][termios.VTIME] = 0
+
+        os.write(fd, prompt.encode("utf-8"))
+        # TCSADRAIN keeps keystrokes typed ahead of the prompt
+        termios.tcsetattr(fd, termios.TCSADRAIN, raw)
+        try:
+            return read_line_into(fd, buffer.view)
+        finally:
+            termios.tcsetattr(fd, termios.TCSAFLUSH, saved)
+            os.write(fd, b"\n")
+    finally:
+        os.close(fd)
+
+
+def read_line_into(fd: int, view: memoryview) -> int:
+    """
+    Read keystrokes from ``fd`` into ``view`` until Enter, editing in place.
+
+    Each byte is read directly into the slot after the current line, so
+    no copy of the input is made. Rejected bytes are zeroed. See the
+    module docstring for the keys handled.
+
+    Returns:
+        Number of bytes in the line
+
+    Raises:
+        TerminalInputError: If the line does not fit in ``len(view) - 1``
+            bytes, or on an Escape that does not start a cursor-key sequence
+    """
+    slot = len(view) - 1
+    length = 0
+
+    def read_byte() -> int:
+        """Read one byte through the slot and zero it; -1 at end of input."""
+        position = min(length, slot)
+        if os.readv(fd, [view[position:position + 1]]) == 0:
+            return -1
+        code = view[position]
+        view[position] = 0
+        return code
+
+    try:
+        while True:
+            code = read_byte()
+            if code == -1:
+                if length == 0:
+                    raise EOFError()
+                return length
+            if code in _ENTER:
+                return length
+            if code == _INTERRUPT:
+                raise KeyboardInterrupt()
+            if code == _EOF:
+                if length == 0:
+                    raise EOFError()
+            elif code in _ERASE:
+                # Drop UTF-8 continuation bytes, then the lead byte
+                while length > 0:
+                    length -= 1
+                    lead = view[length] & 0xC0 != 0x80
+                    view[length] = 0
+                    if lead:
+                        break
+            elif code == _KILL_LINE:
+                view[:length] = bytes(length)
+                length = 0
+            elif code == _ESCAPE:
+                _skip_escape_sequence(read_byte)
+            elif code < 0x20 and code != _TAB:
+                # Other control characters
+                continue
+            elif length < slot:
+                view[length] = code
+                length += 1
+            else:
+                raise TerminalInputError(f"Phrase is longer than {slot} bytes")
+    except BaseException:
+        view[:] = bytes(len(view))
+        raise
+
+
+def _skip_escape_sequence(read_byte: Callable[[], int]) -> None:
+    """
+    Consume the rest of a cursor or editing key's escape sequence.
+
+    CSI sequences (ESC [ parameters final, e.g. ESC [ 3 ~ for Delete) and
+    SS3 sequences (ESC O final, arrows in application mode) are dropped.
+    Anything else is a bare Escape or an Alt chord, whose bytes cannot be
+    told apart from typed text, so it is refused.
+    """
+    introducer = read_byte()
+    if introducer == ord("O"):
+        read_byte()
+        return
+    if introducer != ord("["):
+        raise TerminalInputError("Escape is not supported while typing the phrase")
+    # Parameter and intermediate bytes are 0x20-0x3F; the final byte ends it
+    code = read_byte()
+    while 0x20 <= code <= 0x3F:
+        code = read_byte()
+    if not 0x40 <= code <= 0x7E:
+        raise TerminalInputError("Unrecognised escape sequence while typing the phrase")
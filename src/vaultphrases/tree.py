@@ -0,0 +1,129 @@
+"""Hierarchical label derivation with memoized interior keys."""
+
+from collections import OrderedDict
+from typing import Iterable, List, Tuple
+
+from .constants import LABEL_PATH_SEPARATOR
+from .derive import ChildKeyStream, KeyedPRF
+
+# Default number of interior nodes kept in memory
+DEFAULT_MAX_NODES = 4096
+
+
+def split_label_path(path: str) -> Tuple[str, ...]:
+    """
+    Split a label path into its segments.
+
+    Args:
+        path: Label path (e.g., "work/ssh/host42")
+
+    Returns:
+        Path segments
+
+    Raises:
+        ValueError: If the path or any segment is empty
+    """
+    segments = tuple(path.split(LABEL_PATH_SEPARATOR))
+    if not path or any(not segment for segment in segments):
+        raise ValueError(f"Invalid label path: {path!r}")
+    return segments
+
+
+class LabelTree:
+    """
+    Derive keys for label paths such as ``work/ssh/host42``.
+
+    Each segment is derived from its parent's key with HMAC-SHA256::
+
+        K("")        = master_key
+        K(p + "/" s) = HMAC-SHA256(K(p), s)
+
+    A single-segment path therefore gives exactly ``hkdf_child(master_key,
+    segment)``. Interior node keys are memoized (LRU, up to ``max_nodes``)
+    together with their precomputed HMAC key schedule, so deriving many
+    leaves under a shared prefix computes each interior node only once.
+    Evicted node keys are zeroized and their ``KeyedPRF`` is cleared. The
+    PRF's SHA-256 states are key-equivalent but cannot be overwritten, so
+    they are only freed (see ``KeyedPRF``). A ``stream()`` from an evicted
+    node raises ValueError if read further.
+
+    Example:
+        >>> tree = LabelTree(master_key)
+        >>> keys = tree.derive_many(f"work/ssh/host{i}" for i in range(10000))
+        >>> len(tree)  # only "work" and "work/ssh" were memoized
+        2
+    """
+
+    def __init__(self, master_key: bytes, max_nodes: int = DEFAULT_MAX_NODES):
+        self._root = KeyedPRF(master_key)
+        self._max_nodes = max(1, max_nodes)
+        self._memo: "OrderedDict[Tuple[str, ...], Tuple[bytearray, KeyedPRF]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of interior nodes currently memoized."""
+        return len(self._memo)
+
+    def _node_prf(self, segments: Tuple[str, ...]) -> KeyedPRF:
+        """Get the keyed PRF of an interior node, deriving missing ancestors."""
+        if not segments:
+            return self._root
+
+        entry = self._memo.get(segments)
+        if entry is not None:
+            self._memo.move_to_end(segments)
+            return entry[1]
+
+        parent = self._node_prf(segments[:-1])
+        key = bytearray(parent.digest(segments[-1].encode('utf-8')))
+        prf = KeyedPRF(key)
+
+        self._memo[segments] = (key, prf)
+        while len(self._memo) > self._max_nodes:
+            _, (evicted_key, evicted_prf) = self._memo.popitem(last=False)
+            evicted_key[:] = bytes(len(evicted_key))
+            evicted_prf.clear()
+        return prf
+
+    def derive(self, path: str, out_len: int = 32) -> bytes:
+        """
+        Derive the key for a label path.
+
+        Args:
+            path: Label path (e.g., "work/ssh/host42")
+            out_len: Output length in bytes (default: 32)
+
+        Returns:
+            Key of specified length
+        """
+        segments = split_label_path(path)
+        return self._node_prf(segments[:-1]).derive(segments[-1], out_len)
+
+    def derive_many(self, paths: Iterable[str], out_len: int = 32) -> List[bytes]:
+        """
+        Derive keys for many label paths, sharing interior nodes.
+
+        Args:
+            paths: Label paths
+            out_len: Output length in bytes (default: 32)
+
+        Returns:
+            Keys, in the same order as ``paths``
+        """
+        return [self.derive(path, out_len) for path in paths]
+
+    def stream(self, path: str) -> ChildKeyStream:
+        """
+        Get the expandable output stream for a label path.
+
+        The first block equals ``derive(path)``; use with
+        ``blocks_to_phrase`` to render a passphrase of any length.
+        """
+        segments = split_label_path(path)
+        return ChildKeyStream(self._node_prf(segments[:-1]), segments[-1])
+
+    def clear(self) -> None:
+        """Zeroize all memoized interior keys and clear their PRFs."""
+        for key, prf in self._memo.values():
+            key[:] = bytes(len(key))
+            prf.clear()
+        self._memo.clear()
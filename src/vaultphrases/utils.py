@@ -1,5 +1,10 @@
 """General utilities for vaultphrases."""
 
+from typing import List, Tuple, Union
+
+# Separators users put between root phrase words (None: any whitespace)
+PHRASE_SEPARATORS = (None, "-", "_", ",")
+
 
 def normalise_phrase(phrase: str) -> str:
     """
@@ -22,3 +27,160 @@ def normalise_phrase(phrase: str) -> str:
     return " ".join(phrase.strip().lower().split())
 
 
+# ASCII characters for which str.isspace() is true (str.split() splits on them)
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+PhraseBuffer = Union[str, bytes, bytearray, memoryview]
+
+
+def max_normalised_length(phrase: PhraseBuffer) -> int:
+    """
+    Upper bound on the UTF-8 length of normalise_phrase(phrase).
+
+    Size the ``out`` buffer of normalise_phrase_into() with this.
+    """
+    if _is_ascii(phrase):
+        return len(phrase)
+    # A character encodes to at most 4 bytes; lowercasing grows UTF-8 by at most 1.5x
+    return 4 * len(phrase)
+
+
+def normalise_phrase_into(phrase: PhraseBuffer, out: Union[bytearray, memoryview]) -> int:
+    """
+    Normalise a phrase straight into a writable buffer as UTF-8.
+    
+    Produces exactly ``normalise_phrase(phrase).encode('utf-8')``. ASCII
+    input (the EFF wordlists are ASCII) is lowercased and collapsed one
+    byte at a time into ``out``, so no ``str`` or ``bytes`` copy of the
+    phrase is made. ``out`` may be the input buffer itself. Other input
+    falls back to normalise_phrase(); its temporary copies are wiped
+    best-effort.
+    
+    Args:
+        phrase: Phrase as ``str`` or UTF-8 bytes
+        out: Writable buffer of at least max_normalised_length(phrase) bytes
+        
+    Returns:
+        Number of bytes written; the rest of ``out`` is zeroed
+        
+    Raises:
+        ValueError: If ``out`` is too small or ``phrase`` is not valid UTF-8
+    """
+    if not _is_ascii(phrase):
+        return _normalise_unicode_into(phrase, out)
+    if len(out) < len(phrase):
+        raise ValueError("Output buffer is too small for the normalised phrase")
+    
+    codes = map(ord, phrase) if isinstance(phrase, str) else phrase
+    length = 0
+    space = False
+    for code in codes:
+        if code in _ASCII_WHITESPACE:
+            space = length > 0
+            continue
+        if space:
+            out[length] = 0x20
+            length += 1
+            space = False
+        out[length] = code | 0x20 if 0x41 <= code <= 0x5A else code
+        length += 1
+    out[length:] = bytes(len(out) - length)
+    return length
+
+
+def _is_ascii(phrase: PhraseBuffer) -> bool:
+    if isinstance(phrase, memoryview):
+        return all(code < 0x80 for code in phrase)
+    return phrase.isascii()
+
+
+def _normalise_unicode_into(phrase: PhraseBuffer, out: Union[bytearray, memoryview]) -> int:
+    """Non-ASCII path of normalise_phrase_into() through str."""
+    from .security import secure_clear_bytes, secure_clear_string
+
+    text = phrase if isinstance(phrase, str) else bytes(phrase).decode("utf-8")
+    normalised = normalise_phrase(text)
+    encoded = normalised.encode("utf-8")
+    try:
+        if len(encoded) > len(out):
+            raise ValueError("Output buffer is too small for the normalised phrase")
+        out[:len(encoded)] = encoded
+        out[len(encoded):] = bytes(len(out) - len(encoded))
+        return len(encoded)
+    finally:
+        # normalise_phrase() returns its argument when there is nothing to change
+        if normalised is not text and normalised is not phrase:
+            secure_clear_string(normalised)
+        del normalised
+        if text is not phrase:
+            secure_clear_string(text)
+        secure_clear_bytes(encoded)
+
+
+def tokenize_phrase(phrase: str) -> List[str]:
+    """
+    Split a root phrase into words.
+    
+    Tries whitespace, '-', '_' and ',' and keeps whichever split yields
+    the most tokens (whitespace wins ties). This is the word count used
+    for the root phrase strength warning; the wordlist typo check
+    (``wordlist.check_phrase_words``) splits on all separators at once.
+    
+    Args:
+        phrase: Root phrase as typed
+        
+    Returns:
+        Tokens, unnormalised
+        
+    Examples:
+        >>> tokenize_phrase("correct-horse-battery staple")
+        ['correct', 'horse', 'battery staple']
+    """
+    stripped = phrase.strip()
+    best: List[str] = []
+    for separator in PHRASE_SEPARATORS:
+        tokens = stripped.split(separator)
+        if len(tokens) > len(best):
+            best = tokens
+    return best
+
+
+def phrase_counts(phrase: Union[bytes, bytearray, memoryview]) -> Tuple[int, int]:
+    """
+    Word and character counts of a UTF-8 phrase, without decoding it.
+    
+    Gives ``len(tokenize_phrase(text))`` and ``len(text.strip())`` for the
+    decoded ``text``, treating only ASCII whitespace as whitespace. Used
+    for the strength warning on a phrase read into a SecureBuffer.
+    
+    Args:
+        phrase: Root phrase as typed, UTF-8 encoded
+        
+    Returns:
+        (word_count, char_count); (0, 0) for a blank phrase
+    """
+    start, end = 0, len(phrase)
+    while start < end and phrase[start] in _ASCII_WHITESPACE:
+        start += 1
+    while end > start and phrase[end - 1] in _ASCII_WHITESPACE:
+        end -= 1
+    if start == end:
+        return 0, 0
+    
+    chars = 0
+    runs = 0
+    separators = {code: 0 for code in b"-_,"}
+    in_word = False
+    for index in range(start, end):
+        code = phrase[index]
+        if code & 0xC0 != 0x80:
+            chars += 1
+        if code in _ASCII_WHITESPACE:
+            in_word = False
+            continue
+        if not in_word:
+            runs += 1
+            in_word = True
+        if code in separators:
+            separators[code] += 1
+    return max(runs, *(count + 1 for count in separators.values())), chars
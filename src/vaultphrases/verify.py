@@ -0,0 +1,170 @@
+"""Check codes: verify derived child keys without revealing passphrases.
+
+A check code is a short, non-reversible tag of a child key:
+
+    check_code = HMAC-SHA256(child_key, "vaultphrases-check-v1")[:8]
+
+A manifest stores one code per label together with the scheme and mode
+used. ``--verify MANIFEST`` pays the Argon2id cost once, re-derives every
+label in one loop over a shared ``KeyedPRF`` and compares the codes.
+
+Manifest format (JSON)::
+
+    {"version": 1, "scheme": "V1", "test": false,
+     "codes": {"HOT_PHRASE_V1": "3f9c0b1e5a7d2c48", ...}}
+"""
+
+import hmac
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Dict, Iterable, Mapping, NamedTuple, Union
+
+from .constants import SCHEME_VERSION, SUPPORTED_SCHEMES
+from .derive import KeyedPRF
+from .security import SecureBuffer, secure_clear_bytes
+
+# Domain separation for check codes (never used to derive a phrase)
+CHECK_CODE_LABEL = b"vaultphrases-check-v1"
+
+# Truncated tag length in bytes (16 hex characters)
+CHECK_CODE_LENGTH = 8
+
+MANIFEST_VERSION = 1
+
+_CHECK_CODE_RE = re.compile(f"[0-9a-f]{{{2 * CHECK_CODE_LENGTH}}}")
+
+
+class ManifestError(Exception):
+    """Raised when a check code manifest cannot be read or written."""
+    pass
+
+
+class Manifest(NamedTuple):
+    """Check codes for a set of labels, with the parameters they need."""
+
+    scheme: str
+    test_mode: bool
+    codes: Dict[str, str]
+
+
+def check_code(child_key: bytes) -> str:
+    """
+    Compute the check code of a child key.
+
+    Args:
+        child_key: Child key from hkdf_child()
+
+    Returns:
+        Check code as hex
+    """
+    tag = hmac.new(child_key, CHECK_CODE_LABEL, hashlib.sha256).digest()
+    return tag[:CHECK_CODE_LENGTH].hex()
+
+
+def compute_check_codes(master_key: Union[bytes, SecureBuffer], labels: Iterable[str]) -> Dict[str, str]:
+    """
+    Compute check codes for many labels from one master key.
+
+    The HMAC key schedule of the master key is computed once; each child
+    key is wiped as soon as its code is taken.
+
+    Args:
+        master_key: Master key from derive_master_key()
+        labels: Domain labels
+
+    Returns:
+        Mapping of label to check code
+    """
+    prf = KeyedPRF(master_key)
+    codes = {}
+    for label in labels:
+        child = prf.digest(label.encode('utf-8'))
+        codes[label] = check_code(child)
+        secure_clear_bytes(child)
+    return codes
+
+
+def verify_check_codes(master_key: Union[bytes, SecureBuffer], expected: Mapping[str, str]) -> Dict[str, bool]:
+    """
+    Re-derive every label and compare it with its stored check code.
+
+    Args:
+        master_key: Master key from derive_master_key()
+        expected: Mapping of label to stored check code
+
+    Returns:
+        Mapping of label to pass (True) / fail (False), in manifest order
+    """
+    actual = compute_check_codes(master_key, expected)
+    return {
+        label: hmac.compare_digest(actual[label], code.lower())
+        for label, code in expected.items()
+    }
+
+
+def load_manifest(path: str) -> Manifest:
+    """
+    Read a check code manifest.
+
+    Raises:
+        ManifestError: If the file is missing or malformed
+    """
+    try:
+        with open(os.path.expanduser(path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise ManifestError(f"Manifest not found: {path}")
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"Failed to read manifest: {e}")
+
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        raise ManifestError("Unsupported manifest version")
+    scheme = data.get("scheme", SCHEME_VERSION)
+    codes = data.get("codes")
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ManifestError(f"Unknown derivation scheme in manifest: {scheme}")
+    if not isinstance(codes, dict) or not codes:
+        raise ManifestError("Manifest has no check codes")
+    for label, code in codes.items():
+        # Only what check_code() writes; compare_digest raises TypeError on non-ASCII str
+        if not isinstance(code, str) or not _CHECK_CODE_RE.fullmatch(code):
+            raise ManifestError(f"Malformed check code for label {label!r}")
+    return Manifest(scheme, bool(data.get("test", False)), codes)
+
+
+def save_manifest(path: str, manifest: Manifest) -> None:
+    """
+    Write a check code manifest (mode 0600).
+
+    The manifest is written to a temporary file and renamed over ``path``,
+    so a crash never leaves it truncated and an existing file's looser
+    mode is not kept. Check codes are an offline oracle for the root
+    phrase, as strong as the Argon2id parameters; keep the manifest as
+    private as a password hash.
+
+    Raises:
+        ManifestError: If the file cannot be written
+    """
+    data = {
+        "version": MANIFEST_VERSION,
+        "scheme": manifest.scheme,
+        "test": manifest.test_mode,
+        "codes": manifest.codes,
+    }
+    path = os.path.expanduser(path)
+    try:
+        # mkstemp creates the file mode 0600
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".manifest-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        raise ManifestError(f"Failed to write manifest: {e}")
@@ -1,27 +1,170 @@
 """Wordlist loading and management."""
 
+import io
 import os
+import mmap
+import struct
+import tempfile
 from pathlib import Path
-from typing import List
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Union, overload
+import difflib
 import hashlib
+import re
+from itertools import accumulate, chain, islice
+
+from .instrument import stage
+
 
 class WordlistError(Exception):
     """Raised when wordlist operations fail."""
     pass
 
 
+class WordlistIngest(NamedTuple):
+    """Result of a single streaming pass over a wordlist file."""
+    
+    words: List[str]
+    # SHA-256 of the raw file bytes, as published for the EFF lists
+    file_sha256: str
+    # SHA-256 of the words joined by newlines (see fingerprint_wordlist)
+    fingerprint_digest: str
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that feeds every byte it reads into a hash."""
+    
+    def __init__(self, raw, digest):
+        self._raw = raw
+        self._digest = digest
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        n = self._raw.readinto(buffer)
+        if n:
+            self._digest.update(memoryview(buffer)[:n])
+        return n
+
+
+class BundledWordlist(NamedTuple):
+    """A wordlist shipped in ``vaultphrases/data``, with metadata precomputed."""
+    
+    resource: str
+    source_name: str
+    word_count: int
+    # SHA-256 of the published EFF file
+    file_sha256: str
+    # SHA-256 of the words joined by newlines (see fingerprint_wordlist)
+    fingerprint_digest: str
+
+
+# Compiled with ``vaultphrases wordlist compile``; a test checks these
+# against the file headers
+BUNDLED_WORDLISTS = {
+    "eff_short": BundledWordlist(
+        "eff_short_wordlist_1.vpwl",
+        "eff_short_wordlist_1.txt",
+        1296,
+        "8f5ca830b8bffb6fe39c9736c024a00a6a6411adb3f83a9be8bfeeb6e067ae69",
+        "3680fb8483e03eab3067f20ef8b8848a086006b25981b0df6c8bdc603c4ed55e",
+    ),
+    "eff_large": BundledWordlist(
+        "eff_large_wordlist.vpwl",
+        "eff_large_wordlist.txt",
+        7776,
+        "addd35536511597a02fa0a9ff1e5284677b8883b83e986e43f15a3db996b903e",
+        "abae49761b88f3f1ba31ef944bea1f61b795a3cd7e1cfb7d276ed45bf77967ba",
+    ),
+}
+
+
+def bundled_wordlist_path(name: str) -> str:
+    """
+    Get the filesystem path of a bundled wordlist.
+    
+    Args:
+        name: Bundled wordlist name (a key of BUNDLED_WORDLISTS)
+        
+    Returns:
+        Path to the compiled wordlist file, valid until interpreter exit
+        (extracted to a temporary file for zipped installs)
+        
+    Raises:
+        WordlistError: If there is no such bundled wordlist
+    """
+    info = BUNDLED_WORDLISTS.get(name)
+    if info is None:
+        raise WordlistError(f"Unknown bundled wordlist: {name}")
+    
+    path = _bundled_paths.get(info.resource)
+    if path is None:
+        path = _extract_resource(info.resource)
+        _bundled_paths[info.resource] = path
+    return path
+
+
+# resource name -> filesystem path, valid until interpreter exit
+_bundled_paths: Dict[str, str] = {}
+_resource_files: Optional["contextlib.ExitStack"] = None
+
+
+def _extract_resource(resource: str) -> str:
+    """
+    Return a filesystem path for a package resource that outlives the call.
+    
+    For a zipped install the resource is extracted to a temporary file;
+    the context keeping it alive is held open until interpreter exit
+    rather than closed on return, which would delete the file.
+    """
+    global _resource_files
+    # Resolved on demand so runs with --wordlist never touch importlib.resources
+    import atexit
+    import contextlib
+    try:
+        from importlib.resources import as_file, files
+        context = as_file(files("vaultphrases.data").joinpath(resource))
+    except ImportError:  # Python < 3.9
+        from importlib.resources import path as resource_path
+        context = resource_path("vaultphrases.data", resource)
+    if _resource_files is None:
+        _resource_files = contextlib.ExitStack()
+        atexit.register(_resource_files.close)
+    return str(_resource_files.enter_context(context))
+
+
+def load_bundled_wordlist(name: str) -> "CompiledWordlist":
+    """
+    Map a bundled wordlist.
+    
+    Nothing is parsed or hashed: the file is memory-mapped and only its
+    header is checked. The bundled files are read-only package data whose
+    metadata is precomputed in BUNDLED_WORDLISTS.
+    
+    Args:
+        name: Bundled wordlist name (e.g., "eff_short")
+        
+    Returns:
+        The compiled wordlist
+    """
+    with stage("wordlist_load"):
+        return CompiledWordlist(bundled_wordlist_path(name))
+
+
 def get_default_wordlist_path() -> str:
     """
     Get the path to the default EFF wordlist.
     
     Returns:
-        Absolute path to the default wordlist file
+        Absolute path to the default wordlist file (the bundled, compiled
+        EFF short wordlist unless DEFAULT_WORDLIST_PATH is set)
     """
-    from .constants import DEFAULT_WORDLIST_PATH
-    return DEFAULT_WORDLIST_PATH
+    from .constants import DEFAULT_WORDLIST, DEFAULT_WORDLIST_PATH
+    return DEFAULT_WORDLIST_PATH or bundled_wordlist_path(DEFAULT_WORDLIST)
 
 
-def load_wordlist(wordlist_path: str) -> List[str]:
+def load_wordlist(wordlist_path: str) -> Sequence[str]:
     """
     Load a wordlist from a file.
     
@@ -29,12 +172,13 @@ def load_wordlist(wordlist_path: str) -> List[str]:
     - Plain text (one word per line)
     - EFF format (dice_number word)
     - BIP39 format (numbered list)
+    - Compiled wordlists (see compile_wordlist), memory-mapped
     
     Args:
         wordlist_path: Path to the wordlist file
         
     Returns:
-        List of words from the wordlist
+        List of words from the wordlist (a CompiledWordlist for compiled files)
         
     Raises:
         WordlistError: If file doesn't exist or is invalid
@@ -47,10 +191,53 @@ def load_wordlist(wordlist_path: str) -> List[str]:
     if not path.is_file():
         raise WordlistError(f"Wordlist path is not a file: {wordlist_path}")
     
+    with stage("wordlist_load"):
+        if is_compiled_wordlist(path):
+            return CompiledWordlist(path)
+        return _parse_wordlist(path).words
+
+
+def ingest_wordlist(wordlist_path: str) -> WordlistIngest:
+    """
+    Load a text wordlist in one streaming pass.
+    
+    The raw file SHA-256 and the word fingerprint are computed while the
+    file is parsed, without re-reading it or joining the words.
+    
+    Args:
+        wordlist_path: Path to the wordlist file (any text format
+            accepted by load_wordlist)
+        
+    Returns:
+        WordlistIngest with the words, file SHA-256 and fingerprint digest
+        
+    Raises:
+        WordlistError: If file doesn't exist or is invalid
+    """
+    path = Path(wordlist_path).expanduser()
+    
+    if not path.exists():
+        raise WordlistError(f"Wordlist file not found: {wordlist_path}")
+    
+    if not path.is_file():
+        raise WordlistError(f"Wordlist path is not a file: {wordlist_path}")
+    
+    with stage("wordlist_load"):
+        return _parse_wordlist(path)
+
+
+def _parse_wordlist(path: Path) -> WordlistIngest:
+    """Parse an existing wordlist file (see load_wordlist)."""
     words = []
+    file_digest = hashlib.sha256()
+    word_digest = hashlib.sha256()
+    # Words are hashed in batches: one update() per word is measurably slower
+    pending = []
     
     try:
-        with open(path, 'r', encoding='utf-8') as f:
+        with open(path, 'rb', buffering=0) as raw:
+            # Same decoding and newline handling as open(path, 'r', encoding='utf-8')
+            f = io.TextIOWrapper(io.BufferedReader(_HashingReader(raw, file_digest)), encoding='utf-8')
             for line in f:
                 line = line.strip()
                 
@@ -69,6 +256,12 @@ def load_wordlist(wordlist_path: str) -> List[str]:
                 else:
                     # EFF/numbered format: take the last part (the word)
                     words.append(parts[-1])
+                
+                pending.append(words[-1])
+                if len(pending) > 4096:
+                    # Keep the newest word back: the last word has no trailing newline
+                    word_digest.update(('\n'.join(pending[:-1]) + '\n').encode('utf-8'))
+                    del pending[:-1]
     
     except UnicodeDecodeError as e:
         raise WordlistError(f"Failed to decode wordlist file: {e}")
@@ -78,7 +271,8 @@ def load_wordlist(wordlist_path: str) -> List[str]:
     if not words:
         raise WordlistError("Wordlist is empty")
     
-    return words
+    word_digest.update('\n'.join(pending).encode('utf-8'))
+    return WordlistIngest(words, file_digest.hexdigest(), word_digest.hexdigest())
 
 
 def words_to_phrase(words: List[str], indices: List[int], delimiter: str = "-") -> str:
@@ -97,22 +291,31 @@ def words_to_phrase(words: List[str], indices: List[int], delimiter: str = "-")
     return delimiter.join(selected)
 
 
-def fingerprint_wordlist(words: List[str]) -> str:
+def fingerprint_wordlist(words: Sequence[str]) -> str:
     """
     Generate a SHA256 fingerprint of the wordlist.
     
     Args:
-        words: List of words to fingerprint
+        words: List of words to fingerprint (a Wordlist, CompiledWordlist
+            or WordlistIngest reuses its precomputed digest)
         
     Returns:
         Hex digest of SHA256 hash (truncated to first 6 and last 6 chars)
     """
     
     # Join all words with newlines for consistent hashing
-    content = '\n'.join(words).encode('utf-8')
-    digest = hashlib.sha256(content).hexdigest()
+    with stage("wordlist_fingerprint"):
+        if isinstance(words, (Wordlist, CompiledWordlist, WordlistIngest)):
+            digest = words.fingerprint_digest
+        else:
+            content = '\n'.join(words).encode('utf-8')
+            digest = hashlib.sha256(content).hexdigest()
     
-    # Return truncated format: first6...last6
+    return format_digest(digest)
+
+
+def format_digest(digest: str) -> str:
+    """Shorten a hex digest for display: first6...last6."""
     return f"{digest[:6]}...{digest[-6:]}"
 
 
@@ -120,16 +323,79 @@ def print_wordlist_info(wordlist_path: str, words: List[str]) -> None:
     """
     Print wordlist information for verification.
     
+    The file SHA-256 is the hash of the file as published (the source
+    file for a compiled list); the fingerprint is the hash of the words.
+    
     Args:
         wordlist_path: Path to the wordlist file
         words: Loaded words
     """
     filename = Path(wordlist_path).name
     fingerprint = fingerprint_wordlist(words)
+    file_sha256 = getattr(words, "file_sha256", None)
+    if file_sha256 is None:
+        with open(wordlist_path, 'rb') as f:
+            file_sha256 = hashlib.sha256(f.read()).hexdigest()
     
     print(f"Using wordlist: {filename}")
     print(f"Words: {len(words)}")
-    print(f"SHA256: {fingerprint}")
+    print(f"File SHA-256: {format_digest(file_sha256)}")
+    print(f"Fingerprint: {fingerprint}")
+
+
+def iter_word_indices(blocks: Iterable[bytes], base: int) -> Iterator[int]:
+    """
+    Lazily extract word indices from a stream of random byte blocks.
+    
+    The first block is read as a big integer and consumed by repeated
+    ``divmod`` exactly like ``bytes_to_phrase``. Once less than one full
+    word of entropy remains, the next block is appended below the
+    remainder, so long phrases never run out of entropy. Indices drawn
+    before the first refill are identical to the single-block output.
+    
+    If the blocks run out, extraction continues on the remainder alone
+    (the historical behaviour for a single 32-byte key).
+    
+    Args:
+        blocks: Random byte blocks (e.g., a ChildKeyStream)
+        base: Wordlist size
+        
+    Yields:
+        Word indices in [0, base)
+    """
+    blocks = iter(blocks)
+    first = next(blocks, b"")
+    num = int.from_bytes(first, "big")
+    # Exclusive upper bound on num: how much entropy is left
+    bound = 1 << (8 * len(first))
+    
+    while True:
+        if bound < base:
+            more = next(blocks, None)
+            if more is not None:
+                num = (num << (8 * len(more))) | int.from_bytes(more, "big")
+                bound <<= 8 * len(more)
+        yield num % base
+        num //= base
+        bound = -(-bound // base)
+
+
+def blocks_to_phrase(blocks: Iterable[bytes], words: List[str], word_count: int, delimiter: str = "-") -> str:
+    """
+    Convert a stream of byte blocks to a passphrase of any length.
+    
+    Args:
+        blocks: Random byte blocks (e.g., a ChildKeyStream)
+        words: Wordlist to select from
+        word_count: Number of words to generate
+        delimiter: String to join words with (default: "-")
+        
+    Returns:
+        Passphrase string
+    """
+    with stage("render"):
+        indices = iter_word_indices(blocks, len(words))
+        return delimiter.join([words[index] for index in islice(indices, word_count)])
 
 
 def bytes_to_phrase(raw: bytes, words: List[str], word_count: int, delimiter: str = "-") -> str:
@@ -137,6 +403,9 @@ def bytes_to_phrase(raw: bytes, words: List[str], word_count: int, delimiter: st
     Convert raw bytes to a human-friendly passphrase.
     
     Uses the bytes as a big integer and extracts word indices via modulo.
+    A single 32-byte key carries at most 256 bits; for longer phrases use
+    ``blocks_to_phrase`` with a ``ChildKeyStream``. The output equals
+    ``blocks_to_phrase([raw], ...)``; this loop skips its generator.
     
     Args:
         raw: Raw bytes to convert
@@ -147,13 +416,517 @@ def bytes_to_phrase(raw: bytes, words: List[str], word_count: int, delimiter: st
     Returns:
         Passphrase string
     """
-    num = int.from_bytes(raw, "big")
-    phrase_words = []
-    base = len(words)
+    with stage("render"):
+        num = int.from_bytes(raw, "big")
+        base = len(words)
+        phrase_words = []
+        for _ in range(word_count):
+            num, index = divmod(num, base)
+            phrase_words.append(words[index])
+        return delimiter.join(phrase_words)
+
+
+# Compiled wordlist format (all integers little-endian):
+#
+#   header   magic, version, flags, word count, SHA-256 of the source file,
+#            fingerprint digest (SHA-256 of the words joined by newlines),
+#            source mtime (ns) and size, table digest
+#   offsets  (count + 1) x u32 byte offsets into the blob
+#   blob     the words joined by newlines, UTF-8
+#
+# Word i is blob[offsets[i]:offsets[i + 1] - 1], and the fingerprint is
+# simply SHA-256 of the blob. The table digest is SHA-256 of the header
+# up to it followed by the offset table. Opening a file only checks its
+# structure; CompiledWordlist.verify() checks both digests.
+COMPILED_MAGIC = b"VPWLIST\x00"
+COMPILED_VERSION = 2
+COMPILED_SUFFIX = ".vpwl"
+_HEADER = struct.Struct("<8sHHI32s32sqq32s")
+_TABLE_DIGEST_OFFSET = _HEADER.size - 32
+_OFFSET = struct.Struct("<I")
+_OFFSET_PAIR = struct.Struct("<II")
+
+
+def _offset_table(words: Sequence[bytes]) -> bytes:
+    """Pack the offset table for the encoded words."""
+    # Word i + 1 starts one byte (the newline) after word i ends
+    offsets = list(accumulate(chain((0,), map((1).__add__, map(len, words)))))
+    return struct.pack(f"<{len(offsets)}I", *offsets)
+
+
+def is_compiled_wordlist(wordlist_path: Union[str, Path]) -> bool:
+    """Check whether a file starts with the compiled wordlist magic."""
+    try:
+        with open(wordlist_path, 'rb') as f:
+            return f.read(len(COMPILED_MAGIC)) == COMPILED_MAGIC
+    except OSError:
+        return False
+
+
+class CompiledWordlist(Sequence[str]):
+    """
+    Read-only, memory-mapped view of a compiled wordlist.
     
-    for _ in range(word_count):
-        idx = num % base
-        phrase_words.append(words[idx])
-        num //= base
+    Opening maps the file and checks its header and sizes, which is O(1):
+    nothing is hashed or copied. Words are only decoded when indexed;
+    indexing is O(1). The fingerprint and source file hash come from the
+    header; verify() re-hashes the offset table and word blob against it
+    (compile_wordlist() does so before recompiling a compiled file).
+    
+    Example:
+        >>> words = CompiledWordlist("eff_short_wordlist_1.vpwl")
+        >>> len(words), words[0]
+        (1296, 'acid')
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: Path to a compiled wordlist
+            
+        Raises:
+            WordlistError: If the file is not a valid compiled wordlist
+        """
+        self.path = str(path)
+        try:
+            with open(path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise WordlistError(f"Failed to map compiled wordlist: {e}")
+        
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise WordlistError("Compiled wordlist is truncated")
+        (magic, version, _flags, count, file_sha256, fingerprint,
+         mtime_ns, size, table_digest) = _HEADER.unpack_from(self._map, 0)
+        
+        blob_start = _HEADER.size + _OFFSET.size * (count + 1)
+        if magic != COMPILED_MAGIC or version != COMPILED_VERSION:
+            self.close()
+            raise WordlistError("Not a compiled wordlist (or unsupported version)")
+        if count == 0 or len(self._map) < blob_start:
+            self.close()
+            raise WordlistError("Compiled wordlist is empty or truncated")
+        end = _OFFSET.unpack_from(self._map, blob_start - _OFFSET.size)[0]
+        if blob_start + end - 1 != len(self._map):
+            self.close()
+            raise WordlistError("Compiled wordlist is truncated")
+        
+        self._count = count
+        self._blob_start = blob_start
+        self._table_digest = table_digest
+        self.file_sha256 = file_sha256.hex()
+        self.fingerprint_digest = fingerprint.hex()
+        self.source_mtime_ns = mtime_ns
+        self.source_size = size
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("wordlist index out of range")
+        start, end = _OFFSET_PAIR.unpack_from(self._map, _HEADER.size + _OFFSET.size * index)
+        base = self._blob_start
+        return self._map[base + start:base + end - 1].decode('utf-8')
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self[:])
     
-    return delimiter.join(phrase_words)
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CompiledWordlist, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        return f"CompiledWordlist({self.path!r}, {self._count} words)"
+    
+    def verify(self) -> bool:
+        """
+        Check the offset table and word blob against the header digests.
+        
+        Hashes the mapped file in place, without copying it or decoding
+        any words.
+        
+        Returns:
+            True if both the table digest and the fingerprint match
+        """
+        with memoryview(self._map) as view:
+            table = hashlib.sha256(view[:_TABLE_DIGEST_OFFSET])
+            table.update(view[_HEADER.size:self._blob_start])
+            blob = hashlib.sha256(view[self._blob_start:])
+        return table.digest() == self._table_digest and blob.hexdigest() == self.fingerprint_digest
+    
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+    
+    def __enter__(self) -> "CompiledWordlist":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def compile_wordlist(source_path: Union[str, Path], output_path: Union[str, Path, None] = None) -> str:
+    """
+    Compile a wordlist into the memory-mappable binary format.
+    
+    Args:
+        source_path: Any wordlist accepted by load_wordlist()
+        output_path: Destination (default: source path with a .vpwl suffix)
+        
+    Returns:
+        Path of the compiled wordlist
+        
+    Raises:
+        WordlistError: If the source cannot be loaded or the output written
+    """
+    source = Path(source_path).expanduser()
+    output = Path(output_path).expanduser() if output_path else source.with_suffix(COMPILED_SUFFIX)
+    
+    try:
+        st = source.stat()
+    except OSError as e:
+        raise WordlistError(f"Failed to read wordlist file: {e}")
+    
+    if is_compiled_wordlist(source):
+        with CompiledWordlist(source) as compiled:
+            if not compiled.verify():
+                raise WordlistError("Compiled wordlist is corrupt: words do not match the header")
+            words = list(compiled)
+            file_sha256 = bytes.fromhex(compiled.file_sha256)
+    else:
+        ingest = ingest_wordlist(str(source))
+        words = ingest.words
+        file_sha256 = bytes.fromhex(ingest.file_sha256)
+    
+    encoded = [word.encode('utf-8') for word in words]
+    blob = b'\n'.join(encoded)
+    offsets = _offset_table(encoded)
+    header = _HEADER.pack(
+        COMPILED_MAGIC, COMPILED_VERSION, 0, len(words), file_sha256,
+        hashlib.sha256(blob).digest(), st.st_mtime_ns, st.st_size, bytes(32),
+    )[:_TABLE_DIGEST_OFFSET]
+    data = header + hashlib.sha256(header + offsets).digest() + offsets + blob
+    
+    # Write to a temporary file and rename, so readers never map a partial file
+    try:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(output.parent), prefix=".vpwl-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # Wordlists are public; mkstemp's 0600 would hide shared copies
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, output)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        raise WordlistError(f"Failed to write compiled wordlist: {e}")
+    
+    return str(output)
+
+
+def get_cache_dir() -> Path:
+    """Return the compiled wordlist cache directory ($XDG_CACHE_HOME/vaultphrases)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "vaultphrases" / "wordlists"
+
+
+def load_wordlist_cached(wordlist_path: str, cache_dir: Optional[Union[str, Path]] = None) -> Sequence[str]:
+    """
+    Load a wordlist through the compiled cache.
+    
+    The compiled copy is keyed on the source's absolute path. A hit is
+    decided from the source's mtime and size alone, so it never reads the
+    source; when either differs from what the header records, the source
+    is re-read, re-hashed and recompiled. If the cache cannot be written,
+    the source is parsed directly.
+    
+    Args:
+        wordlist_path: Path to the wordlist file
+        cache_dir: Cache directory (default: get_cache_dir())
+        
+    Returns:
+        The words, normally as a CompiledWordlist
+        
+    Raises:
+        WordlistError: If the source doesn't exist or is invalid
+    """
+    source = Path(wordlist_path).expanduser()
+    if not source.is_file() or is_compiled_wordlist(source):
+        return load_wordlist(wordlist_path)
+    
+    key = hashlib.sha256(str(source.resolve()).encode('utf-8')).hexdigest()[:32]
+    cached = Path(cache_dir) if cache_dir else get_cache_dir()
+    cached = cached / f"{key}{COMPILED_SUFFIX}"
+    st = source.stat()
+    
+    if cached.is_file():
+        with stage("wordlist_load"):
+            try:
+                words = CompiledWordlist(cached)
+            except WordlistError:
+                words = None
+        if words is not None:
+            if words.source_mtime_ns == st.st_mtime_ns and words.source_size == st.st_size:
+                return words
+            words.close()
+    
+    try:
+        compile_wordlist(source, cached)
+    except WordlistError:
+        return load_wordlist(wordlist_path)
+    with stage("wordlist_load"):
+        return CompiledWordlist(cached)
+
+
+class Wordlist(Sequence[str]):
+    """
+    Immutable wordlist with a reverse index.
+    
+    Wraps a word sequence (a tuple, or a memory-mapped CompiledWordlist)
+    together with its base and fingerprint. The word-to-index map is built
+    on first use, so rendering phrases never pays for it.
+    
+    Example:
+        >>> wordlist = Wordlist.load("eff_short_wordlist_1.txt")
+        >>> phrase = bytes_to_phrase(child_key, wordlist, 6)
+        >>> wordlist.phrase_to_int(phrase) == int.from_bytes(child_key, "big") % wordlist.base ** 6
+        True
+    """
+    
+    __slots__ = ("_words", "_index", "_fingerprint_digest")
+    
+    def __init__(self, words: Iterable[str], fingerprint_digest: Optional[str] = None):
+        """
+        Args:
+            words: The words, in index order
+            fingerprint_digest: Precomputed fingerprint digest (hex), if known
+            
+        Raises:
+            WordlistError: If the wordlist is empty
+        """
+        if not isinstance(words, (tuple, CompiledWordlist)):
+            words = tuple(words)
+        if len(words) == 0:
+            raise WordlistError("Wordlist is empty")
+        if fingerprint_digest is None and isinstance(words, CompiledWordlist):
+            fingerprint_digest = words.fingerprint_digest
+        object.__setattr__(self, "_words", words)
+        object.__setattr__(self, "_index", None)
+        object.__setattr__(self, "_fingerprint_digest", fingerprint_digest)
+    
+    @classmethod
+    def load(cls, wordlist_path: str) -> "Wordlist":
+        """
+        Load a wordlist file (any format load_wordlist accepts).
+        
+        Text files are ingested in one pass, so the fingerprint comes free.
+        """
+        if is_compiled_wordlist(wordlist_path):
+            return cls(load_wordlist(wordlist_path))
+        ingest = ingest_wordlist(wordlist_path)
+        return cls(ingest.words, ingest.fingerprint_digest)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Wordlist is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Wordlist is immutable")
+    
+    def __len__(self) -> int:
+        return len(self._words)
+    
+    def __getitem__(self, index):
+        return self._words[index]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+    
+    def __contains__(self, word) -> bool:
+        return word in self.index
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Wordlist):
+            return self.fingerprint_digest == other.fingerprint_digest
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.fingerprint_digest)
+    
+    def __repr__(self) -> str:
+        return f"Wordlist({len(self)} words, {self.fingerprint})"
+    
+    @property
+    def base(self) -> int:
+        """Number of words, i.e. the radix of a phrase."""
+        return len(self._words)
+    
+    @property
+    def fingerprint_digest(self) -> str:
+        """SHA-256 of the words joined by newlines (hex)."""
+        if self._fingerprint_digest is None:
+            content = '\n'.join(self._words).encode('utf-8')
+            object.__setattr__(self, "_fingerprint_digest", hashlib.sha256(content).hexdigest())
+        return self._fingerprint_digest
+    
+    @property
+    def fingerprint(self) -> str:
+        """Shortened fingerprint, as shown by fingerprint_wordlist()."""
+        return format_digest(self.fingerprint_digest)
+    
+    @property
+    def index(self) -> Mapping[str, int]:
+        """
+        Read-only word-to-index mapping, built on first use.
+        
+        Raises:
+            WordlistError: If the wordlist contains duplicate words
+        """
+        if self._index is None:
+            index = {word: i for i, word in enumerate(self._words)}
+            if len(index) != len(self._words):
+                raise WordlistError("Wordlist contains duplicate words; phrases cannot be decoded")
+            object.__setattr__(self, "_index", MappingProxyType(index))
+        return self._index
+    
+    def phrase_to_indices(self, phrase: str, delimiter: str = "-") -> List[int]:
+        """
+        Map a passphrase back to its word indices.
+        
+        Words may contain the delimiter (EFF large has "t-shirt" and
+        "yo-yo"), so the phrase is matched against the index span by span,
+        preferring the longest word at each position that still leaves a
+        decodable remainder.
+        
+        Args:
+            phrase: Passphrase rendered from this wordlist
+            delimiter: Word delimiter used when rendering
+            
+        Returns:
+            Word indices, first word first
+            
+        Raises:
+            WordlistError: If a word is not in the wordlist (the message
+                gives its position, never the word)
+        """
+        index = self.index
+        parts = phrase.split(delimiter)
+        # tails[start] decodes parts[start:], or is None if they cannot be
+        tails: List[Optional[List[int]]] = [None] * len(parts) + [[]]
+        for start in reversed(range(len(parts))):
+            for end in range(len(parts), start, -1):
+                i = index.get(delimiter.join(parts[start:end]))
+                tail = tails[end]
+                if i is not None and tail is not None:
+                    tails[start] = [i] + tail
+                    break
+        indices = tails[0]
+        if indices is None:
+            # Report the first word a left-to-right longest match cannot place
+            start = 0
+            position = 1
+            while True:
+                end = next((end for end in range(len(parts), start, -1)
+                            if delimiter.join(parts[start:end]) in index), None)
+                if end is None or end == len(parts):
+                    break
+                start = end
+                position += 1
+            raise WordlistError(f"Word {position} of the phrase is not in the wordlist")
+        return indices
+    
+    def phrase_to_int(self, phrase: str, delimiter: str = "-") -> int:
+        """
+        Inverse of bytes_to_phrase: the integer the phrase encodes.
+        
+        ``bytes_to_phrase`` takes word i as digit i (least significant
+        first) of the key in base ``self.base``, so for an n-word phrase
+        this returns ``int.from_bytes(raw, "big") % base ** n``. Comparing
+        these integers avoids re-rendering phrases.
+        
+        Args:
+            phrase: Passphrase rendered from this wordlist
+            delimiter: Word delimiter used when rendering
+            
+        Returns:
+            The phrase's value as a non-negative integer
+        """
+        value = 0
+        for i in reversed(self.phrase_to_indices(phrase, delimiter)):
+            value = value * self.base + i
+        return value
+
+
+# Root phrase separators, as in utils.PHRASE_SEPARATORS, captured
+_PHRASE_SPLIT = re.compile(r"(\s+|[-_,])")
+
+
+class UnknownWord(NamedTuple):
+    """A root phrase token that is not in the wordlist."""
+    
+    position: int  # 1-based
+    token: str
+    suggestions: List[str]
+
+
+def check_phrase_words(phrase: str, wordlist: Wordlist, max_suggestions: int = 3) -> List[UnknownWord]:
+    """
+    Find root phrase words missing from a wordlist, before any KDF work.
+    
+    The phrase is split at every separator (whitespace, '-', '_', ','),
+    so a phrase mixing them still yields single words. Adjacent pieces
+    that form one word with the separator between them, such as "t-shirt",
+    are rejoined. Each word is normalised (lowercased) and looked up in
+    the wordlist's hash index. Only unknown words are compared against the
+    whole list for suggestions.
+    
+    Args:
+        phrase: Root phrase as typed
+        wordlist: Wordlist the root phrase was drawn from
+        max_suggestions: Nearest matches to suggest per unknown word
+        
+    Returns:
+        Unknown words with their nearest matches (empty if all are known)
+    """
+    index = wordlist.index
+    longest = max(map(len, index))
+    # Pieces at even positions, the separators between them at odd ones
+    pieces = _PHRASE_SPLIT.split(phrase.strip().lower())
+    unknown = []
+    position = 0
+    start = 0
+    while start < len(pieces):
+        # Longest run of pieces that is a single word, else the piece alone
+        word, end = pieces[start], start + 2
+        candidate = word
+        for stop in range(start + 2, len(pieces), 2):
+            candidate += pieces[stop - 1] + pieces[stop]
+            if len(candidate) > longest:
+                break
+            if candidate in index:
+                word, end = candidate, stop + 2
+        start = end
+        if not word:
+            continue
+        position += 1
+        if word in index:
+            continue
+        suggestions = difflib.get_close_matches(word, index.keys(), n=max_suggestions, cutoff=0.7)
+        unknown.append(UnknownWord(position, word, suggestions))
+    return unknown
@@ -0,0 +1,122 @@
+"""Tests for the derivation agent."""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+from vaultphrases import agent
+from vaultphrases.constants import LABEL_HOT
+from vaultphrases.derive import derive_master_key, hkdf_child
+from vaultphrases.wordlist import bytes_to_phrase, fingerprint_wordlist
+
+
+WORDLIST = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+
+
+@pytest.fixture
+def running_agent():
+    """Start an agent on a private socket in a background thread."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "agent.sock")
+        server = agent.AgentServer(
+            master_key, WORDLIST, fingerprint_wordlist(WORDLIST),
+            test_mode=True, socket_path=path, idle_ttl=30,
+        )
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server, master_key
+        server.close()
+        thread.join(timeout=5)
+
+
+def test_agent_phrase_matches_local(running_agent):
+    """The agent should return exactly the locally derived phrase."""
+    server, master_key = running_agent
+    
+    phrase = agent.agent_phrase(
+        LABEL_HOT, 6, fingerprint_wordlist(WORDLIST), test_mode=True, socket_path=server.socket_path
+    )
+    
+    assert phrase == bytes_to_phrase(hkdf_child(master_key, LABEL_HOT), WORDLIST, 6, "-")
+
+
+def test_agent_rejects_mismatch(running_agent):
+    """Wordlist and test-mode mismatches must not be served."""
+    server, _ = running_agent
+    fp = fingerprint_wordlist(WORDLIST)
+    
+    assert agent.agent_phrase(LABEL_HOT, 6, "other", test_mode=True, socket_path=server.socket_path) is None
+    assert agent.agent_phrase(LABEL_HOT, 6, fp, test_mode=False, socket_path=server.socket_path) is None
+
+
+def test_agent_lock_wipes_key(running_agent):
+    """A lock request zeroizes the key and removes the socket."""
+    server, _ = running_agent
+    
+    assert agent.request({"op": "lock"}, server.socket_path)["ok"]
+    for _ in range(50):
+        if not os.path.exists(server.socket_path):
+            break
+        time.sleep(0.05)
+    
+    assert not os.path.exists(server.socket_path)
+    assert server._master_key.closed
+
+
+def test_agent_idle_expiry():
+    """The agent wipes its key and exits once idle past its TTL."""
+    with tempfile.TemporaryDirectory() as tmp:
+        server = agent.AgentServer(
+            b"\x01" * 32, WORDLIST, "fp", socket_path=os.path.join(tmp, "a.sock"), idle_ttl=0.1,
+        )
+        server.serve_forever()
+        
+        assert server._master_key.closed
+        assert not os.path.exists(server.socket_path)
+
+
+def test_no_agent_unavailable():
+    """Clients get None when nothing is listening."""
+    assert agent.agent_phrase(LABEL_HOT, 6, "fp", socket_path="/nonexistent/agent.sock") is None
+
+
+@pytest.mark.parametrize("req", [
+    [],
+    "phrase",
+    {"op": "phrase", "label": "x", "words": True, "test": True, "wordlist": "fp"},
+    {"op": "phrase", "label": "x", "words": 10 ** 9, "test": True, "wordlist": "fp"},
+    {"op": "phrase", "label": "x", "words": 6, "delimiter": 7, "test": True, "wordlist": "fp"},
+])
+def test_agent_rejects_malformed_requests(req):
+    """Malformed requests get an error response instead of crashing the agent."""
+    server = agent.AgentServer(b"\x01" * 32, WORDLIST, "fp", test_mode=True, socket_path="unused")
+    
+    response = server.dispatch(req)
+    
+    assert response["ok"] is False
+    server.close()
+
+
+def test_agent_refuses_shared_directory():
+    """The agent will not bind in a directory other users can write to."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chmod(tmp, 0o777)
+        server = agent.AgentServer(b"\x01" * 32, WORDLIST, "fp", socket_path=os.path.join(tmp, "a.sock"))
+        
+        with pytest.raises(agent.AgentError, match="other users"):
+            server.bind()
+        
+        server.close()
+
+
+def test_client_refuses_other_users_agent(running_agent, monkeypatch):
+    """Clients do not talk to an agent owned by a different uid."""
+    server, _ = running_agent
+    monkeypatch.setattr(agent, "_peer_uid", lambda conn: os.getuid() + 1)
+    
+    with pytest.raises(agent.AgentError, match="another user"):
+        agent.request({"op": "ping"}, server.socket_path)
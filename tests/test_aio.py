@@ -0,0 +1,104 @@
+"""Tests for the asyncio derivation API."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from vaultphrases import aio
+from vaultphrases.batch import WORKER_OVERHEAD_KIB
+from vaultphrases.constants import ARGON2_MEMORY_COST, ARGON2_TEST_MEMORY_COST, LABEL_HOT, LABEL_COLD
+from vaultphrases.derive import derive_master_key, hkdf_child
+from vaultphrases.wordlist import bytes_to_phrase
+
+
+WORDLIST = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+
+
+def test_derive_master_key_async_matches_sync():
+    """Async derivation should produce the blocking result."""
+    key = asyncio.run(aio.derive_master_key_async("test phrase", test_mode=True))
+    
+    assert key == derive_master_key("test phrase", test_mode=True)
+
+
+def test_derive_phrases_async_matches_sync():
+    """Async phrase pipeline should match hkdf_child + bytes_to_phrase."""
+    phrases = asyncio.run(aio.derive_phrases_async(
+        "test phrase", [LABEL_HOT, LABEL_COLD], WORDLIST, 6, "-", test_mode=True
+    ))
+    
+    master_key = derive_master_key("test phrase", test_mode=True)
+    for label in (LABEL_HOT, LABEL_COLD):
+        assert phrases[label] == bytes_to_phrase(hkdf_child(master_key, label), WORDLIST, 6, "-")
+
+
+def test_deadline_returns_without_waiting(monkeypatch):
+    """A timeout should fire immediately, not after the blocking call."""
+    def slow_derive(*args, **kwargs):
+        time.sleep(2)
+        return b"\x00" * 32
+    
+    monkeypatch.setattr(aio, "derive_master_key", slow_derive)
+    
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(aio.derive_master_key_async("test phrase", timeout=0.05))
+    
+    assert time.monotonic() - start < 1.0
+
+
+def test_cancellation_returns_without_waiting(monkeypatch):
+    """Cancelling the awaiting task should not wait for the blocking call."""
+    def slow_derive(*args, **kwargs):
+        time.sleep(2)
+        return b"\x00" * 32
+    
+    monkeypatch.setattr(aio, "derive_master_key", slow_derive)
+    
+    async def run():
+        task = asyncio.ensure_future(aio.derive_master_key_async("test phrase"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    start = time.monotonic()
+    asyncio.run(run())
+    
+    assert time.monotonic() - start < 1.0
+
+
+def test_kdf_budget_is_shared_across_parameter_sets():
+    """A second derivation waits while the first holds the shared budget."""
+    budget = aio._MemoryBudget(ARGON2_MEMORY_COST + ARGON2_TEST_MEMORY_COST + 2 * WORKER_OVERHEAD_KIB, 4)
+    admitted = threading.Event()
+    
+    def second():
+        with budget.reserve(ARGON2_MEMORY_COST):
+            admitted.set()
+    
+    with budget.reserve(ARGON2_MEMORY_COST):
+        with budget.reserve(ARGON2_TEST_MEMORY_COST):
+            pass
+        thread = threading.Thread(target=second)
+        thread.start()
+        waited = not admitted.wait(0.2)
+    thread.join(5)
+    
+    assert waited
+    assert admitted.is_set()
+
+
+def test_kdf_budget_admits_one_oversized_call():
+    """A call larger than the whole budget still runs, alone."""
+    budget = aio._MemoryBudget(0, 4)
+    admitted = threading.Event()
+    
+    def run():
+        with budget.reserve(ARGON2_MEMORY_COST):
+            admitted.set()
+    
+    threading.Thread(target=run, daemon=True).start()
+    
+    assert admitted.wait(5)
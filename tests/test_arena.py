@@ -0,0 +1,55 @@
+"""Tests for the reusable Argon2 arena."""
+
+import pytest
+from vaultphrases.arena import Argon2Arena, block_matrix_bytes
+from vaultphrases.constants import ARGON2_TEST_MEMORY_COST, SUPPORTED_SCHEMES
+from vaultphrases.derive import derive_master_key, scheme_params
+from vaultphrases.security import SecureBuffer
+
+
+PHRASE = "correct horse battery staple"
+
+
+def test_block_matrix_bytes():
+    """Sizes follow argon2's rounding to whole segments per lane."""
+    assert block_matrix_bytes(ARGON2_TEST_MEMORY_COST, 1) == ARGON2_TEST_MEMORY_COST * 1024
+    assert block_matrix_bytes(8, 4) == 32 * 1024
+    assert block_matrix_bytes(1030, 4) == 1024 * 1024
+
+
+@pytest.mark.parametrize("scheme", SUPPORTED_SCHEMES)
+def test_arena_derivation_matches_default_allocator(scheme):
+    """Keys derived in the arena equal the malloc path, run after run."""
+    expected = derive_master_key(PHRASE, test_mode=True, scheme=scheme)
+    params = scheme_params(scheme, test_mode=True)
+    
+    with Argon2Arena() as arena:
+        keys = [derive_master_key(PHRASE, test_mode=True, scheme=scheme, arena=arena) for _ in range(3)]
+        with SecureBuffer(32) as out:
+            derive_master_key(PHRASE, test_mode=True, scheme=scheme, out=out, arena=arena)
+            assert out == expected
+        
+        assert keys == [expected] * 3
+        assert arena.capacity >= block_matrix_bytes(params.memory_cost, params.parallelism)
+
+
+def test_arena_is_zero_between_uses():
+    """argon2 wipes the block matrix before returning it to the arena."""
+    with Argon2Arena() as arena:
+        derive_master_key(PHRASE, test_mode=True, arena=arena)
+        
+        assert arena._buffer.view.tobytes() == bytes(arena.capacity)
+    
+    assert arena.capacity == 0
+
+
+def test_busy_arena_falls_back_to_malloc():
+    """A derivation that finds the arena in use still succeeds."""
+    expected = derive_master_key(PHRASE, test_mode=True)
+    
+    with Argon2Arena() as arena:
+        with arena.lease(1024) as callbacks:
+            assert callbacks is not None
+            key = derive_master_key(PHRASE, test_mode=True, arena=arena)
+    
+    assert key == expected
@@ -0,0 +1,42 @@
+"""Tests for parallel master key derivation."""
+
+import pytest
+from vaultphrases.batch import derive_master_keys, max_workers_for_memory
+from vaultphrases.derive import derive_master_key
+
+
+PHRASES = [
+    "correct horse battery staple",
+    "incorrect horse battery staple",
+    "phrase one",
+    "phrase two",
+]
+
+
+def test_derive_master_keys_matches_serial():
+    """Pool derivation should produce exactly the serial results."""
+    serial = [derive_master_key(p, test_mode=True) for p in PHRASES]
+    
+    results = dict(derive_master_keys(PHRASES, test_mode=True, max_workers=2))
+    
+    assert [results[i] for i in range(len(PHRASES))] == serial
+
+
+def test_derive_master_keys_single_worker():
+    """A single worker derives in-process with identical results."""
+    results = dict(derive_master_keys(PHRASES[:2], test_mode=True, max_workers=1))
+    
+    assert results[0] == derive_master_key(PHRASES[0], test_mode=True)
+    assert results[1] == derive_master_key(PHRASES[1], test_mode=True)
+
+
+def test_derive_master_keys_empty():
+    """No phrases yields nothing."""
+    assert list(derive_master_keys([], test_mode=True)) == []
+
+
+def test_max_workers_for_memory():
+    """Pool size is bounded by memory budget and never below one."""
+    assert max_workers_for_memory(256 * 1024, available_kib=0) == 1
+    assert max_workers_for_memory(256 * 1024, available_kib=None) >= 1
+    assert max_workers_for_memory(8 * 1024, available_kib=10 ** 9) >= 1
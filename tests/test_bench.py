@@ -0,0 +1,37 @@
+"""Tests for Argon2 calibration."""
+
+import pytest
+from vaultphrases.bench import calibrate, percentile, recommend
+
+
+def test_percentile_nearest_rank():
+    """Nearest-rank percentiles of a small sample."""
+    samples = [5.0, 1.0, 3.0, 2.0, 4.0]
+    
+    assert percentile(samples, 50) == 3.0
+    assert percentile(samples, 95) == 5.0
+    assert percentile([7.0], 95) == 7.0
+
+
+def test_recommend_prefers_hardest_within_target():
+    """The recommendation maximises memory x time under the target."""
+    points = [
+        {"memory_cost_kib": 1024, "time_cost": 1, "median_ms": 10.0},
+        {"memory_cost_kib": 4096, "time_cost": 2, "median_ms": 90.0},
+        {"memory_cost_kib": 8192, "time_cost": 3, "median_ms": 500.0},
+    ]
+    
+    assert recommend(points, 100.0) is points[1]
+    assert recommend(points, 5.0) is None
+
+
+def test_calibrate_report_structure():
+    """A tiny sweep reports one point per grid cell with latency and RSS."""
+    report = calibrate([8 * 1024], [1], [1], repeats=2, target_ms=60000)
+    
+    assert len(report["points"]) == 1
+    point = report["points"][0]
+    assert point["memory_cost_kib"] == 8 * 1024
+    assert point["median_ms"] > 0
+    assert point["p95_ms"] >= point["median_ms"]
+    assert report["recommended"] == point
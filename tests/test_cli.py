@@ -0,0 +1,147 @@
+"""Tests for CLI helpers."""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+
+import pytest
+import vaultphrases
+from vaultphrases import cli
+from vaultphrases.arena import block_matrix_bytes
+from vaultphrases.cli import precheck_root_phrase, prepare_arena, prepare_wordlist, release_arena, word_count_arg
+from vaultphrases.constants import ARGON2_TEST_MEMORY_COST
+from vaultphrases.derive import derive_master_key
+from vaultphrases.security import SecureBuffer
+from vaultphrases.verify import Manifest, save_manifest
+from vaultphrases.wordlist import WordlistError
+
+
+def make_args(**overrides):
+    """Namespace with the CLI defaults used by the wordlist helpers."""
+    args = argparse.Namespace(wordlist=None, no_wordlist_cache=True, memory=False, prefault=False)
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+
+@pytest.mark.parametrize("memory", [False, True])
+def test_prepare_wordlist_resolves_bundled_default(memory):
+    """The wordlist future yields words, file SHA-256 and display name."""
+    words, file_sha256, name = prepare_wordlist(make_args(memory=memory)).result(timeout=10)
+    
+    assert len(words) == 1296
+    assert file_sha256.startswith("8f5ca830")
+    assert name == "eff_short_wordlist_1.txt (bundled)"
+
+
+def test_prepare_wordlist_reports_errors_through_future():
+    """A bad wordlist surfaces when the result is collected."""
+    future = prepare_wordlist(make_args(wordlist="/nonexistent/words.txt"))
+    
+    with pytest.raises(WordlistError, match="not found"):
+        future.result(timeout=10)
+
+
+def test_prepare_arena_is_off_by_default():
+    """Without --prefault nothing is mapped and release is a no-op."""
+    future = prepare_arena(make_args(), "V1", True)
+    
+    assert future is None
+    release_arena(future)
+
+
+def test_prepare_arena_faults_in_and_releases():
+    """--prefault maps the block matrix up front; release unmaps it."""
+    future = prepare_arena(make_args(prefault=True), "V1", True)
+    arena = future.result(timeout=10)
+    
+    assert arena.capacity >= block_matrix_bytes(ARGON2_TEST_MEMORY_COST, 1)
+    assert derive_master_key("test phrase", test_mode=True, arena=arena) == derive_master_key("test phrase", test_mode=True)
+    release_arena(future)
+    assert arena.capacity == 0
+
+
+@pytest.mark.parametrize("argv", [["--version"], ["--help"], ["--no-such-flag"]])
+def test_trivial_paths_skip_heavy_imports(argv):
+    """--version, --help and argument errors never load argon2, ctypes or hashlib."""
+    src_dir = os.path.dirname(os.path.dirname(vaultphrases.__file__))
+    code = (
+        "import sys\n"
+        "from vaultphrases.cli import main\n"
+        f"sys.argv = ['vaultphrases'] + {argv!r}\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('argon2', 'ctypes', 'hashlib', '_hashlib', 'vaultphrases.derive')\n"
+        "print(sorted(m for m in heavy if m in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=src_dir)
+    
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=30)
+    
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+def test_verify_reports_bad_check_words_list(tmp_path, monkeypatch, capsys):
+    """--verify with an unreadable --check-words list fails cleanly before Argon2."""
+    manifest = str(tmp_path / "manifest.json")
+    save_manifest(manifest, Manifest("V1", True, {"HOT_PHRASE_V1": "0" * 16}))
+    monkeypatch.setattr(cli, "get_root_phrase", lambda: SecureBuffer.from_bytes(b"correct horse"))
+    args = make_args(verify=manifest, check_words=str(tmp_path / "missing.txt"))
+    
+    status = cli.run_verify(args)
+    
+    assert status == 1
+    assert "not found" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("value", ["0", "129", "100000000", "six"])
+def test_words_argument_is_bounded(value):
+    """--words rejects counts outside 1..MAX_WORD_COUNT."""
+    with pytest.raises((argparse.ArgumentTypeError, ValueError)):
+        word_count_arg(value)
+
+
+def test_prepare_wordlist_thread_does_not_block_exit(monkeypatch):
+    """The loader is a daemon thread, so Ctrl-C never waits for a slow list."""
+    release = threading.Event()
+    monkeypatch.setattr(cli, "open_wordlist", lambda args: release.wait(10) and ("words", "sha", "name"))
+    
+    future = prepare_wordlist(make_args())
+    loader = next(t for t in threading.enumerate() if t.name == "vaultphrases-wordlist")
+    
+    assert loader.daemon
+    release.set()
+    assert future.result(timeout=10) == ("words", "sha", "name")
+
+
+def test_precheck_reuses_prepared_wordlist(monkeypatch):
+    """--check-words without a list uses the prepare_wordlist() result."""
+    def fail(args):
+        raise AssertionError("wordlist loaded twice")
+    monkeypatch.setattr(cli, "open_wordlist", fail)
+    prepared = Future()
+    prepared.set_result((["correct", "horse"], "sha", "prepared"))
+    
+    with SecureBuffer.from_bytes(b"correct horse") as phrase:
+        assert precheck_root_phrase(make_args(check_words=""), phrase, prepared)
+
+
+def test_get_root_phrase_rejects_unicode_whitespace(monkeypatch, capsys):
+    """A typed phrase of only U+3000 is reported as empty, not as a buffer error."""
+    typed = "　　".encode("utf-8")
+    
+    def fake_read(buffer, prompt):
+        buffer.view[:len(typed)] = typed
+        return len(typed)
+    
+    monkeypatch.setattr("vaultphrases.terminal.read_secret_into", fake_read)
+    
+    with pytest.raises(SystemExit):
+        cli.get_root_phrase()
+    
+    assert "Root phrase cannot be empty" in capsys.readouterr().out
@@ -1,8 +1,11 @@
 """Tests for derivation logic."""
 
 import pytest
-from vaultphrases.derive import derive_master_key, derive_child_key
+from vaultphrases.derive import derive_master_key, derive_child_key, hkdf_child, derive_children, KeyedPRF, ChildKeyStream
 from vaultphrases.constants import LABEL_HOT, LABEL_COLD
+from vaultphrases.security import SecureBuffer
+from vaultphrases.utils import max_normalised_length, normalise_phrase, normalise_phrase_into
+from argon2 import low_level
 
 
 def test_derive_master_key_deterministic():
@@ -30,6 +33,54 @@ def test_derive_master_key_normalisation():
     assert key1 == key2 == key3
 
 
+@pytest.mark.parametrize("phrase", [
+    "  Correct   Horse\tBattery\nStaple  ",
+    "a\x1cb\x0bc",
+    "   ",
+    "",
+    "İstanbul  ÉCOLE  Ⱥ",
+])
+def test_normalise_phrase_into_matches_normalise_phrase(phrase):
+    """The buffer path writes exactly the UTF-8 of normalise_phrase()."""
+    expected = normalise_phrase(phrase).encode("utf-8")
+    
+    for source in (phrase, phrase.encode("utf-8"), memoryview(bytearray(phrase.encode("utf-8")))):
+        out = bytearray(b"\xff" * (max_normalised_length(source) + 2))
+        length = normalise_phrase_into(source, out)
+        
+        assert out[:length] == expected
+        assert not any(out[length:])
+
+
+def test_normalise_phrase_into_in_place():
+    """ASCII input can be normalised over itself."""
+    buf = bytearray(b"  Correct  HORSE battery ")
+    
+    length = normalise_phrase_into(buf, buf)
+    
+    assert buf[:length] == b"correct horse battery"
+    assert not any(buf[length:])
+    with pytest.raises(ValueError):
+        normalise_phrase_into("abc", bytearray(2))
+
+
+def test_derive_master_key_from_buffer_matches_str():
+    """bytes-like phrases derive the same key as str, including non-ASCII."""
+    for phrase in ("  Correct Horse  Battery Staple ", "Çorrect hörse bättery"):
+        raw = phrase.encode("utf-8")
+        expected = low_level.hash_secret_raw(
+            normalise_phrase(phrase).encode("utf-8"), b"family-password-root-v1",
+            time_cost=1, memory_cost=8 * 1024, parallelism=1, hash_len=32, type=low_level.Type.ID,
+        )
+        
+        with SecureBuffer.from_bytes(raw) as source, SecureBuffer(32) as out:
+            assert derive_master_key(source.view, test_mode=True, out=out) is out
+            assert out == expected
+            assert source.view == raw
+        assert derive_master_key(phrase, test_mode=True) == expected
+        assert derive_master_key(bytearray(raw), test_mode=True) == expected
+
+
 def test_derive_master_key_different_phrases():
     """Different root phrases should produce different keys."""
     key1 = derive_master_key("correct horse battery staple", test_mode=True)
@@ -68,3 +119,72 @@ def test_derive_child_key_independence():
     child2 = derive_child_key(master2, LABEL_HOT)
     
     assert child1 != child2
+
+
+def test_derive_children_matches_hkdf_child():
+    """Batch derivation must be byte-identical to hkdf_child."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    labels = [LABEL_HOT, LABEL_COLD, "ssh", "", "ünïcødé", "x" * 200]
+    
+    children = derive_children(master_key, labels)
+    
+    assert children == [hkdf_child(master_key, label) for label in labels]
+
+
+def test_keyed_prf_reusable_and_truncates():
+    """A KeyedPRF can be reused and honours out_len like hkdf_child."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    prf = KeyedPRF(master_key)
+    
+    assert prf.derive(LABEL_HOT) == prf.derive(LABEL_HOT)
+    assert prf.derive(LABEL_HOT, 16) == hkdf_child(master_key, LABEL_HOT, 16)
+
+
+def test_keyed_prf_long_key():
+    """Keys longer than the SHA-256 block size are hashed first (RFC 2104)."""
+    long_key = bytes(range(100))
+    
+    assert KeyedPRF(long_key).derive(LABEL_HOT) == hkdf_child(long_key, LABEL_HOT)
+
+
+def test_hkdf_child_long_output_extends_prefix():
+    """Outputs longer than 32 bytes keep the 32-byte key as a prefix."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    
+    short = hkdf_child(master_key, LABEL_HOT)
+    long = hkdf_child(master_key, LABEL_HOT, 100)
+    
+    assert len(long) == 100
+    assert long[:32] == short
+    assert derive_children(master_key, [LABEL_HOT], 100) == [long]
+
+
+def test_child_key_stream_sequential_reads():
+    """Sequential reads concatenate to one contiguous stream."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    stream = ChildKeyStream(master_key, LABEL_HOT)
+    
+    parts = [stream.read(n) for n in (5, 40, 1, 50)]
+    
+    assert b"".join(parts) == hkdf_child(master_key, LABEL_HOT, 96)
+
+
+def test_child_key_stream_block_limit():
+    """The stream is bounded by the HKDF limit of 255 blocks."""
+    stream = ChildKeyStream(b"\x01" * 32, LABEL_HOT)
+    
+    with pytest.raises(ValueError):
+        stream.block(255)
+
+
+def test_child_key_stream_clear_keeps_returned_keys():
+    """Keys read from a stream are unchanged after the stream is cleared."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    stream = ChildKeyStream(master_key, LABEL_HOT)
+    key = stream.read(32)
+    block = stream.block(0)
+    
+    stream.clear()
+    
+    assert key == hkdf_child(master_key, LABEL_HOT)
+    assert block == key
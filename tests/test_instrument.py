@@ -0,0 +1,76 @@
+"""Tests for per-stage timing hooks."""
+
+from vaultphrases import instrument
+from vaultphrases.constants import ARGON2_TEST_MEMORY_COST
+from vaultphrases.derive import derive_master_key, hkdf_child
+from vaultphrases.instrument import (
+    add_stage_listener,
+    collect_memory,
+    collect_timings,
+    peak_rss_kib,
+    remove_stage_listener,
+    stage,
+)
+from vaultphrases.wordlist import bytes_to_phrase, fingerprint_wordlist, load_wordlist
+
+
+PHRASE = "correct horse battery staple"
+
+
+def test_stage_is_shared_noop_without_listeners():
+    """Disabled instrumentation allocates nothing per stage."""
+    assert stage("a") is stage("b")
+
+
+def test_collect_timings_reports_pipeline_stages(tmp_path):
+    """Derivation and wordlist stages are reported in order."""
+    path = tmp_path / "words.txt"
+    path.write_text("apple\nbanana\ncherry\n")
+
+    with collect_timings() as timings:
+        words = load_wordlist(str(path))
+        fingerprint_wordlist(words)
+        master_key = derive_master_key(PHRASE, test_mode=True)
+        bytes_to_phrase(hkdf_child(master_key, "ssh"), words, 4)
+
+    names = [name for name, _ in timings]
+    assert names == ["wordlist_load", "wordlist_fingerprint", "normalise", "argon2", "hkdf", "render"]
+    assert all(seconds >= 0 for _, seconds in timings)
+    assert not instrument._listeners
+
+
+def test_listener_sees_names_and_durations_only():
+    """Listeners receive exactly (name, seconds), never key material."""
+    calls = []
+
+    def listener(*args):
+        calls.append(args)
+
+    add_stage_listener(listener)
+    try:
+        derive_master_key(PHRASE, test_mode=True)
+    finally:
+        remove_stage_listener(listener)
+
+    assert [len(call) for call in calls] == [2, 2]
+    assert all(isinstance(name, str) and isinstance(sec, float) for name, sec in calls)
+
+
+def test_collect_memory_reports_argon2_peak():
+    """The Argon2 stage peak covers its C-side memory cost."""
+    with collect_memory() as report:
+        for _ in range(3):
+            derive_master_key(PHRASE, test_mode=True)
+
+    argon2 = [record for record in report.stages if record.name == "argon2"]
+    assert len(argon2) == 3
+    assert report.peak_rss_kib >= max(record.peak_rss_kib for record in argon2)
+    assert argon2[0].peak_rss_kib >= ARGON2_TEST_MEMORY_COST
+    # Repeated derivations leave nothing behind on the Python heap
+    assert argon2[-1].py_delta_bytes < 4096
+    assert not instrument._memory_reports
+
+
+def test_peak_rss_is_available():
+    """Peak RSS is readable on supported platforms."""
+    assert peak_rss_kib() > 0
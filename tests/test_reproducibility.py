@@ -11,8 +11,9 @@ their passphrases from their root phrase.
 
 import pytest
 from vaultphrases.derive import derive_master_key, derive_child_key
-from vaultphrases.constants import LABEL_HOT, LABEL_COLD
-from vaultphrases.wordlist import bytes_to_phrase
+from vaultphrases.constants import LABEL_HOT, LABEL_COLD, SCHEME_V1, SCHEME_V2
+from vaultphrases.derive import ChildKeyStream
+from vaultphrases.wordlist import bytes_to_phrase, blocks_to_phrase, iter_word_indices
 
 
 # =============================================================================
@@ -33,6 +34,20 @@ TEST_VECTOR_COLD_KEY_HEX = "178162974c67758635c64ecf9cc0580d70efd821d3b6592c82df
 # COLD key:   cd0a663d6be86e0c839dab533f222179990c11b1f6ced81aaf40f484134ce7af
 # =============================================================================
 
+# =============================================================================
+# FROZEN TEST VECTORS - SCHEME V2 (multi-lane Argon2id) - DO NOT MODIFY
+# =============================================================================
+# Test mode vectors (8 MiB, 1 iteration, 4 lanes):
+TEST_VECTOR_V2_MASTER_KEY_HEX = "1d756ee327a01104c3b3864258a43792d974213e75d64e83b7c5962d98547adb"
+TEST_VECTOR_V2_HOT_KEY_HEX = "77544c9c69c4c713f57743aa1d7e9ea94fe35b93897b682e29a29dc860374e69"
+TEST_VECTOR_V2_COLD_KEY_HEX = "feecd820cc2dedaffb2956a26dffa5ce86f5b4d0b3248544722b260773b092d3"
+
+# Production mode vectors (512 MiB, 3 iterations, 4 lanes):
+# Master key: 33c6aaa0dec88188124ab9a773a24fb5a9d6c90a8b0ae8fe5844d508faee99ab
+# HOT key:    bd3c22544c69cfea9417e980c48dba6d14267b480690df9eaa67591e250bab74
+# COLD key:   d8e8dc5be9744dc4d112241e4d681fa8f67d6c7685f1c8097e4fa440aae7b925
+# =============================================================================
+
 
 def test_master_key_reproducibility():
     """Test that master key derivation is reproducible."""
@@ -205,3 +220,88 @@ def test_bytes_to_phrase_stability():
     # Should always produce the same phrase (frozen from v0.1.0)
     expected = "delta-charlie-alpha-golf-foxtrot-echo"
     assert phrase == expected, f"Phrase mismatch! Expected {expected}, got {phrase}"
+
+
+def test_default_scheme_is_v1():
+    """The default scheme must remain V1 so existing users are unaffected."""
+    default_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True)
+    v1_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True, scheme=SCHEME_V1)
+    
+    assert default_key == v1_key
+    assert default_key.hex() == TEST_VECTOR_MASTER_KEY_HEX
+
+
+def test_v2_cross_run_stability():
+    """
+    Test that scheme V2 outputs remain stable across runs.
+    
+    CRITICAL: If this fails, scheme V2 has changed and backward
+    compatibility is BROKEN for V2 users.
+    """
+    master_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True, scheme=SCHEME_V2)
+    hot_key = derive_child_key(master_key, LABEL_HOT)
+    cold_key = derive_child_key(master_key, LABEL_COLD)
+    
+    assert master_key.hex() == TEST_VECTOR_V2_MASTER_KEY_HEX, \
+        f"V2 master key mismatch! Expected {TEST_VECTOR_V2_MASTER_KEY_HEX}, got {master_key.hex()}"
+    assert hot_key.hex() == TEST_VECTOR_V2_HOT_KEY_HEX, \
+        f"V2 HOT key mismatch! Expected {TEST_VECTOR_V2_HOT_KEY_HEX}, got {hot_key.hex()}"
+    assert cold_key.hex() == TEST_VECTOR_V2_COLD_KEY_HEX, \
+        f"V2 COLD key mismatch! Expected {TEST_VECTOR_V2_COLD_KEY_HEX}, got {cold_key.hex()}"
+
+
+def test_v2_production_mode_stability():
+    """
+    Test scheme V2 production mode stability with frozen vectors.
+    
+    NOTE: This test is slow (512 MiB, 4 lanes) and needs ~600 MiB of RAM.
+    """
+    PROD_V2_MASTER_KEY_HEX = "33c6aaa0dec88188124ab9a773a24fb5a9d6c90a8b0ae8fe5844d508faee99ab"
+    PROD_V2_HOT_KEY_HEX = "bd3c22544c69cfea9417e980c48dba6d14267b480690df9eaa67591e250bab74"
+    PROD_V2_COLD_KEY_HEX = "d8e8dc5be9744dc4d112241e4d681fa8f67d6c7685f1c8097e4fa440aae7b925"
+    
+    master_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=False, scheme=SCHEME_V2)
+    
+    assert master_key.hex() == PROD_V2_MASTER_KEY_HEX
+    assert derive_child_key(master_key, LABEL_HOT).hex() == PROD_V2_HOT_KEY_HEX
+    assert derive_child_key(master_key, LABEL_COLD).hex() == PROD_V2_COLD_KEY_HEX
+
+
+def test_unknown_scheme_rejected():
+    """Unknown schemes must fail loudly rather than fall back silently."""
+    with pytest.raises(ValueError, match="Unknown derivation scheme"):
+        derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True, scheme="V0")
+
+
+def test_child_key_stream_stability():
+    """
+    Frozen vectors for expanded child key output.
+    
+    Block 1 must equal the V1 HOT key; later blocks are frozen as well.
+    """
+    master_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True)
+    stream = ChildKeyStream(master_key, LABEL_HOT)
+    
+    assert stream.block(0).hex() == TEST_VECTOR_HOT_KEY_HEX
+    assert stream.block(1).hex() == "f85749b200a98e9d8e242dc5b46ab326d0f1b9d8812c4ff4c259baf96d464f79"
+    assert stream.block(2).hex() == "57673974e9b857a8da0ea62189a73b520323844ab5fa56ac35621ed822ee1ffe"
+
+
+def test_long_phrase_stability():
+    """Word indices past the first 256 bits are frozen too."""
+    master_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True)
+    indices = iter_word_indices(ChildKeyStream(master_key, LABEL_HOT), 8)
+    
+    tail = [next(indices) for _ in range(100)][80:]
+    
+    assert tail == [7, 4, 3, 3, 4, 1, 7, 5, 7, 4, 4, 1, 2, 5, 5, 5, 4, 7, 5, 6]
+
+
+def test_streamed_phrase_matches_v1_phrase():
+    """Phrases within the first key's entropy are unchanged by streaming."""
+    wordlist = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+    master_key = derive_master_key(TEST_VECTOR_ROOT_PHRASE, test_mode=True)
+    
+    phrase = blocks_to_phrase(ChildKeyStream(master_key, LABEL_HOT), wordlist, 6, "-")
+    
+    assert phrase == "delta-charlie-alpha-golf-foxtrot-echo"
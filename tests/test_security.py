@@ -0,0 +1,107 @@
+"""Tests for secure memory handling."""
+
+import pytest
+from vaultphrases.constants import LABEL_HOT
+from vaultphrases.derive import derive_master_key, hkdf_child, KeyedPRF
+from vaultphrases.security import SecureBuffer, secure_clear_bytes, secure_clear_string
+
+
+def test_secure_buffer_roundtrip_and_clear():
+    """Contents can be written, compared and zeroed in bulk."""
+    buf = SecureBuffer.from_bytes(b"\x01" * 40)
+    
+    assert len(buf) == 40
+    assert buf == b"\x01" * 40
+    buf.clear()
+    assert buf == bytes(40)
+    buf.close()
+
+
+def test_secure_buffer_close_is_idempotent():
+    """Closing wipes the buffer and can be repeated."""
+    with SecureBuffer(32) as buf:
+        buf.view[:] = b"\xff" * 32
+    
+    assert buf.closed
+    buf.close()
+    with pytest.raises(ValueError):
+        buf.view
+
+
+def test_secure_buffer_huge_pages_populated():
+    """A huge-page buffer is rounded to whole 2 MiB pages and starts zeroed."""
+    with SecureBuffer(3 * 1024 * 1024, huge_pages=True, populate=True) as buf:
+        buf.view[-1:] = b"\x01"
+        
+        assert len(buf) == 3 * 1024 * 1024
+        assert buf._capacity == 4 * 1024 * 1024
+        assert buf.view[:4096] == bytes(4096)
+        assert buf.view[-1] == 1
+
+
+def test_derive_master_key_into_secure_buffer():
+    """Deriving into a SecureBuffer gives the same key as the bytes path."""
+    expected = derive_master_key("test phrase", test_mode=True)
+    
+    with SecureBuffer(32) as key:
+        result = derive_master_key("test phrase", test_mode=True, out=key)
+        
+        assert result is key
+        assert key == expected
+        assert hkdf_child(key, LABEL_HOT) == hkdf_child(expected, LABEL_HOT)
+        assert KeyedPRF(key).derive(LABEL_HOT) == hkdf_child(expected, LABEL_HOT)
+
+
+def test_hkdf_child_into_secure_buffer():
+    """Child keys can be written straight into a SecureBuffer."""
+    master_key = derive_master_key("test phrase", test_mode=True)
+    
+    with SecureBuffer(32) as child:
+        hkdf_child(master_key, LABEL_HOT, out=child)
+        
+        assert child == hkdf_child(master_key, LABEL_HOT)
+
+
+def test_secure_clear_bytes_mutable():
+    """Mutable buffers are zeroed in place."""
+    data = bytearray(b"secret material")
+    view = memoryview(bytearray(b"more secret"))
+    
+    secure_clear_bytes(data)
+    secure_clear_bytes(view)
+    
+    assert data == bytearray(len(data))
+    assert view.tobytes() == bytes(len(view))
+
+
+def test_secure_clear_string_keeps_object_valid():
+    """Clearing a string zeroes its characters but not its header."""
+    secret = "".join(["correct ", "horse ", "battery"])
+    
+    secure_clear_string(secret)
+    
+    assert len(secret) == len("correct horse battery")
+    assert set(secret) == {"\x00"}
+
+
+def test_secure_clear_string_skips_shared_strings():
+    """A string referenced elsewhere is left alone rather than corrupted."""
+    secret = "".join(["correct ", "horse ", "battery"])
+    shared = [secret]
+    
+    secure_clear_string(secret)
+    
+    assert shared[0] == "correct horse battery"
+
+
+def test_secure_clear_bytes_skips_shared_bytes():
+    """Bytes referenced elsewhere are left alone; owned bytes are zeroed."""
+    owned = b"".join([b"secret ", b"material"])
+    shared = b"".join([b"shared ", b"material"])
+    keep = [shared]
+    
+    secure_clear_bytes(owned)
+    secure_clear_bytes(shared)
+    
+    assert owned == bytes(len(owned))
+    assert keep[0] == b"shared material"
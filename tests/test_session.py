@@ -0,0 +1,76 @@
+"""Tests for the interactive session."""
+
+import time
+
+import pytest
+from vaultphrases.derive import ChildKeyStream
+from vaultphrases.security import SecureBuffer
+from vaultphrases.session import Session
+from vaultphrases.wordlist import blocks_to_phrase
+
+
+MASTER_KEY = bytes(range(32))
+WORDS = [f"w{i}" for i in range(1296)]
+
+
+def scripted(lines):
+    """Return a read() that replays lines, then signals end of input."""
+    lines = iter(lines)
+
+    def read(prompt):
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError
+    return read
+
+
+def test_session_renders_same_phrases_as_one_shot():
+    """Session phrases match the single-label CLI derivation."""
+    out = []
+    session = Session(SecureBuffer.from_bytes(MASTER_KEY), WORDS)
+    
+    reason = session.run(scripted(["ssh", ":words 8", "gpg"]), out.append)
+    
+    assert reason == "eof"
+    assert out[0] == blocks_to_phrase(ChildKeyStream(MASTER_KEY, "ssh"), WORDS, 6, "-")
+    assert out[2] == blocks_to_phrase(ChildKeyStream(MASTER_KEY, "gpg"), WORDS, 8, "-")
+    assert session.closed
+
+
+def test_session_completes_from_label_history():
+    """Tab completion offers labels used earlier in the session."""
+    with Session(SecureBuffer.from_bytes(MASTER_KEY), WORDS) as session:
+        session.phrase("ssh-work")
+        session.phrase("ssh-home")
+        
+        assert [session.complete("ssh", i) for i in range(3)] == ["ssh-work", "ssh-home", None]
+
+
+def test_session_wipes_key_on_idle_timeout():
+    """An idle prompt times out and zeroizes the master key."""
+    master_key = SecureBuffer.from_bytes(MASTER_KEY)
+    session = Session(master_key, WORDS, idle_timeout=1)
+
+    def stalled(prompt):
+        time.sleep(5)
+        return "ssh"
+    
+    start = time.monotonic()
+    reason = session.run(stalled, lambda text: None)
+    
+    assert reason == "timeout"
+    assert time.monotonic() - start < 4
+    assert master_key.closed
+    with pytest.raises(ValueError):
+        session.phrase("ssh")
+
+
+@pytest.mark.parametrize("command", [":words 0", ":words 100000000", ":words many"])
+def test_session_rejects_out_of_range_word_counts(command):
+    """:words only accepts 1..MAX_WORD_COUNT, so a huge count cannot hang the REPL."""
+    with Session(SecureBuffer.from_bytes(MASTER_KEY), WORDS) as session:
+        output = session.handle(command)
+        
+        assert output.startswith("usage:")
+        assert session.word_count == 6
@@ -0,0 +1,99 @@
+"""Tests for the raw terminal reader."""
+
+import os
+
+import pytest
+from vaultphrases.security import SecureBuffer
+from vaultphrases.terminal import TerminalInputError, read_line_into, read_secret_into
+
+termios = pytest.importorskip("termios")
+
+
+def read_keys(keys, size=64):
+    """Feed keystrokes through a pipe into a fresh buffer."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, keys)
+    os.close(write_fd)
+    buf = bytearray(size)
+    try:
+        length = read_line_into(read_fd, memoryview(buf))
+    finally:
+        os.close(read_fd)
+    return buf, length
+
+
+def test_read_line_into_edits_in_place():
+    """Backspace removes whole UTF-8 characters, Ctrl-U clears the line."""
+    buf, length = read_keys("junk\x15Hé\x7fe\tllo\r".encode("utf-8"))
+    
+    assert buf[:length] == b"He\tllo"
+    assert not any(buf[length:])
+
+
+def test_read_line_into_drops_cursor_keys():
+    """Arrow and Delete keys are dropped whole, not typed as '[A' or '[3~'."""
+    buf, length = read_keys(b"ab\x1b[Ac\x1b[3~d\x1bOBe\x1b[1;5Cf\r")
+    
+    assert buf[:length] == b"abcdef"
+    assert not any(buf[length:])
+
+
+def test_read_line_into_refuses_bare_escape():
+    """A bare Escape (or Alt chord) aborts instead of guessing."""
+    with pytest.raises(TerminalInputError):
+        read_keys(b"ab\x1bx\r")
+
+
+def test_read_line_into_refuses_overflow():
+    """A line longer than the buffer is an error, not a truncated phrase."""
+    with pytest.raises(TerminalInputError):
+        read_keys(b"abcdefgh\n", size=4)
+    buf, length = read_keys(b"abc\n", size=4)
+    
+    assert buf[:length] == b"abc"
+    assert buf[3] == 0
+
+
+def test_read_line_into_interrupt_wipes_buffer():
+    """Ctrl-C raises KeyboardInterrupt with nothing left in the buffer."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"secret\x03")
+    buf = bytearray(16)
+    
+    with pytest.raises(KeyboardInterrupt):
+        read_line_into(read_fd, memoryview(buf))
+    os.close(read_fd)
+    os.close(write_fd)
+    
+    assert not any(buf)
+
+
+def test_read_line_into_eof():
+    """Ctrl-D or end of input on an empty line is EOFError."""
+    with pytest.raises(EOFError):
+        read_keys(b"\x04")
+    with pytest.raises(EOFError):
+        read_keys(b"")
+    assert read_keys(b"ab")[1] == 2
+
+
+def test_read_secret_into_restores_terminal():
+    """A pty is read without echo and its settings are restored."""
+    master, slave = os.openpty()
+    path = os.ttyname(slave)
+    before = termios.tcgetattr(slave)
+    os.write(master, b"Correct Horse\r")
+    
+    with SecureBuffer(64) as buf:
+        length = read_secret_into(buf, "> ", tty_path=path)
+        
+        assert buf.view[:length] == b"Correct Horse"
+    assert termios.tcgetattr(slave) == before
+    os.close(master)
+    os.close(slave)
+
+
+def test_read_secret_into_without_terminal():
+    """No terminal means None, so the caller can fall back to getpass."""
+    with SecureBuffer(16) as buf:
+        assert read_secret_into(buf, tty_path="/nonexistent/tty") is None
@@ -0,0 +1,80 @@
+"""Tests for hierarchical label derivation."""
+
+import hmac
+import hashlib
+
+import pytest
+from vaultphrases.derive import hkdf_child
+from vaultphrases.tree import LabelTree, split_label_path
+from vaultphrases.wordlist import blocks_to_phrase
+
+
+MASTER_KEY = bytes(range(32))
+
+
+def test_single_segment_matches_flat_label():
+    """A one-segment path is the same key as the flat label."""
+    tree = LabelTree(MASTER_KEY)
+    
+    assert tree.derive("ssh") == hkdf_child(MASTER_KEY, "ssh")
+
+
+def test_path_chains_parent_keys():
+    """Each segment is derived from its parent's key."""
+    work = hmac.new(MASTER_KEY, b"work", hashlib.sha256).digest()
+    ssh = hmac.new(work, b"ssh", hashlib.sha256).digest()
+    host = hmac.new(ssh, b"host42", hashlib.sha256).digest()
+    
+    assert LabelTree(MASTER_KEY).derive("work/ssh/host42") == host
+
+
+def test_subtree_memoizes_interior_nodes_once():
+    """Many leaves under one prefix memoize only the interior nodes."""
+    tree = LabelTree(MASTER_KEY)
+    paths = [f"work/ssh/host{i}" for i in range(1000)]
+    
+    keys = tree.derive_many(paths)
+    
+    assert len(tree) == 2
+    assert keys[7] == LabelTree(MASTER_KEY).derive("work/ssh/host7")
+    assert len(set(keys)) == len(keys)
+
+
+def test_eviction_zeroizes_keys():
+    """Evicted interior keys are wiped."""
+    tree = LabelTree(MASTER_KEY, max_nodes=1)
+    tree.derive("a/x")
+    evicted_key, _ = tree._memo[("a",)]
+    
+    tree.derive("b/x")
+    
+    assert len(tree) == 1
+    assert evicted_key == bytearray(32)
+
+
+def test_stream_starts_with_leaf_key():
+    """The phrase stream for a path starts with the path key."""
+    tree = LabelTree(MASTER_KEY)
+    words = [f"w{i}" for i in range(1296)]
+    
+    assert tree.stream("work/gpg").block(0) == tree.derive("work/gpg")
+    assert len(blocks_to_phrase(tree.stream("work/gpg"), words, 30).split("-")) == 30
+
+
+@pytest.mark.parametrize("path", ["", "/ssh", "work/", "work//ssh"])
+def test_invalid_paths_rejected(path):
+    """Empty segments are ambiguous and rejected."""
+    with pytest.raises(ValueError):
+        split_label_path(path)
+
+
+def test_eviction_clears_node_prf():
+    """Evicted nodes drop their HMAC states, not just the key bytes."""
+    tree = LabelTree(MASTER_KEY, max_nodes=1)
+    stream = tree.stream("a/leaf")
+    stream.block(0)
+    
+    tree.derive("b/leaf")
+    
+    with pytest.raises(ValueError, match="cleared"):
+        stream.block(1)
@@ -0,0 +1,75 @@
+"""Tests for check code verification."""
+
+import hmac
+import hashlib
+import json
+import os
+
+import pytest
+from vaultphrases.derive import hkdf_child
+from vaultphrases.verify import (
+    Manifest,
+    ManifestError,
+    check_code,
+    compute_check_codes,
+    load_manifest,
+    save_manifest,
+    verify_check_codes,
+)
+
+
+MASTER_KEY = bytes(range(32))
+
+
+def test_check_code_is_truncated_hmac_of_child_key():
+    """A check code tags the child key, not the master key."""
+    child = hkdf_child(MASTER_KEY, "ssh")
+    expected = hmac.new(child, b"vaultphrases-check-v1", hashlib.sha256).hexdigest()[:16]
+    
+    assert compute_check_codes(MASTER_KEY, ["ssh"]) == {"ssh": expected}
+    assert check_code(child) == expected
+
+
+def test_verify_reports_each_label():
+    """Matching labels pass and tampered codes fail."""
+    codes = compute_check_codes(MASTER_KEY, ["HOT_PHRASE_V1", "COLD_PHRASE_V1", "ssh"])
+    codes["ssh"] = "0" * 16
+    
+    results = verify_check_codes(MASTER_KEY, codes)
+    
+    assert results == {"HOT_PHRASE_V1": True, "COLD_PHRASE_V1": True, "ssh": False}
+    assert not any(verify_check_codes(bytes(32), codes).values())
+
+
+def test_manifest_round_trip(tmp_path):
+    """Manifests are written privately and read back unchanged."""
+    path = str(tmp_path / "manifest.json")
+    manifest = Manifest("V2", True, compute_check_codes(MASTER_KEY, ["a", "b"]))
+    
+    save_manifest(path, manifest)
+    
+    assert load_manifest(path) == manifest
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize("code", ["abc", "é" * 16, "3F9C0B1E5A7D2C48", "3f9c0b1e5a7d2c4g", 12])
+def test_manifest_rejects_malformed_codes(tmp_path, code):
+    """Only 16 lowercase hex digits are accepted as a check code."""
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"version": 1, "scheme": "V1", "codes": {"ssh": code}}))
+    
+    with pytest.raises(ManifestError, match="Malformed"):
+        load_manifest(str(path))
+
+
+def test_save_manifest_tightens_existing_file(tmp_path):
+    """Overwriting a world-readable manifest leaves it mode 0600."""
+    path = tmp_path / "manifest.json"
+    path.write_text("{}")
+    path.chmod(0o644)
+    
+    save_manifest(str(path), Manifest("V1", False, compute_check_codes(MASTER_KEY, ["a"])))
+    
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert load_manifest(str(path)).codes.keys() == {"a"}
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
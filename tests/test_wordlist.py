@@ -1,9 +1,23 @@
 """Tests for wordlist functionality."""
 
+import hashlib
+import os
 import pytest
 import tempfile
 from pathlib import Path
-from vaultphrases.wordlist import load_wordlist, WordlistError, get_default_wordlist_path
+from vaultphrases.wordlist import load_wordlist, WordlistError, get_default_wordlist_path, bytes_to_phrase, blocks_to_phrase
+from vaultphrases.utils import phrase_counts, tokenize_phrase
+from vaultphrases.wordlist import (
+    BUNDLED_WORDLISTS,
+    Wordlist,
+    bundled_wordlist_path,
+    check_phrase_words,
+    load_bundled_wordlist,
+)
+from vaultphrases.wordlist import CompiledWordlist, compile_wordlist, fingerprint_wordlist, ingest_wordlist, load_wordlist_cached, print_wordlist_info
+from vaultphrases.derive import ChildKeyStream, hkdf_child
+from vaultphrases import wordlist as wordlist_module
+from vaultphrases.constants import BUNDLED_WORDLIST_NAMES
 
 
 def test_load_wordlist_valid():
@@ -76,6 +90,268 @@ def test_load_wordlist_empty():
 
 
 def test_get_default_wordlist_path():
-    """Test getting default wordlist path (should be None - user must provide)."""
+    """The default wordlist is the bundled EFF short list."""
     path = get_default_wordlist_path()
-    assert path is None, "Default wordlist path should be None - users must provide their own wordlist"
+    
+    words = load_wordlist(path)
+    
+    assert isinstance(words, CompiledWordlist)
+    assert len(words) == 1296
+    assert (words[0], words[-1]) == ("acid", "zoom")
+
+
+@pytest.mark.parametrize("name", sorted(BUNDLED_WORDLISTS))
+def test_bundled_wordlist_metadata_matches_file(name):
+    """Precomputed metadata agrees with the compiled file and its contents."""
+    info = BUNDLED_WORDLISTS[name]
+    
+    with load_bundled_wordlist(name) as words:
+        assert len(words) == info.word_count
+        assert words.file_sha256 == info.file_sha256
+        assert words.fingerprint_digest == info.fingerprint_digest
+        assert words.verify()
+        assert len(set(words)) == info.word_count
+
+
+def test_bundled_wordlist_path_outlives_the_call():
+    """The returned path stays a readable file and is resolved only once."""
+    path = bundled_wordlist_path("eff_short")
+    
+    again = bundled_wordlist_path("eff_short")
+    
+    assert again == path
+    assert os.path.isfile(path)
+
+
+def test_bundled_wordlist_names_match_constants():
+    """The CLI help lists bundled names from constants without importing wordlist."""
+    assert tuple(BUNDLED_WORDLISTS) == BUNDLED_WORDLIST_NAMES
+
+
+def test_long_phrase_does_not_exhaust_entropy():
+    """Phrases beyond 256 bits keep drawing fresh words from the stream."""
+    words = [f"w{i}" for i in range(1296)]
+    stream_phrase = blocks_to_phrase(ChildKeyStream(b"\x07" * 32, "long"), words, 60, "-").split("-")
+    single_phrase = bytes_to_phrase(hkdf_child(b"\x07" * 32, "long"), words, 60, "-").split("-")
+    
+    # A single key runs dry after ~24 words and degenerates to words[0]
+    assert single_phrase[-10:] == ["w0"] * 10
+    assert stream_phrase[:24] == single_phrase[:24]
+    assert len(set(stream_phrase[30:])) > 20
+
+
+def _write_eff(path, words):
+    """Write words in EFF format (dice number, tab, word)."""
+    path.write_text("".join(f"{11111 + i}\t{word}\n" for i, word in enumerate(words)), encoding="utf-8")
+
+
+def test_compiled_wordlist_round_trip(tmp_path):
+    """A compiled list indexes, fingerprints and compares like the text list."""
+    source = tmp_path / "words.txt"
+    _write_eff(source, ["apple", "banana", "cherry", "dátil"])
+    
+    compiled = load_wordlist(compile_wordlist(source))
+    text = load_wordlist(str(source))
+    
+    assert isinstance(compiled, CompiledWordlist)
+    assert compiled == text
+    assert (compiled[0], compiled[-1], compiled[1:3]) == ("apple", "dátil", ["banana", "cherry"])
+    assert fingerprint_wordlist(compiled) == fingerprint_wordlist(text)
+    assert compiled.file_sha256 == hashlib.sha256(source.read_bytes()).hexdigest()
+    assert compiled.verify()
+    assert bytes_to_phrase(b"\x42" * 32, compiled, 6) == bytes_to_phrase(b"\x42" * 32, text, 6)
+    compiled.close()
+
+
+def test_compiled_wordlist_rejects_truncated_file(tmp_path):
+    """A partial compiled file is refused rather than misread."""
+    source = tmp_path / "words.txt"
+    _write_eff(source, ["apple", "banana", "cherry"])
+    output = Path(compile_wordlist(source))
+    output.write_bytes(output.read_bytes()[:-3])
+    
+    with pytest.raises(WordlistError, match="truncated"):
+        CompiledWordlist(output)
+
+
+@pytest.mark.parametrize("region", ["blob", "offsets"])
+def test_compiled_wordlist_verify_detects_corrupt_words(tmp_path, region):
+    """A corrupted word blob or offset table fails verify() and is not recompiled."""
+    source = tmp_path / "words.txt"
+    _write_eff(source, ["apple", "banana", "cherry"])
+    output = Path(compile_wordlist(source))
+    data = bytearray(output.read_bytes())
+    # Last blob byte, or the low byte of offsets[1] (after the 128-byte header)
+    position = len(data) - 1 if region == "blob" else 128 + 4
+    data[position] ^= 0x01
+    output.write_bytes(bytes(data))
+    
+    with CompiledWordlist(output) as compiled:
+        assert not compiled.verify()
+    with pytest.raises(WordlistError, match="corrupt"):
+        compile_wordlist(output, tmp_path / "copy.vpwl")
+
+
+def test_cached_wordlist_hit_does_not_read_source(tmp_path, monkeypatch):
+    """A cache hit is decided from mtime and size without re-hashing the source."""
+    source = tmp_path / "words.txt"
+    cache = tmp_path / "cache"
+    _write_eff(source, ["apple", "banana", "cherry"])
+    load_wordlist_cached(str(source), cache).close()
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("source was re-read on a cache hit")
+    
+    monkeypatch.setattr(wordlist_module, "ingest_wordlist", fail)
+    monkeypatch.setattr(wordlist_module, "compile_wordlist", fail)
+    words = load_wordlist_cached(str(source), cache)
+    
+    assert words == ["apple", "banana", "cherry"]
+    words.close()
+
+
+def test_cached_wordlist_rebuilds_when_source_changes(tmp_path):
+    """The cache is reused until the source's mtime or size changes."""
+    source = tmp_path / "words.txt"
+    cache = tmp_path / "cache"
+    _write_eff(source, ["apple", "banana", "cherry"])
+    
+    first = load_wordlist_cached(str(source), cache)
+    again = load_wordlist_cached(str(source), cache)
+    _write_eff(source, ["apple", "banana", "cherry", "damson"])
+    changed = load_wordlist_cached(str(source), cache)
+    
+    assert isinstance(first, CompiledWordlist)
+    assert again == ["apple", "banana", "cherry"]
+    assert len(list(cache.iterdir())) == 1
+    assert changed[-1] == "damson"
+
+
+def test_ingest_hashes_file_and_words_in_one_pass(tmp_path):
+    """Ingest returns the raw file SHA-256 and the canonical fingerprint."""
+    source = tmp_path / "words.txt"
+    raw = b"# comment\r\n11111\tapple\r\n\r\n11112\tbanana\r\n" + b"".join(b"w%d\n" % i for i in range(5000))
+    source.write_bytes(raw)
+    
+    ingest = ingest_wordlist(str(source))
+    
+    assert ingest.words == load_wordlist(str(source))
+    assert ingest.words[:2] == ["apple", "banana"]
+    assert ingest.file_sha256 == hashlib.sha256(raw).hexdigest()
+    assert fingerprint_wordlist(ingest) == fingerprint_wordlist(ingest.words)
+
+
+def test_wordlist_phrase_to_int_inverts_bytes_to_phrase():
+    """Decoding a rendered phrase recovers the integer it was drawn from."""
+    wordlist = Wordlist(f"w{i}" for i in range(1296))
+    raw = hkdf_child(b"\x07" * 32, "decode")
+    
+    phrase = bytes_to_phrase(raw, wordlist, 8)
+    
+    assert wordlist.phrase_to_int(phrase) == int.from_bytes(raw, "big") % 1296 ** 8
+    assert [wordlist[i] for i in wordlist.phrase_to_indices(phrase)] == phrase.split("-")
+
+
+def test_eff_large_phrases_with_hyphenated_words_round_trip():
+    """Words containing the delimiter (t-shirt, yo-yo) decode as one word."""
+    wordlist = Wordlist(load_bundled_wordlist("eff_large"))
+    digits = [wordlist.index[w] for w in ("drop-down", "felt-tip", "t-shirt", "yo-yo")] + [0, wordlist.base - 1]
+    value = sum(d * wordlist.base ** k for k, d in enumerate(digits))
+    raws = [value.to_bytes(32, "big")] + [hkdf_child(b"\x07" * 32, f"decode-{n}") for n in range(2000)]
+    
+    decoded = [wordlist.phrase_to_int(bytes_to_phrase(raw, wordlist, 6)) for raw in raws]
+    
+    assert decoded == [int.from_bytes(raw, "big") % wordlist.base ** 6 for raw in raws]
+
+
+def test_wordlist_is_immutable_and_fingerprinted():
+    """Wordlist rejects mutation and matches fingerprint_wordlist()."""
+    words = ["apple", "banana", "cherry"]
+    wordlist = Wordlist(words)
+    
+    with pytest.raises(AttributeError):
+        wordlist.extra = 1
+    with pytest.raises(TypeError):
+        wordlist.index["durian"] = 3
+    assert wordlist.base == 3
+    assert wordlist.fingerprint == fingerprint_wordlist(words) == fingerprint_wordlist(wordlist)
+
+
+def test_wordlist_decode_errors_do_not_leak_words():
+    """Unknown words are reported by position only."""
+    wordlist = Wordlist(["apple", "banana", "cherry"])
+    
+    with pytest.raises(WordlistError) as excinfo:
+        wordlist.phrase_to_indices("apple-secretword-cherry")
+    
+    assert "secretword" not in str(excinfo.value)
+    assert "Word 2" in str(excinfo.value)
+
+
+def test_tokenize_phrase_uses_most_splitting_separator():
+    """Root phrases split on whitespace, '-', '_' or ',' like the strength check."""
+    assert tokenize_phrase("  correct horse  battery ") == ["correct", "horse", "battery"]
+    assert tokenize_phrase("correct-horse-battery staple") == ["correct", "horse", "battery staple"]
+    assert tokenize_phrase("a_b_c") == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("phrase", [
+    "  correct horse  battery ",
+    "correct-horse-battery staple",
+    "a_b_c,d",
+    "héllo wörld",
+    " \t ",
+])
+def test_phrase_counts_match_tokenize_phrase(phrase):
+    """Byte-level counts agree with the str strength check."""
+    stripped = phrase.strip()
+    expected = (len(tokenize_phrase(phrase)), len(stripped)) if stripped else (0, 0)
+    
+    assert phrase_counts(phrase.encode("utf-8")) == expected
+
+
+def test_check_phrase_words_flags_typos_with_suggestions():
+    """Unknown words are reported by position with nearest matches."""
+    wordlist = Wordlist(["battery", "correct", "horse", "staple", "stable"])
+    
+    unknown = check_phrase_words("Correct horse batery staple", wordlist)
+    
+    assert [(entry.position, entry.token) for entry in unknown] == [(3, "batery")]
+    assert unknown[0].suggestions[0] == "battery"
+    assert check_phrase_words("correct-horse-battery-staple", wordlist) == []
+
+
+def test_check_phrase_words_splits_mixed_separators():
+    """Mixed separators still give single words; 't-shirt' stays one word."""
+    wordlist = Wordlist(["battery", "correct", "horse", "staple", "t-shirt"])
+    
+    assert check_phrase_words("correct-horse-battery staple", wordlist) == []
+    assert check_phrase_words("Correct, T-Shirt_horse", wordlist) == []
+    unknown = check_phrase_words("correct-horse t-shurt staple", wordlist)
+    
+    assert [(entry.position, entry.token) for entry in unknown] == [(3, "t"), (4, "shurt")]
+
+
+def test_print_wordlist_info_labels_both_digests(tmp_path, capsys):
+    """The file hash and the word fingerprint are labelled separately."""
+    source = tmp_path / "words.txt"
+    _write_eff(source, ["apple", "banana", "cherry"])
+    words = load_wordlist(str(source))
+    
+    print_wordlist_info(str(source), words)
+    
+    out = capsys.readouterr().out
+    file_sha256 = hashlib.sha256(source.read_bytes()).hexdigest()
+    assert f"File SHA-256: {file_sha256[:6]}...{file_sha256[-6:]}" in out
+    assert f"Fingerprint: {fingerprint_wordlist(words)}" in out
+
+
+@pytest.mark.parametrize("word_count", [1, 6, 30])
+def test_bytes_to_phrase_matches_single_block_stream(word_count):
+    """The direct single-key loop renders what blocks_to_phrase() does."""
+    words = [f"word{n}" for n in range(7776)]
+    raw = bytes(range(1, 33))
+    
+    phrase = bytes_to_phrase(raw, words, word_count)
+    
+    assert phrase == blocks_to_phrase([raw], words, word_count)